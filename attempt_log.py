@@ -0,0 +1,126 @@
+from array import array
+from datetime import datetime
+
+
+# --- Felder eines Versuchs im Array: Note, Tag (date.toordinal()), Bestanden (0/1) ---
+MARK, DAY, PASSED = 0, 1, 2
+STRIDE = 3
+
+
+class AttemptLog:
+    """
+    Kompaktes Protokoll aller Prüfungsversuche eines Moduls.
+
+    Note, Tag und Bestanden liegen als Datensätze fester Breite in einem einzigen
+    array.array("d") statt als Liste von ExamResult-Objekten; ein Array statt drei
+    spart pro Modul rund zwei Drittel des Speichers. Bester, letzter und
+    bestandener Versuch werden beim Anhängen nachgeführt und stehen in O(1) bereit.
+    Datumswerte werden als Tag gespeichert (Uhrzeit entfällt), wie sie auch in den
+    CSV-Dateien stehen.
+    """
+    __slots__ = ("_data", "_best", "_latest", "_best_passed")
+
+    def __init__(self, attempts=()):
+        """
+        Args:
+            attempts (iterable, optional): Versuche als Tupel (Note, Datum, Bestanden) in zeitlicher Reihenfolge.
+        """
+        self._data = array("d")
+        self._best = None
+        self._latest = None
+        self._best_passed = None
+        for mark, date, passed in attempts:
+            self.append(mark, date, passed)
+
+    def __len__(self):
+        return len(self._data) // STRIDE
+
+    def append(self, mark, date, passed):
+        """
+        Hängt einen Versuch an und führt die Verweise auf besten, letzten und bestandenen Versuch nach.
+
+        Ein Versuch mit demselben Datum wie der letzte gilt als Korrektur und ersetzt ihn;
+        nur dann werden die Verweise in O(Anzahl Versuche) neu bestimmt.
+
+        Args:
+            mark (float): Note.
+            date (datetime): Prüfungsdatum.
+            passed (bool): True bei bestanden.
+
+        Returns:
+            int: Index des neuen bzw. ersetzten Versuchs.
+        """
+        day = date.toordinal()
+        if self._latest is not None and self._field(self._latest, DAY) == day:
+            index = self._latest
+            self._data[index * STRIDE + MARK] = mark
+            self._data[index * STRIDE + PASSED] = 1.0 if passed else 0.0
+            self._reindex()
+            return index
+
+        index = len(self)
+        self._data.extend((mark, day, 1.0 if passed else 0.0))
+        self._track(index)
+        return index
+
+    def get(self, index):
+        """
+        Gibt einen Versuch zurück.
+
+        Returns:
+            tuple: (Note, Datum, Bestanden).
+        """
+        offset = index * STRIDE
+        return self._data[offset + MARK], datetime.fromordinal(int(self._data[offset + DAY])), self._data[offset + PASSED] != 0.0
+
+    def get_all(self):
+        """
+        Gibt alle Versuche in Reihenfolge des Anhängens zurück.
+
+        Returns:
+            tuple: Tupel von (Note, Datum, Bestanden).
+        """
+        return tuple(self.get(index) for index in range(len(self)))
+
+    def get_best_index(self):
+        """Gibt den Index des Versuchs mit der besten (niedrigsten) Note zurück oder None."""
+        return self._best
+
+    def get_latest_index(self):
+        """Gibt den Index des Versuchs mit dem spätesten Datum zurück oder None."""
+        return self._latest
+
+    def get_passed_index(self):
+        """Gibt den Index des besten bestandenen Versuchs zurück oder None."""
+        return self._best_passed
+
+    def get_counted_index(self):
+        """
+        Gibt den Index des Versuchs zurück, der für Noten und ECTS zählt.
+
+        Das ist der beste bestandene Versuch, ohne Bestehen der letzte Versuch.
+
+        Returns:
+            int or None: Index oder None ohne Versuche.
+        """
+        return self._best_passed if self._best_passed is not None else self._latest
+
+    def _field(self, index, field):
+        """Gibt ein Feld eines Versuchs zurück."""
+        return self._data[index * STRIDE + field]
+
+    def _track(self, index):
+        """Bezieht einen Versuch in die Verweise auf besten, letzten und bestandenen Versuch ein."""
+        mark = self._field(index, MARK)
+        if self._best is None or mark < self._field(self._best, MARK):
+            self._best = index
+        if self._latest is None or self._field(index, DAY) >= self._field(self._latest, DAY):
+            self._latest = index
+        if self._field(index, PASSED) and (self._best_passed is None or mark < self._field(self._best_passed, MARK)):
+            self._best_passed = index
+
+    def _reindex(self):
+        """Bestimmt alle Verweise neu, nur nach dem Ersetzen eines Versuchs nötig."""
+        self._best = self._latest = self._best_passed = None
+        for index in range(len(self)):
+            self._track(index)
@@ -0,0 +1,67 @@
+"""
+Skalierungsmessung für compute_module_statistics mit einer synthetischen Kohorte.
+
+Erzeugt zufällige Leistungen für das Curriculum aus modules.csv und misst die
+Laufzeit für verschiedene Prozesszahlen.
+
+Aufruf aus dem Projektverzeichnis:
+    python -m benchmarks.cohort_stats [--students 100000] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import time
+import numpy as np
+
+from cohort_stats import CohortArrays, compute_module_statistics
+from loader import iter_typed_rows, MODULE_SCHEMA
+
+
+def synthetic_cohort(student_count, seed=0):
+    """Erzeugt eine Kohorte, in der etwa 60 % der Module eine Leistung haben."""
+    rows = [values for _, _, values in iter_typed_rows("modules.csv", MODULE_SCHEMA, [])]
+    cohort = CohortArrays.allocate([row["Name"] for row in rows], [row["ECTS"] for row in rows], student_count)
+
+    rng = np.random.default_rng(seed)
+    shape = cohort.marks.shape
+    has_mark = rng.random(shape) < 0.6
+    marks = np.round(rng.uniform(1.0, 5.0, shape), 1).astype(np.float32)
+    cohort.marks[has_mark] = marks[has_mark]
+    cohort.passed[has_mark] = (marks[has_mark] <= 4.0)
+    cohort.months[has_mark] = rng.integers(0, 48, shape, dtype=np.int16)[has_mark]
+    return cohort
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cohort = synthetic_cohort(args.students)
+    print(f"Studierende: {args.students}, Module: {len(cohort.module_names)}, Kerne: {os.cpu_count()}")
+
+    reference = None
+    baseline = None
+    for workers in sorted(set(args.workers)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            statistics = compute_module_statistics(cohort, workers=workers)
+            best = min(best, time.perf_counter() - start)
+
+        summary = [(s.get_pass_rate(), s.get_mean_mark(), s.get_median_months()) for s in statistics]
+        if reference is None:
+            reference = summary
+        elif summary != reference:
+            raise SystemExit(f"FEHLER: abweichendes Ergebnis mit {workers} Prozessen")
+
+        baseline = baseline or best
+        print(f"{workers:>3} Prozesse: {best:.3f} s (Speedup {baseline / best:.2f})")
+
+    first = statistics[0]
+    print(f"Beispiel '{first.get_name()}': Quote {first.get_pass_rate()} %, Schnitt {first.get_mean_mark()}, Median {first.get_median_months()} Monate")
+
+
+if __name__ == "__main__":
+    main()
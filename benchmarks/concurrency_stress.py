@@ -0,0 +1,129 @@
+"""
+Belastungstest für den Controller mit vielen gleichzeitigen Lesern und Schreibern.
+
+Leser prüfen unter der Lesesperre, dass keine halb aktualisierten Prüfungsleistungen
+sichtbar sind und die Versionen monoton steigen. Schreiber arbeiten teils optimistisch
+mit expected_version. Am Ende wird der Lesedurchsatz unter Schreiblast ausgegeben.
+
+Aufruf aus dem Projektverzeichnis:
+    python -m benchmarks.concurrency_stress [--readers 16] [--writers 4] [--seconds 5]
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from concurrency import StaleVersionError
+from controller import Controller
+from curriculum import MODULE_INDICES_PER_SEMESTER
+from loader import load_course_of_study
+
+# --- Jede Note hat ein eigenes Datum, so lassen sich halbe Aktualisierungen erkennen ---
+MARKS = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0, 5.0]
+
+
+def date_for_mark(mark):
+    return datetime(2025, 1, MARKS.index(mark) + 1)
+
+
+def check_invariants(controller):
+    """Prüft unter der Lesesperre die Konsistenz aller Module und gibt die Version zurück."""
+    with controller.read_locked():
+        version, metrics = controller.get_versioned_metrics()
+        reached_ects = 0
+        for semester in controller.get_course().get_semester():
+            for module in semester.get_modules():
+                performance = module.get_performance()
+                if performance is None:
+                    continue
+                mark = performance.get_mark()
+                if performance.get_passed() != (mark <= 4.0) or performance.get_date() != date_for_mark(mark):
+                    raise AssertionError(f"Halb aktualisierte Leistung in '{module.get_name()}'")
+                if performance.get_passed():
+                    reached_ects += module.get_ects()
+        if reached_ects != metrics["reached_ects"]:
+            raise AssertionError("Metriken passen nicht zum Modulstand")
+        return version
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    course = load_course_of_study(MODULE_INDICES_PER_SEMESTER)
+    module_names = [module.get_name() for semester in course.get_semester() for module in semester.get_modules()]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        controller = Controller(course, os.path.join(tmp_dir, "modules.csv"))
+        stop = threading.Event()
+        errors = []
+        reads = [0] * args.readers
+        writes = [0] * args.writers
+        stale = [0] * args.writers
+
+        def reader(index):
+            last_version = -1
+            try:
+                while not stop.is_set():
+                    version = check_invariants(controller)
+                    if version < last_version:
+                        raise AssertionError("Version ist gesunken")
+                    last_version = version
+                    reads[index] += 1
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+
+        def writer(index):
+            rng = random.Random(index)
+            optimistic = index % 2 == 1
+            try:
+                while not stop.is_set():
+                    mark = rng.choice(MARKS)
+                    name = rng.choice(module_names)
+                    if optimistic:
+                        version = controller.get_version()
+                        try:
+                            controller.update_performance(name, mark, date_for_mark(mark), expected_version=version)
+                        except StaleVersionError:
+                            stale[index] += 1
+                            continue
+                    else:
+                        controller.update_performance(name, mark, date_for_mark(mark))
+                    writes[index] += 1
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+        threads += [threading.Thread(target=writer, args=(i,)) for i in range(args.writers)]
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        stop.wait(args.seconds)
+        stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        check_invariants(controller)
+
+    if errors:
+        raise SystemExit(f"FEHLER: {errors[0]}")
+
+    print(f"Leser: {args.readers}, Schreiber: {args.writers}, Dauer: {elapsed:.2f} s")
+    print(f"Lesevorgänge: {sum(reads)} ({sum(reads) / elapsed:.0f}/s)")
+    print(f"Schreibvorgänge: {sum(writes)} ({sum(writes) / elapsed:.0f}/s), veraltet abgewiesen: {sum(stale)}")
+    print(f"Endversion: {controller.get_version()}")
+    print("Alle Invarianten eingehalten.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Speicher- und Platzbedarf pro Person: vollständige Moduldatei gegenüber Overlay zum Studienplan.
+
+Für eine wachsende Anzahl an Noten pro Person werden jeweils --students Personen
+als vollständiger Studienverlauf (CourseOfStudy) bzw. als StudentOverlay im
+Speicher gehalten (tracemalloc) und einmal als Datei geschrieben.
+
+Aufruf aus dem Projektverzeichnis:
+    python -m benchmarks.curriculum [--students 2000]
+"""
+import argparse
+import gc
+import os
+import random
+import tempfile
+import tracemalloc
+from datetime import datetime
+
+from curriculum import StudentOverlay, load_curriculum_template
+
+MARKS = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0, 5.0]
+
+
+def random_overlay(template, grade_count, rng):
+    """Erstellt ein Overlay mit grade_count zufälligen Prüfungsleistungen."""
+    states = {}
+    for entry in rng.sample(template.get_modules(), grade_count):
+        mark = rng.choice(MARKS)
+        date = datetime(2025, rng.randint(1, 12), rng.randint(1, 28))
+        states[entry.get_name()] = ("Abgeschlossen" if mark <= 4.0 else "Offen", mark, date, mark <= 4.0, ((mark, date, mark <= 4.0),))
+    return StudentOverlay(template, states)
+
+
+def measure_memory(build, count):
+    """Gibt den Speicherbedarf pro Objekt in Bytes zurück, das build() erzeugt."""
+    gc.collect()
+    tracemalloc.start()
+    objects = [build(index) for index in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    template = load_curriculum_template()
+    module_count = len(template.get_modules())
+    print(f"Personen: {args.students}, Module im Studienplan: {module_count}")
+
+    for grade_count in sorted({0, 5, 15, module_count}):
+        rng = random.Random(args.seed)
+        overlays = [random_overlay(template, grade_count, rng) for _ in range(args.students)]
+
+        overlay_memory = measure_memory(lambda index: StudentOverlay(template, overlays[index].get_changed_states()), args.students)
+        course_memory = measure_memory(lambda index: template.create_course(overlays[index]), args.students)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            course_path = os.path.join(tmp_dir, "full.csv")
+            overlay_path = os.path.join(tmp_dir, "overlay.csv")
+            template.create_course(overlays[0]).save_modules_csv(course_path)
+            overlays[0].save_csv(overlay_path)
+            course_size = os.path.getsize(course_path)
+            overlay_size = os.path.getsize(overlay_path)
+
+        print(f"{grade_count:>3} Noten  Speicher: Studienverlauf {course_memory / 1024:6.1f} KiB, Overlay {overlay_memory / 1024:6.2f} KiB  "
+              f"Datei: vollständig {course_size:>5} B, Overlay {overlay_size:>5} B")
+
+
+if __name__ == "__main__":
+    main()
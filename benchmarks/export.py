@@ -0,0 +1,73 @@
+"""
+Durchsatz und Spitzen-Speicherbedarf (RSS) des Streaming-Exports.
+
+Jedes Format läuft in einem eigenen Prozess, damit der gemessene Spitzenwert nur
+diesem Format zuzurechnen ist. Die Zeilen stammen aus dem Studienverlauf in
+modules.csv und werden für die gewünschte Zeilenzahl mit wechselnder
+Studierenden-ID wiederholt.
+
+Aufruf aus dem Projektverzeichnis:
+    python -m benchmarks.export [--rows 1000000]
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from curriculum import MODULE_INDICES_PER_SEMESTER
+from export import EXPORT_FORMATS, iter_module_rows, write_rows
+from loader import load_course_of_study
+
+
+def synthetic_rows(course, row_count):
+    """Liefert row_count Modulzeilen, jeweils ein Studienverlauf pro Studierenden-ID."""
+    produced = 0
+    student = 0
+    while produced < row_count:
+        for row in iter_module_rows(course, f"student{student:07d}"):
+            if produced == row_count:
+                return
+            yield row
+            produced += 1
+        student += 1
+
+
+def measure(export_format, compress, row_count):
+    """Exportiert im aktuellen Prozess und gibt Zeilen/s, Spitzen-RSS und Dateigröße aus."""
+    course = load_course_of_study(MODULE_INDICES_PER_SEMESTER)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "export")
+        start = time.perf_counter()
+        write_rows(synthetic_rows(course, row_count), path, export_format, compress)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path)
+
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    label = export_format + (" + gzip" if compress else "")
+    print(f"{label:<16} {row_count / elapsed:>10.0f} Zeilen/s  {elapsed:6.2f} s  "
+          f"Spitzen-RSS {rss_peak / 1024:6.1f} MB (+{(rss_peak - rss_before) / 1024:.1f} MB)  Datei {size / 2**20:7.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--single", nargs=2, metavar=("FORMAT", "GZIP"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        measure(args.single[0], args.single[1] == "1", args.rows)
+        return
+
+    print(f"Zeilen: {args.rows}")
+    for export_format in sorted(EXPORT_FORMATS):
+        for compress in ("0", "1"):
+            subprocess.run([sys.executable, "-m", "benchmarks.export", "--rows", str(args.rows), "--single", export_format, compress], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Belastungstest für mehrere Prozesse, die dieselbe Moduldatei ändern und lesen.
+
+Jeder Schreibprozess hat einen eigenen Controller und trägt nacheinander Versuche
+für zufällig gewählte Module ein; alle Schreiber teilen sich dieselben wenigen
+Module (--modules), ändern also ständig dieselben Module wie die anderen. Jeder
+Versuch hat ein Datum, das über alle Schreiber hinweg eindeutig ist. Am Ende muss
+jeder eingetragene Versuch (Modul, Note, Datum) in der Datei stehen; jede
+verlorene Änderung fällt auf. Leseprozesse laden die Datei ohne Sperre fortlaufend
+vollständig und zählen Lesefehler (halb geschriebene Stände). Ausgegeben werden
+Durchsatz und die Wartezeit auf die Dateisperre.
+
+Aufruf aus dem Projektverzeichnis:
+    python -m benchmarks.file_lock_stress [--writers 4] [--readers 2] [--updates 200] [--modules 3]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from controller import Controller
+from curriculum import MODULE_INDICES_PER_SEMESTER
+from loader import CsvLoadError, load_course_of_study
+from tracing import TRACER
+
+MARKS = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0, 5.0]
+
+
+def writer(path, writer_index, writer_count, updates, module_count, seed, results):
+    """Trägt `updates` Versuche für die gemeinsamen Module ein und meldet die Versuche und Sperr-Wartezeiten."""
+    TRACER.enabled = True
+    rng = random.Random(seed + writer_index)
+    controller = Controller(load_course_of_study(MODULE_INDICES_PER_SEMESTER, modules_path=path), path)
+    with controller.read_locked():
+        names = [
+            module.get_name()
+            for semester in controller.get_course().get_semester()
+            for module in semester.get_modules()
+        ][:module_count]
+
+    attempts = []
+    start = time.perf_counter()
+    for update in range(updates):
+        # --- Eindeutiges Datum pro Versuch über alle Schreiber, damit jeder Versuch einzeln nachweisbar ist ---
+        attempt = (rng.choice(names), rng.choice(MARKS), datetime(2000, 1, 1) + timedelta(days=update * writer_count + writer_index))
+        controller.update_performance(*attempt)
+        attempts.append(attempt)
+    elapsed = time.perf_counter() - start
+    results.put(("writer", attempts, elapsed, TRACER.get_samples("file_lock.wait")))
+
+
+def reader(path, stop, results):
+    """Lädt die Datei ohne Sperre, bis stop gesetzt ist, und meldet Lesevorgänge und Fehler."""
+    reads = 0
+    errors = 0
+    while not stop.is_set():
+        try:
+            load_course_of_study(MODULE_INDICES_PER_SEMESTER, modules_path=path)
+        except CsvLoadError:
+            errors += 1
+        reads += 1
+    results.put(("reader", reads, errors))
+
+
+def percentile(values, percent):
+    """Nearest-Rank-Perzentil, 0.0 ohne Werte."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered), max(1, -(-len(ordered) * percent // 100))) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--updates", type=int, default=200, help="Änderungen pro Schreibprozess")
+    parser.add_argument("--modules", type=int, default=3, help="Anzahl der Module, die sich alle Schreiber teilen")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "modules.csv")
+        shutil.copy("modules.csv", path)
+        results = multiprocessing.Queue()
+        stop = multiprocessing.Event()
+        readers = [multiprocessing.Process(target=reader, args=(path, stop, results)) for _ in range(args.readers)]
+        writers = [
+            multiprocessing.Process(target=writer, args=(path, index, args.writers, args.updates, args.modules, args.seed, results))
+            for index in range(args.writers)
+        ]
+
+        start = time.perf_counter()
+        for process in readers + writers:
+            process.start()
+        messages = [results.get() for _ in writers]
+        elapsed = time.perf_counter() - start
+        stop.set()
+        messages += [results.get() for _ in readers]
+        for process in readers + writers:
+            process.join()
+
+        expected = set()
+        waits = []
+        for message in messages:
+            if message[0] == "writer":
+                expected.update(message[1])
+                waits += message[3]
+        final = load_course_of_study(MODULE_INDICES_PER_SEMESTER, modules_path=path).get_module_states()
+        stored = {(name, mark, date) for name, state in final.items() for mark, date, _ in state[4]}
+        lost = len(expected - stored)
+
+    reads = sum(message[1] for message in messages if message[0] == "reader")
+    read_errors = sum(message[2] for message in messages if message[0] == "reader")
+    total_updates = args.writers * args.updates
+    print(f"Schreiber: {args.writers}, Leser: {args.readers}, Änderungen: {total_updates} in {elapsed:.2f} s "
+          f"({total_updates / elapsed:.0f}/s)")
+    print(f"Verlorene Änderungen: {lost}")
+    print(f"Lesevorgänge: {reads}, davon fehlerhaft: {read_errors}")
+    print(f"Wartezeit auf die Dateisperre (ms): p50 {percentile(waits, 50) * 1000:.2f}  "
+          f"p95 {percentile(waits, 95) * 1000:.2f}  p99 {percentile(waits, 99) * 1000:.2f}  max {max(waits, default=0) * 1000:.2f}")
+    if lost or read_errors:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
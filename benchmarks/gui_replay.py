@@ -0,0 +1,117 @@
+"""
+Spielt Noteneingaben im Dashboard per Skript ab und misst die Latenz bis zum fertigen Bild.
+
+Jeder Schritt öffnet den Hinzufügen-Dialog, füllt Modul, Note und Datum aus und
+ruft CourseDashboard.save auf; danach werden mit update() alle ausstehenden
+Zeichenaufträge abgearbeitet. Die Zeit von save bis dahin ist die Frame-Latenz.
+Jeder dritte Schritt wird rückgängig gemacht, Note 5.0 ändert keinen Status und
+damit kein Kuchendiagramm. Zum Vergleich wird update_display (vollständiger
+Neuaufbau) einige Male gemessen. Alle Phasen aus tracing werden mit ausgegeben.
+
+Ohne DISPLAY wird, falls vorhanden, ein virtuelles Display (Xvfb) gestartet.
+
+Aufruf aus dem Projektverzeichnis:
+    python -m benchmarks.gui_replay [--steps 200] [--rebuilds 10]
+"""
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from tracing import TRACER
+
+MARKS = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0, 5.0]
+XVFB_DISPLAY = ":99"
+
+
+def ensure_display():
+    """Startet bei fehlendem DISPLAY ein Xvfb und gibt den Prozess zurück (oder None)."""
+    if os.environ.get("DISPLAY"):
+        return None
+    if shutil.which("Xvfb") is None:
+        sys.exit("Kein DISPLAY gesetzt und Xvfb nicht gefunden, z.B. mit xvfb-run ausführen.")
+
+    process = subprocess.Popen(["Xvfb", XVFB_DISPLAY, "-screen", "0", "1920x1080x24"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = XVFB_DISPLAY
+    time.sleep(1.0)
+    return process
+
+
+def enter_grade(root, dashboard, module_name, mark, date):
+    """Füllt den Hinzufügen-Dialog aus, speichert und gibt die Frame-Latenz in Sekunden zurück."""
+    dashboard.add_performance()
+    dashboard.combo.set(module_name)
+    dashboard.entry_mark.insert(0, str(mark).replace(".", ","))
+    dashboard.entry_date.insert(0, date)
+    root.update()
+
+    start = time.perf_counter()
+    dashboard.save()
+    root.update()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--rebuilds", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    xvfb = ensure_display()
+
+    # --- Tkinter und GUI erst mit gesetztem DISPLAY importieren ---
+    import tkinter as tk
+    from controller import Controller
+    from curriculum import MODULE_INDICES_PER_SEMESTER
+    from gui import Gui
+    from loader import load_course_of_study
+
+    TRACER.enabled = True
+    rng = random.Random(args.seed)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            modules_path = os.path.join(tmp_dir, "modules.csv")
+            shutil.copy("modules.csv", modules_path)
+            controller = Controller(load_course_of_study(MODULE_INDICES_PER_SEMESTER, modules_path=modules_path), modules_path)
+
+            root = tk.Tk()
+            gui = Gui(root, [("Replay", controller)])
+            root.update()
+            dashboard = gui.get_dashboard(0)
+            TRACER.reset()
+
+            for step in range(args.steps):
+                open_modules = controller.get_all_open_modules()
+                if step % 3 == 2 or not open_modules:
+                    start = time.perf_counter()
+                    dashboard.undo()
+                    root.update()
+                    TRACER.record("replay.undo_frame", time.perf_counter() - start)
+                    continue
+
+                date = f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.2025"
+                latency = enter_grade(root, dashboard, rng.choice(open_modules), rng.choice(MARKS), date)
+                TRACER.record("replay.save_frame", latency)
+
+            for _ in range(args.rebuilds):
+                start = time.perf_counter()
+                dashboard.update_display()
+                root.update()
+                TRACER.record("replay.rebuild_frame", time.perf_counter() - start)
+
+            print(f"Schritte: {args.steps}, vollständige Neuaufbauten: {args.rebuilds} (Zeiten in ms)")
+            print(TRACER.report())
+            root.destroy()
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Einzelabruf und Einzeländerung in einer großen Moduldatei mehrerer Studierender.
+
+Verglichen werden das vollständige Lesen der Datei (csv.DictReader) bzw. das
+vollständige Neuschreiben (write_rows) mit ModuleStore, der per mmap und
+gespeichertem Zeilenindex nur die betroffenen Zeilen liest bzw. überschreibt.
+Die Datei entsteht wie bei export.py aus modules.csv mit wechselnder
+Studierenden-ID.
+
+Aufruf aus dem Projektverzeichnis:
+    python -m benchmarks.module_store [--students 10000] [--lookups 1000]
+"""
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+
+from curriculum import MODULE_INDICES_PER_SEMESTER
+from export import iter_module_rows, write_rows
+from loader import load_course_of_study
+from module_store import ModuleStore
+
+MARKS = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0]
+
+
+def student_rows(course, student_count):
+    """Liefert die Modulzeilen von student_count Studierenden."""
+    for student in range(student_count):
+        yield from iter_module_rows(course, f"student{student:07d}")
+
+
+def scan_student(path, student):
+    """Liest die ganze Datei und gibt die Zeilen einer Person zurück."""
+    with open(path, newline="", encoding="utf-8") as file:
+        return [row for row in csv.DictReader(file) if row["Student"] == student]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=10000)
+    parser.add_argument("--lookups", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    course = load_course_of_study(MODULE_INDICES_PER_SEMESTER)
+    rng = random.Random(args.seed)
+    students = [f"student{rng.randrange(args.students):07d}" for _ in range(args.lookups)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "modules.csv")
+        write_rows(student_rows(course, args.students), path)
+        print(f"Personen: {args.students}, Datei {os.path.getsize(path) / 2**20:.1f} MB")
+
+        start = time.perf_counter()
+        scan_student(path, students[0])
+        print(f"Vollständiges Lesen pro Abruf:         {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+        start = time.perf_counter()
+        write_rows(student_rows(course, args.students), path)
+        print(f"Vollständiges Schreiben pro Änderung: {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+        start = time.perf_counter()
+        store = ModuleStore(path)
+        print(f"Index aufbauen:                        {(time.perf_counter() - start) * 1000:9.2f} ms")
+        store.close()
+
+        start = time.perf_counter()
+        store = ModuleStore(path)
+        print(f"Gespeicherten Index laden:             {(time.perf_counter() - start) * 1000:9.2f} ms")
+
+        with store:
+            start = time.perf_counter()
+            for student in students:
+                store.get_modules(student)
+            print(f"Alle Module einer Person (Index):      {(time.perf_counter() - start) / len(students) * 1000:9.3f} ms")
+
+            # --- Erste Änderung schreibt die Datei einmal mit Freiraum neu, danach passen Noten an Ort und Stelle ---
+            in_place = 0
+            start = time.perf_counter()
+            for student in students:
+                name = rng.choice(store.get_module_names(student))
+                module = store.get_module(student, name)
+                module.add_attempt(rng.choice(MARKS), datetime(2025, rng.randint(1, 12), rng.randint(1, 28)), True)
+                in_place += store.update_module(student, module)
+            elapsed = time.perf_counter() - start
+            print(f"Einzeländerung (Index):                {elapsed / len(students) * 1000:9.3f} ms "
+                  f"({in_place} von {len(students)} an Ort und Stelle)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Latenz der inkrementellen Synchronisation mit dem Prüfungsportal für viele Studierende.
+
+Startet den lokalen PortalStubServer, legt pro Person einen Controller mit eigener
+Moduldatei an und misst drei Läufe: den vollständigen ersten Abgleich, einen
+inkrementellen Abgleich, nachdem ein Teil der Personen neue Leistungen erhalten hat,
+und einen Abgleich ohne Änderungen (nur 304-Antworten).
+
+Aufruf aus dem Projektverzeichnis:
+    python -m benchmarks.portal_sync [--students 2000] [--results 20] [--pool 8]
+"""
+import argparse
+import copy
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+
+from controller import Controller
+from curriculum import MODULE_INDICES_PER_SEMESTER
+from loader import load_course_of_study
+from portal_stub import PortalStubServer
+from portal_sync import PortalClient, SyncState, sync_all
+
+MARKS = [1.0, 1.3, 1.7, 2.0, 2.3, 2.7, 3.0, 3.3, 3.7, 4.0, 5.0]
+
+
+def add_random_results(stub, student_id, module_names, count, rng):
+    """Trägt count zufällige Leistungen einer Person im Portal ein."""
+    for module_name in rng.sample(module_names, count):
+        stub.add_result(student_id, module_name, rng.choice(MARKS), datetime(2025, rng.randint(1, 12), rng.randint(1, 28)))
+
+
+def run(label, client, controllers, state, stub):
+    """Führt einen Synchronisationslauf aus und gibt die Kennzahlen aus."""
+    requests_before = stub.get_request_count()
+    start = time.perf_counter()
+    report = sync_all(client, controllers, state)
+    elapsed = time.perf_counter() - start
+
+    print(f"{label:<14} {elapsed:6.2f} s  {report.get_student_count() / elapsed:7.0f} Personen/s  "
+          f"p50 {report.get_latency_percentile(50) * 1000:6.1f} ms  p95 {report.get_latency_percentile(95) * 1000:6.1f} ms  "
+          f"p99 {report.get_latency_percentile(99) * 1000:6.1f} ms  "
+          f"{report.get_fetched_count():>6} übertragen  {report.get_applied_count():>6} übernommen  "
+          f"{report.get_not_modified_count():>5} ohne Änderung  {stub.get_request_count() - requests_before:>6} Anfragen")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--results", type=int, default=20, help="Leistungen pro Person im ersten Lauf")
+    parser.add_argument("--page-size", type=int, default=8)
+    parser.add_argument("--pool", type=int, default=8, help="Verbindungen im Pool")
+    parser.add_argument("--changed", type=float, default=0.1, help="Anteil der Personen mit neuen Leistungen")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    course = load_course_of_study(MODULE_INDICES_PER_SEMESTER)
+    module_names = [module.get_name() for semester in course.get_semester() for module in semester.get_modules()]
+    student_ids = [f"student{index:05d}" for index in range(args.students)]
+
+    stub = PortalStubServer()
+    for student_id in student_ids:
+        add_random_results(stub, student_id, module_names, min(args.results, len(module_names)), rng)
+    base_url = stub.start()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        controllers = {
+            student_id: Controller(copy.deepcopy(course), os.path.join(tmp_dir, f"{student_id}.csv"))
+            for student_id in student_ids
+        }
+        client = PortalClient(base_url, pool_size=args.pool, page_size=args.page_size)
+        state = SyncState(os.path.join(tmp_dir, "sync_state.json"))
+
+        print(f"Personen: {args.students}, Leistungen pro Person: {args.results}, Seitengröße: {args.page_size}, Pool: {args.pool}")
+        run("Erstabgleich", client, controllers, state, stub)
+
+        for student_id in rng.sample(student_ids, int(args.students * args.changed)):
+            add_random_results(stub, student_id, module_names, 2, rng)
+        run("Inkrementell", client, controllers, state, stub)
+        run("Unverändert", client, controllers, state, stub)
+
+        print(f"Aufgebaute Verbindungen: {client.get_pool().get_created_count()}")
+        client.close()
+
+    stub.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+import os
+from multiprocessing import Pool, shared_memory
+import numpy as np
+
+from loader import iter_typed_rows, MODULE_SCHEMA, LoadIssue, CsvLoadError
+
+# --- Notenhistogramm: ein Fach pro Zehntelnote von 1.0 bis 5.0 ---
+MARK_BIN_COUNT = 41
+# --- Monate vom Studienstart bis zum Bestehen, spätere Werte landen im letzten Fach ---
+MAX_MONTHS = 120
+
+
+class CohortArrays:
+    """
+    Spaltenweise Ablage der Prüfungsleistungen einer Kohorte (Studierende x Module).
+
+    Alle Arrays haben die Form (Anzahl Studierende, Anzahl Module), die Spalten
+    entsprechen `module_names`. Fehlende Leistungen sind als NaN (Note) bzw. -1
+    (Monate) kodiert.
+    """
+    def __init__(self, module_names:list, ects, marks, passed, months):
+        """
+        Args:
+            module_names (list): Modulnamen in Spaltenreihenfolge.
+            ects (np.ndarray): ECTS pro Modul, Form (Module,).
+            marks (np.ndarray): Noten als float32.
+            passed (np.ndarray): 1 bei bestanden, sonst 0 (int8).
+            months (np.ndarray): Monate seit Studienstart bis zur Prüfung (int16).
+        """
+        self.module_names = module_names
+        self.ects = ects
+        self.marks = marks
+        self.passed = passed
+        self.months = months
+
+    def get_student_count(self):
+        """Gibt die Anzahl der Studierenden zurück."""
+        return self.marks.shape[0]
+
+    @classmethod
+    def from_courses(cls, courses):
+        """
+        Erstellt die Arrays aus geladenen Studienverläufen mit identischem Curriculum.
+
+        Die Monate werden jeweils ab dem Studienstart des einzelnen Studienverlaufs gezählt.
+
+        Args:
+            courses (list): CourseOfStudy-Objekte, die Module des ersten bestimmen die Spalten.
+
+        Returns:
+            CohortArrays: Leistungen aller Studienverläufe.
+        """
+        modules = [module for semester in courses[0].get_semester() for module in semester.get_modules()]
+        cohort = cls.allocate([module.get_name() for module in modules], [module.get_ects() for module in modules], len(courses))
+
+        for row_index, course in enumerate(courses):
+            start_month = course.get_start().year * 12 + course.get_start().month
+            column = 0
+            for semester in course.get_semester():
+                for module in semester.get_modules():
+                    performance = module.get_performance()
+                    if performance is not None:
+                        date = performance.get_date()
+                        cohort.marks[row_index, column] = performance.get_mark()
+                        cohort.passed[row_index, column] = 1 if performance.get_passed() else 0
+                        cohort.months[row_index, column] = date.year * 12 + date.month - start_month
+                    column += 1
+        return cohort
+
+    @classmethod
+    def allocate(cls, module_names, ects, student_count):
+        """
+        Legt leere Arrays für eine Kohorte ohne Leistungen an.
+
+        Args:
+            module_names (list): Modulnamen in Spaltenreihenfolge.
+            ects (list): ECTS pro Modul.
+            student_count (int): Anzahl der Studierenden.
+
+        Returns:
+            CohortArrays: Kohorte ohne eingetragene Leistungen.
+        """
+        shape = (student_count, len(module_names))
+        return cls(
+            list(module_names),
+            np.asarray(ects, dtype=np.int16),
+            np.full(shape, np.nan, dtype=np.float32),
+            np.zeros(shape, dtype=np.int8),
+            np.full(shape, -1, dtype=np.int16)
+        )
+
+
+class ModuleStatistics:
+    """
+    Kennzahlen eines Moduls über alle Studierenden einer Kohorte.
+    """
+    def __init__(self, name:str, attempts:int, passed:int, mark_sum:float, mark_histogram, months_histogram):
+        """
+        Args:
+            name (str): Modulname.
+            attempts (int): Anzahl Studierender mit eingetragener Leistung.
+            passed (int): Anzahl Studierender mit bestandener Leistung.
+            mark_sum (float): Summe der bestandenen Noten.
+            mark_histogram (np.ndarray): Anzahl Leistungen pro Zehntelnote 1.0 bis 5.0.
+            months_histogram (np.ndarray): Anzahl Bestandener pro Monat seit Studienstart.
+        """
+        self._name = name
+        self._attempts = attempts
+        self._passed = passed
+        self._mark_sum = mark_sum
+        self._mark_histogram = mark_histogram
+        self._months_histogram = months_histogram
+
+    def get_name(self):
+        """Gibt den Modulnamen zurück."""
+        return self._name
+
+    def get_attempts(self):
+        """Gibt die Anzahl der eingetragenen Leistungen zurück."""
+        return self._attempts
+
+    def get_pass_rate(self):
+        """
+        Gibt die Bestehensquote bezogen auf alle eingetragenen Leistungen zurück.
+
+        Returns:
+            float or None: Quote in Prozent, gerundet auf 2 Stellen, oder None ohne Leistungen.
+        """
+        if self._attempts == 0:
+            return None
+        return round(self._passed / self._attempts * 100, 2)
+
+    def get_mean_mark(self):
+        """
+        Gibt die Durchschnittsnote der bestandenen Leistungen zurück.
+
+        Returns:
+            float or None: Durchschnitt, gerundet auf 2 Stellen, oder None ohne bestandene Leistungen.
+        """
+        if self._passed == 0:
+            return None
+        return round(self._mark_sum / self._passed, 2)
+
+    def get_mark_distribution(self):
+        """
+        Gibt die Notenverteilung aller eingetragenen Leistungen zurück.
+
+        Returns:
+            dict: Note (float) -> Anzahl, nur Noten mit mindestens einer Leistung.
+        """
+        return {
+            round(1.0 + index / 10, 1): int(count)
+            for index, count in enumerate(self._mark_histogram)
+            if count
+        }
+
+    def get_median_months(self):
+        """
+        Gibt den Median der Monate vom Studienstart bis zum Bestehen zurück.
+
+        Returns:
+            int or None: Median in Monaten oder None ohne bestandene Leistungen.
+        """
+        total = int(self._months_histogram.sum())
+        if total == 0:
+            return None
+        return int(np.searchsorted(np.cumsum(self._months_histogram), (total + 1) / 2))
+
+
+def load_cohort_directory(directory, module_names, ects, start):
+    """
+    Lädt die Moduldateien aller Studierenden eines Verzeichnisses in CohortArrays.
+
+    Jede *.csv-Datei im Verzeichnis entspricht einer Studentin bzw. einem Studenten
+    und hat das Format von modules.csv. Die Dateien werden einzeln gestreamt.
+
+    Args:
+        directory (str): Verzeichnis mit einer Moduldatei pro Person.
+        module_names (list): Modulnamen des Curriculums in Spaltenreihenfolge.
+        ects (list): ECTS pro Modul.
+        start (datetime): Studienstart der Kohorte.
+
+    Returns:
+        tuple: (CohortArrays, Liste der Studierenden-IDs in Zeilenreihenfolge).
+
+    Raises:
+        CsvLoadError: Wenn Dateien fehlerhaft sind oder unbekannte Module enthalten.
+    """
+    student_files = sorted(name for name in os.listdir(directory) if name.endswith(".csv"))
+    cohort = CohortArrays.allocate(module_names, ects, len(student_files))
+    column_of = {name: column for column, name in enumerate(module_names)}
+    start_month = start.year * 12 + start.month
+    issues = []
+
+    for row_index, file_name in enumerate(student_files):
+        path = os.path.join(directory, file_name)
+        for row_number, _, values in iter_typed_rows(path, MODULE_SCHEMA, issues):
+            column = column_of.get(values["Name"])
+            if column is None:
+                issues.append(LoadIssue(path, row_number, "Name", "Unbekanntes Modul."))
+                continue
+            if values["Note"] is None or values["Datum"] is None:
+                continue
+
+            date = values["Datum"]
+            cohort.marks[row_index, column] = values["Note"]
+            cohort.passed[row_index, column] = 1 if values["Bestanden"] else 0
+            cohort.months[row_index, column] = date.year * 12 + date.month - start_month
+
+    if issues:
+        raise CsvLoadError(issues)
+
+    return cohort, [os.path.splitext(name)[0] for name in student_files]
+
+
+def compute_module_statistics(cohort, workers=None, chunk_size=None):
+    """
+    Berechnet Kennzahlen pro Modul über alle Studierenden (Map-Reduce).
+
+    Die Kohorten-Arrays werden einmalig in Shared Memory gelegt. Jeder Worker-Prozess
+    bindet sie beim Start ein und erhält pro Aufgabe nur einen Zeilenbereich. Die
+    Teilergebnisse (Zähler und Histogramme pro Modul) werden anschließend addiert.
+
+    Args:
+        cohort (CohortArrays): Leistungen der Kohorte.
+        workers (int, optional): Anzahl der Prozesse, standardmäßig alle Kerne. 1 rechnet im eigenen Prozess.
+        chunk_size (int, optional): Studierende pro Aufgabe, standardmäßig gleichmäßig auf 4 Aufgaben pro Prozess verteilt.
+
+    Returns:
+        list: ModuleStatistics-Objekte in Spaltenreihenfolge.
+    """
+    workers = workers or os.cpu_count() or 1
+    student_count = cohort.get_student_count()
+    if chunk_size is None:
+        chunk_size = max(1, -(-student_count // (workers * 4)))
+    ranges = [(start, min(start + chunk_size, student_count)) for start in range(0, student_count, chunk_size)]
+
+    if workers == 1 or len(ranges) <= 1:
+        partials = [_partial_statistics(cohort.marks[s:e], cohort.passed[s:e], cohort.months[s:e]) for s, e in ranges]
+    else:
+        partials = _map_shared(cohort, ranges, workers)
+
+    module_count = len(cohort.module_names)
+    totals = _empty_partial(module_count)
+    for partial in partials:
+        for key in totals:
+            totals[key] += partial[key]
+
+    return [
+        ModuleStatistics(
+            name,
+            int(totals["attempts"][column]),
+            int(totals["passed"][column]),
+            float(totals["mark_sum"][column]),
+            totals["mark_histogram"][column],
+            totals["months_histogram"][column]
+        )
+        for column, name in enumerate(cohort.module_names)
+    ]
+
+
+def _map_shared(cohort, ranges, workers):
+    """Verteilt die Zeilenbereiche auf Worker-Prozesse, die Arrays liegen in Shared Memory."""
+    blocks = []
+    try:
+        specs = {}
+        for key in ("marks", "passed", "months"):
+            array = getattr(cohort, key)
+            block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            blocks.append(block)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            specs[key] = (block.name, array.shape, array.dtype.str)
+
+        with Pool(workers, initializer=_attach_shared, initargs=(specs,)) as pool:
+            return pool.map(_partial_statistics_shared, ranges)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+# --- Zustand der Worker-Prozesse: eingebundene Shared-Memory-Arrays ---
+_shared_arrays = {}
+_shared_blocks = []
+
+
+def _attach_shared(specs):
+    """Initialisierung eines Worker-Prozesses: bindet die Shared-Memory-Blöcke ein."""
+    for key, (name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=name)
+        _shared_blocks.append(block)
+        _shared_arrays[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def _partial_statistics_shared(row_range):
+    """Map-Schritt im Worker: Teilergebnis für einen Zeilenbereich der Shared-Memory-Arrays."""
+    start, end = row_range
+    return _partial_statistics(_shared_arrays["marks"][start:end], _shared_arrays["passed"][start:end], _shared_arrays["months"][start:end])
+
+
+def _empty_partial(module_count):
+    """Gibt ein leeres Teilergebnis für die angegebene Anzahl Module zurück."""
+    return {
+        "attempts": np.zeros(module_count, dtype=np.int64),
+        "passed": np.zeros(module_count, dtype=np.int64),
+        "mark_sum": np.zeros(module_count, dtype=np.float64),
+        "mark_histogram": np.zeros((module_count, MARK_BIN_COUNT), dtype=np.int64),
+        "months_histogram": np.zeros((module_count, MAX_MONTHS), dtype=np.int64),
+    }
+
+
+def _partial_statistics(marks, passed, months):
+    """
+    Map-Schritt: Zähler und Histogramme pro Modul für einen Block von Studierenden.
+
+    Args:
+        marks (np.ndarray): Noten (Zeilen x Module).
+        passed (np.ndarray): Bestanden-Kennzeichen (Zeilen x Module).
+        months (np.ndarray): Monate seit Studienstart (Zeilen x Module).
+
+    Returns:
+        dict: Teilergebnis, das durch Addition mit anderen zusammengeführt werden kann.
+    """
+    module_count = marks.shape[1]
+    columns = np.broadcast_to(np.arange(module_count), marks.shape)
+
+    has_mark = ~np.isnan(marks)
+    is_passed = has_mark & (passed != 0)
+
+    mark_bins = np.clip(np.rint(marks[has_mark] * 10).astype(np.int64) - 10, 0, MARK_BIN_COUNT - 1)
+    mark_histogram = np.bincount(columns[has_mark] * MARK_BIN_COUNT + mark_bins, minlength=module_count * MARK_BIN_COUNT)
+
+    month_bins = np.clip(months[is_passed].astype(np.int64), 0, MAX_MONTHS - 1)
+    months_histogram = np.bincount(columns[is_passed] * MAX_MONTHS + month_bins, minlength=module_count * MAX_MONTHS)
+
+    return {
+        "attempts": has_mark.sum(axis=0, dtype=np.int64),
+        "passed": is_passed.sum(axis=0, dtype=np.int64),
+        "mark_sum": np.where(is_passed, marks, 0).sum(axis=0, dtype=np.float64),
+        "mark_histogram": mark_histogram.reshape(module_count, MARK_BIN_COUNT),
+        "months_histogram": months_histogram.reshape(module_count, MAX_MONTHS),
+    }
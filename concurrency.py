@@ -0,0 +1,108 @@
+from contextlib import contextmanager
+import threading
+
+
+class StaleVersionError(Exception):
+    """
+    Wird ausgelöst, wenn eine Änderung auf einem veralteten Versionsstand beruht.
+
+    Der Aufrufer sollte die Daten neu lesen und die Änderung erneut versuchen.
+    """
+    def __init__(self, expected_version:int, current_version:int):
+        """
+        Args:
+            expected_version (int): Versionsstand, von dem der Aufrufer ausging.
+            current_version (int): Tatsächlicher aktueller Versionsstand.
+        """
+        super().__init__(f"Veralteter Stand: erwartet Version {expected_version}, aktuell {current_version}")
+        self.expected_version = expected_version
+        self.current_version = current_version
+
+
+class ConcurrentChangeError(Exception):
+    """
+    Wird ausgelöst, wenn eine Änderung nicht rückgängig gemacht oder wiederholt werden kann,
+    weil ein anderer Prozess das Modul inzwischen geändert hat.
+    """
+    def __init__(self, module_name:str):
+        """
+        Args:
+            module_name (str): Name des Moduls, das ein anderer Prozess geändert hat.
+        """
+        super().__init__(f"Das Modul '{module_name}' wurde inzwischen an anderer Stelle geändert.")
+        self.module_name = module_name
+
+
+class ReadWriteLock:
+    """
+    Sperre für viele gleichzeitige Leser und einen exklusiven Schreiber.
+
+    Wartende Schreiber haben Vorrang vor neuen Lesern, damit Schreiber unter
+    Dauerlast nicht verhungern. Lesesperren sind pro Thread wiedereintrittsfähig,
+    und der Thread mit der Schreibsperre darf zusätzlich lesen.
+    """
+    def __init__(self):
+        """Initialisiert eine freie Sperre."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    def acquire_read(self):
+        """Erwirbt eine Lesesperre, blockiert solange ein Schreiber aktiv ist oder wartet."""
+        depth = getattr(self._local, "read_depth", 0)
+        me = threading.get_ident()
+        with self._condition:
+            # --- Wiedereintritt nie blockieren, sonst Verklemmung mit wartenden Schreibern ---
+            if depth == 0 and self._writer != me:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+            self._readers += 1
+        self._local.read_depth = depth + 1
+
+    def release_read(self):
+        """Gibt eine Lesesperre wieder frei."""
+        self._local.read_depth -= 1
+        with self._condition:
+            self._readers -= 1
+            if self._readers == 0:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        """Erwirbt die exklusive Schreibsperre."""
+        me = threading.get_ident()
+        if getattr(self._local, "read_depth", 0):
+            raise RuntimeError("Eine Lesesperre kann nicht zur Schreibsperre aufgewertet werden.")
+        with self._condition:
+            if self._writer == me:
+                raise RuntimeError("Die Schreibsperre ist nicht wiedereintrittsfähig.")
+            self._waiting_writers += 1
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = me
+
+    def release_write(self):
+        """Gibt die Schreibsperre wieder frei."""
+        with self._condition:
+            self._writer = None
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        """Kontextmanager für eine Lesesperre."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        """Kontextmanager für die Schreibsperre."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -1,18 +1,74 @@
+import copy
+from datetime import datetime
+import os
+
+from cohort_stats import CohortArrays
+from concurrency import ConcurrentChangeError, ReadWriteLock, StaleVersionError
+from curriculum import StudentOverlay, load_overlay
+from events import EventBus, ModuleUpdated, SemesterProgressChanged, MetricsChanged
+from file_lock import FileLock
+from forecast import forecast_completion
+from history import HISTORY_SUFFIX, GradeHistory
+from loader import MODULE_SCHEMA, CsvLoadError, check_mark, iter_typed_rows
+from module import Module
+from planner import find_minimum_capacity, iter_months, plan_modules
+from tracing import TRACER
+
 class Controller:
     """
     Steuert den Zugriff auf ein CourseOfStudy-Objekt und stellt zentrale Funktionen bereit.
 
     Diese Klasse dient als Schnittstelle zwischen der Anwendungslogik und der GUI
+
+    Der Controller darf von mehreren Threads gleichzeitig genutzt werden: Lesende
+    Methoden laufen parallel unter einer Lesesperre, ändernde Methoden exklusiv
+    unter der Schreibsperre. Jede Änderung erhöht die Version, damit Aufrufer
+    veraltete Lesestände erkennen können. Wer direkt auf das CourseOfStudy-Objekt
+    zugreift, muss dies innerhalb von read_locked() tun.
+
+    Nach jeder wirksamen Änderung werden über den EventBus (get_event_bus) in dieser
+    Reihenfolge ModuleUpdated, bei Statuswechsel SemesterProgressChanged und zuletzt
+    MetricsChanged veröffentlicht, und zwar erst nach Freigabe der Schreibsperre.
+
+    Mehrere Prozesse dürfen dieselbe Moduldatei verwenden. Jede Änderung läuft unter
+    einer dateiübergreifenden Sperre (FileLock) als Read-Modify-Write: Zuerst wird
+    der Stand aller Module aus der Datei übernommen, auch der des zu ändernden
+    Moduls, dann wird die Änderung darauf angewendet und die Datei geschrieben. Die
+    Datei wird atomar ersetzt, Leser brauchen daher keine Sperre. Übernommene Module
+    lösen dieselben Ereignisse aus wie eigene Änderungen und stehen in der Historie,
+    können aber nicht rückgängig gemacht werden. Hat ein anderer Prozess ein Modul
+    seit der eigenen Änderung geändert, verweigern undo() und redo() das Überschreiben.
+
+    Die Historie wird neben der Moduldatei (modules_csv_path + ".history") geführt
+    und beim Start geladen. Weicht die Moduldatei vom letzten protokollierten Stand
+    ab, werden die Unterschiede als übernommene Ereignisse nachgetragen.
     """
-    def __init__(self, course_of_study):
+    def __init__(self, course_of_study, modules_csv_path="modules.csv", template=None):
         """
         Initialisiert den Controller mit einem gegebenen Studienverlauf.
 
         Args:
             course_of_study (CourseOfStudy): Ein Objekt des Studienverlaufs.
+            modules_csv_path (str, optional): Pfad der Moduldatei, in die Änderungen gespeichert werden.
+            template (CurriculumTemplate, optional): Gemeinsamer Studienplan. Ist er angegeben,
+                werden nur die Abweichungen davon als Overlay-Datei gespeichert.
         """
         self._course = course_of_study
-        
+        self._modules_csv_path = modules_csv_path
+        self._template = template
+        self._lock = ReadWriteLock()
+        self._version = 0
+        self._event_bus = EventBus()
+        self._file_lock = FileLock(modules_csv_path)
+        self._disk_stamp = None
+
+        with self._file_lock.locked():
+            self._history = GradeHistory(course_of_study.get_module_states(), path=modules_csv_path + HISTORY_SUFFIX)
+            logged_states = self._history.get_current_states()
+            for module_name, state in course_of_study.get_module_states().items():
+                if logged_states.get(module_name) != state:
+                    self._history.record_adopted(module_name, logged_states.get(module_name), state)
+
     def get_course(self):
         """
         Gibt das zugehörige CourseOfStudy-Objekt zurück.
@@ -21,18 +77,414 @@ class Controller:
             CourseOfStudy: Studienverlauf.
         """
         return self._course
-    
-    def update_performance(self, module_name, mark, date):
+
+    def get_modules_csv_path(self):
+        """
+        Gibt den Pfad der Moduldatei zurück, der eine Person eindeutig kennzeichnet.
+
+        Returns:
+            str: Pfad der Moduldatei bzw. des Overlays.
+        """
+        return self._modules_csv_path
+
+    def get_event_bus(self):
+        """
+        Gibt den EventBus zurück, über den Änderungen veröffentlicht werden.
+
+        Returns:
+            EventBus: Ereignisbus des Controllers.
+        """
+        return self._event_bus
+
+    def read_locked(self):
+        """
+        Kontextmanager für mehrere zusammenhängende Lesezugriffe unter einer Lesesperre.
+
+        Returns:
+            contextmanager: Lesesperre des Controllers.
+        """
+        return self._lock.read_locked()
+
+    def get_version(self):
+        """
+        Gibt den aktuellen Versionsstand zurück, der bei jeder Änderung erhöht wird.
+
+        Returns:
+            int: Versionsnummer.
+        """
+        with self._lock.read_locked():
+            return self._version
+
+    def update_performance(self, module_name, mark, date, expected_version=None):
         """
         Aktualisiert die Prüfungsleistung eines bestimmten Moduls und speichert alle Module in einer CSV-Datei.
 
+        Vorher werden alle Module auf den Stand der Datei gebracht, auch das geänderte
+        (Read-Modify-Write, siehe Klasse). Ist das Modul unbekannt oder ändert sich
+        nichts, wird weder gespeichert noch die Version erhöht.
+
         Args:
             module_name (str): Name des Moduls.
             mark (float): Neue Note.
             date (datetime): Datum der Prüfung.
+            expected_version (int, optional): Versionsstand, auf dem die Änderung beruht.
+
+        Returns:
+            int: Neuer Versionsstand.
+
+        Raises:
+            StaleVersionError: Wenn expected_version angegeben ist und nicht mehr aktuell ist.
+            CsvLoadError: Wenn die Moduldatei fehlerhaft ist; dann wird nichts geändert oder gespeichert.
+            ValueError: Wenn die Note außerhalb des gültigen Bereichs liegt (siehe loader.check_mark).
+        """
+        check_mark(mark)
+
+        events = []
+        with TRACER.phase("controller.update_performance"), self._lock.write_locked():
+            self._check_version(expected_version)
+
+            with self._file_lock.locked():
+                merged = self._merge_from_disk()
+
+                module = self.get_course().find_module(module_name)
+                changed = False
+                if module is not None:
+                    old_state = module.get_state()
+                    self.get_course().update_module_performance(module_name, mark, date)
+                    changed = module.get_state() != old_state
+
+                # --- Ohne Änderung bleiben Version und Datei unverändert ---
+                if changed:
+                    self._history.record(module_name, old_state, module.get_state())
+                    self._save()
+
+            if changed or merged:
+                self._version += 1
+            if changed:
+                events = self._change_events(module_name, old_state, module.get_state())
+            elif merged:
+                events = [MetricsChanged(self._version)]
+            events = merged + events
+            version = self._version
+
+        self._publish(events)
+        return version
+
+    def apply_results(self, results, expected_version=None):
+        """
+        Überträgt mehrere Prüfungsleistungen unter einer Schreibsperre und speichert die Module nur einmal.
+
+        Ergebnisse, die schon als Versuch (gleiche Note am selben Tag) vorhanden sind,
+        werden übersprungen; ein erneuter Abgleich, z.B. nach Verlust des
+        Synchronisationsstands, erzeugt also keine doppelten Versuche. Verglichen wird
+        mit dem Stand der Datei, also auch mit Versuchen aus anderen Prozessen.
+        Jede wirksame Änderung wird einzeln in der Historie aufgezeichnet. Danach werden
+        ModuleUpdated pro geändertem Modul, SemesterProgressChanged pro betroffenem
+        Semester und ein einziges MetricsChanged veröffentlicht.
+
+        Args:
+            results (iterable): Tupel (Modulname, Note, Datum).
+            expected_version (int, optional): Versionsstand, auf dem die Änderungen beruhen.
+
+        Returns:
+            tuple: (Neuer Versionsstand, Anzahl wirksamer Änderungen).
+
+        Raises:
+            StaleVersionError: Wenn expected_version angegeben ist und nicht mehr aktuell ist.
+            CsvLoadError: Wenn die Moduldatei fehlerhaft ist; dann wird nichts geändert oder gespeichert.
+            ValueError: Wenn eine Note außerhalb des gültigen Bereichs liegt; dann wird keine Leistung übernommen.
+        """
+        results = list(results)
+        for _, mark, _ in results:
+            check_mark(mark)
+
+        module_events = []
+        progress_events = {}
+        with self._lock.write_locked():
+            self._check_version(expected_version)
+
+            with self._file_lock.locked():
+                merged = self._merge_from_disk()
+
+                for module_name, mark, date in results:
+                    module = self.get_course().find_module(module_name)
+                    if module is None or module.has_attempt(mark, date):
+                        continue
+
+                    old_state = module.get_state()
+                    self.get_course().update_module_performance(module_name, mark, date)
+                    if module.get_state() == old_state:
+                        continue
+
+                    self._history.record(module_name, old_state, module.get_state())
+                    semester_index = self.get_course().get_semester_index(module_name)
+                    module_events.append(ModuleUpdated(module_name, semester_index))
+                    if old_state[0] != module.get_state()[0]:
+                        progress_events[semester_index] = SemesterProgressChanged(semester_index)
+
+                if module_events:
+                    self._save()
+
+            if merged or module_events:
+                self._version += 1
+            version = self._version
+
+        if merged or module_events:
+            self._publish(merged + module_events + list(progress_events.values()) + [MetricsChanged(version)])
+        return version, len(module_events)
+
+    def get_history(self):
+        """
+        Gibt das Ereignisprotokoll aller Notenänderungen zurück.
+
+        Returns:
+            GradeHistory: Änderungshistorie.
+        """
+        return self._history
+
+    def can_undo(self):
+        """Gibt zurück, ob eine Änderung rückgängig gemacht werden kann."""
+        with self._lock.read_locked():
+            return self._history.can_undo()
+
+    def can_redo(self):
+        """Gibt zurück, ob eine rückgängig gemachte Änderung wiederholt werden kann."""
+        with self._lock.read_locked():
+            return self._history.can_redo()
+
+    def undo(self):
+        """
+        Macht die letzte Notenänderung rückgängig und speichert alle Module.
+
+        Returns:
+            str or None: Name des betroffenen Moduls oder None, wenn nichts rückgängig zu machen war.
+
+        Raises:
+            ConcurrentChangeError: Wenn ein anderer Prozess das Modul seit der Änderung geändert hat.
+                Die Änderung wird dann vom Rückgängig-Stapel entfernt.
+            CsvLoadError: Wenn die Moduldatei fehlerhaft ist; dann wird nichts geändert oder gespeichert.
+        """
+        return self._apply_history_event(redo=False)
+
+    def redo(self):
+        """
+        Wiederholt die zuletzt rückgängig gemachte Notenänderung und speichert alle Module.
+
+        Returns:
+            str or None: Name des betroffenen Moduls oder None, wenn nichts zu wiederholen war.
+
+        Raises:
+            ConcurrentChangeError: Wenn ein anderer Prozess das Modul seit dem Rückgängigmachen geändert hat.
+                Die Änderung wird dann vom Wiederholen-Stapel entfernt.
+            CsvLoadError: Wenn die Moduldatei fehlerhaft ist; dann wird nichts geändert oder gespeichert.
+        """
+        return self._apply_history_event(redo=True)
+
+    def get_course_at(self, point_in_time):
+        """
+        Rekonstruiert den Studienverlauf zu einem vergangenen Zeitpunkt.
+
+        Der aktuelle Studienverlauf bleibt unverändert, es wird eine Kopie zurückgegeben.
+
+        Args:
+            point_in_time (datetime): Gewünschter Zeitpunkt.
+
+        Returns:
+            CourseOfStudy: Studienverlauf im Zustand zum angegebenen Zeitpunkt.
+        """
+        with self._lock.read_locked():
+            course = copy.deepcopy(self.get_course())
+            states = self._history.get_states_at(point_in_time)
+
+        for module_name, state in states.items():
+            course.restore_module_state(module_name, state)
+        return course
+
+    def _apply_history_event(self, redo):
+        """
+        Macht die letzte eigene Änderung rückgängig bzw. wiederholt sie, nachdem die Datei übernommen wurde.
+
+        Das geschieht nur, wenn das Modul in der Datei noch den Stand hat, den die
+        eigene Änderung hinterlassen hat, sonst würden Änderungen anderer Prozesse
+        überschrieben. Übernommene Module werden auch im Konfliktfall veröffentlicht.
+        Eine Änderung an einem Modul, das nicht mehr im Studienplan steht, wird mit
+        einer Meldung vom Stapel entfernt und übersprungen.
+
+        Args:
+            redo (bool): True zum Wiederholen, False zum Rückgängigmachen.
+
+        Returns:
+            str or None: Name des betroffenen Moduls oder None, wenn nichts anzuwenden war.
+
+        Raises:
+            ConcurrentChangeError: Wenn ein anderer Prozess das Modul inzwischen geändert hat.
+            CsvLoadError: Wenn die Moduldatei fehlerhaft ist; dann wird nichts geändert oder gespeichert.
+        """
+        module_name = None
+        conflict = None
+        events = []
+        with self._lock.write_locked():
+            with self._file_lock.locked():
+                merged = self._merge_from_disk()
+
+                original = self._history.peek_redo() if redo else self._history.peek_undo()
+                module = self.get_course().find_module(original.get_module_name()) if original is not None else None
+                if original is not None and module is None:
+                    # --- Umbenanntes oder aus dem Studienplan entferntes Modul ---
+                    print(f"Das Modul '{original.get_module_name()}' ist nicht mehr im Studienplan, die Änderung wird übersprungen.")
+                    self._history.discard(original)
+                elif original is not None:
+                    expected = original.get_old_state() if redo else original.get_new_state()
+                    if module.get_state() != expected:
+                        self._history.discard(original)
+                        conflict = ConcurrentChangeError(original.get_module_name())
+                    else:
+                        event = self._history.redo() if redo else self._history.undo()
+                        module_name = event.get_module_name()
+                        self.get_course().restore_module_state(module_name, event.get_new_state())
+                        self._save()
+
+            if merged or module_name is not None:
+                self._version += 1
+            if module_name is not None:
+                events = self._change_events(module_name, event.get_old_state(), event.get_new_state())
+            elif merged:
+                events = [MetricsChanged(self._version)]
+            events = merged + events
+
+        self._publish(events)
+        if conflict is not None:
+            raise conflict
+        return module_name
+
+    def refresh_from_disk(self):
+        """
+        Übernimmt Änderungen anderer Prozesse aus der Moduldatei.
+
+        Ist die Datei seit dem letzten Lesen oder Schreiben unverändert, wird sie
+        weder gelesen noch gesperrt. Sonst wird sie unter der Dateisperre gelesen,
+        damit übernommene Module passend zur Historie aufgezeichnet werden. Eine
+        fehlerhafte Datei wird gemeldet und nicht übernommen.
+
+        Returns:
+            int: Anzahl übernommener Module.
+        """
+        merged = []
+        with self._lock.write_locked():
+            if _file_stamp(self._modules_csv_path) != self._disk_stamp:
+                try:
+                    with self._file_lock.locked():
+                        merged = self._merge_from_disk()
+                except CsvLoadError as e:
+                    print(f"Änderungen anderer Prozesse werden nicht übernommen.\n{e.report()}")
+            if merged:
+                self._version += 1
+            version = self._version
+
+        if merged:
+            self._publish(merged + [MetricsChanged(version)])
+        return sum(1 for event in merged if isinstance(event, ModuleUpdated))
+
+    def _save(self):
+        """Speichert die Module, der Aufrufer muss die Schreibsperre und die Dateisperre halten."""
+        with TRACER.phase("controller.save_csv"):
+            self._write_modules()
+            self._disk_stamp = _file_stamp(self._modules_csv_path)
+
+    def _merge_from_disk(self):
+        """
+        Übernimmt alle abweichenden Modulzustände aus der Datei, der Aufrufer muss die Dateisperre halten.
+
+        Zuerst werden die Historien-Ereignisse anderer Prozesse eingelesen. Weicht
+        die Datei danach noch vom Stand der Historie ab, z.B. nach einer Änderung von
+        Hand, wird der Unterschied als übernommenes Ereignis aufgezeichnet, damit
+        Zeitreisen den aktuellen Stand liefern.
+
+        Returns:
+            list: ModuleUpdated und SemesterProgressChanged für übernommene Module.
+
+        Raises:
+            CsvLoadError: Wenn die Datei fehlerhaft ist. Der Aufrufer darf sie dann nicht
+                überschreiben, sonst gingen die Änderungen anderer Prozesse verloren.
+        """
+        self._history.sync()
+
+        stamp = _file_stamp(self._modules_csv_path)
+        if stamp is None or stamp == self._disk_stamp:
+            return []
+
+        states = self._read_disk_states()
+        self._disk_stamp = stamp
+
+        course = self.get_course()
+        logged_states = self._history.get_current_states()
+        events = []
+        for module_name, state in states.items():
+            module = course.find_module(module_name)
+            if module is None:
+                continue
+            if logged_states.get(module_name) != state:
+                self._history.record_adopted(module_name, logged_states.get(module_name), state)
+            if module.get_state() == state:
+                continue
+            old_state = module.get_state()
+            course.restore_module_state(module_name, state)
+            semester_index = course.get_semester_index(module_name)
+            events.append(ModuleUpdated(module_name, semester_index))
+            if old_state[0] != state[0]:
+                events.append(SemesterProgressChanged(semester_index))
+        return events
+
+    def _read_disk_states(self):
+        """
+        Liest die Modulzustände aus der Moduldatei bzw. dem Overlay.
+
+        Returns:
+            dict: Modulname -> Zustandstupel (siehe Module.get_state).
+
+        Raises:
+            CsvLoadError: Wenn die Datei fehlerhaft ist.
         """
-        self.get_course().update_module_performance(module_name, mark, date)
-        self.get_course().save_modules_csv("modules.csv")
+        if self._template is not None:
+            return self._template.create_course(load_overlay(self._template, self._modules_csv_path)).get_module_states()
+
+        issues = []
+        states = {
+            values["Name"]: Module(values["Name"], values["ECTS"], values["Status"], values["Note"], values["Datum"], values["Bestanden"], values["Versuche"]).get_state()
+            for _, _, values in iter_typed_rows(self._modules_csv_path, MODULE_SCHEMA, issues)
+        }
+        if issues:
+            raise CsvLoadError(issues)
+        return states
+
+    def _write_modules(self):
+        """Schreibt die Moduldatei bzw. das Overlay."""
+        if self._template is None:
+            self.get_course().save_modules_csv(self._modules_csv_path)
+        else:
+            StudentOverlay.from_course(self._template, self.get_course()).save_csv(self._modules_csv_path)
+
+    def _change_events(self, module_name, old_state, new_state):
+        """Ermittelt die Änderungsereignisse für einen Zustandswechsel eines Moduls."""
+        semester_index = self.get_course().get_semester_index(module_name)
+        events = [ModuleUpdated(module_name, semester_index)]
+
+        # --- Der Semesterfortschritt hängt nur vom Status ab ---
+        if old_state[0] != new_state[0]:
+            events.append(SemesterProgressChanged(semester_index))
+
+        events.append(MetricsChanged(self._version))
+        return events
+
+    def _publish(self, events):
+        """Veröffentlicht Ereignisse, der Aufrufer darf keine Sperre halten."""
+        for event in events:
+            self._event_bus.publish(event)
+
+    def _check_version(self, expected_version):
+        """Löst StaleVersionError aus, wenn expected_version nicht dem aktuellen Stand entspricht."""
+        if expected_version is not None and expected_version != self._version:
+            raise StaleVersionError(expected_version, self._version)
 
     def get_semester_progress(self, semester_number):
         """
@@ -44,7 +496,8 @@ class Controller:
         Returns:
             tuple: (Anzahl offene Module, Anzahl abgeschlossene Module)
         """
-        return self.get_course().get_semester()[semester_number].get_progress()
+        with self._lock.read_locked():
+            return self.get_course().get_semester()[semester_number].get_progress()
     
     def get_semester_designation(self, semester_number):
         """
@@ -56,7 +509,8 @@ class Controller:
         Returns:
             str: Semesterbezeichnung.
         """
-        return self.get_course().get_semester()[semester_number].get_designation()
+        with self._lock.read_locked():
+            return self.get_course().get_semester()[semester_number].get_designation()
     
     def get_all_open_modules(self):
         """
@@ -65,23 +519,93 @@ class Controller:
         Returns:
             list: Liste von Modulnamen mit Status "Offen".
         """
-        all_modules = []
-        for semester in self.get_course().get_semester():
-            for module in semester.get_modules():
-                if module.get_status() == "Offen":
-                    all_modules.append(module.get_name())
-        return all_modules
+        with self._lock.read_locked():
+            return self.get_course().get_module_index().get_names_by_status("Offen")
+
+    def query_modules(self, status=None, semester=None, ects=None, date_from=None, date_to=None, sort_by="position", descending=False):
+        """
+        Filtert und sortiert Module über die Indizes des Studienverlaufs.
+
+        Beispiele: query_modules(status="Offen", ects=10) oder
+        query_modules(date_from=datetime(2025, 1, 1), date_to=datetime(2025, 6, 30), sort_by="mark").
+
+        Args:
+            status (str, optional): Modulstatus, z.B. "Offen".
+            semester (int, optional): Semesterindex (beginnend bei 0).
+            ects (int, optional): ECTS-Punkte.
+            date_from (datetime, optional): Frühestes Prüfungsdatum (eingeschlossen).
+            date_to (datetime, optional): Spätestes Prüfungsdatum (eingeschlossen).
+            sort_by (str, optional): "position", "name", "semester", "ects", "status", "mark" oder "date".
+            descending (bool, optional): True für absteigende Sortierung.
+
+        Returns:
+            list: Zeilen wie Module.to_dict, ergänzt um "Semester" (Bezeichnung).
+
+        Raises:
+            ValueError: Bei unbekanntem Sortierschlüssel.
+        """
+        with self._lock.read_locked():
+            course = self.get_course()
+            modules = course.get_module_index().query(status, semester, ects, date_from, date_to, sort_by, descending)
+            return [
+                {"Semester": course.get_semester()[course.get_semester_index(module.get_name())].get_designation(), **module.to_dict()}
+                for module in modules
+            ]
     
-    def time_left_display(self):
+    def plan_study(self, capacity, prerequisites=None, now=None):
+        """
+        Plant die offenen Module Monat für Monat bis zum Studienende (siehe planner.plan_modules).
+
+        Schnell genug, um nach jeder Noteneingabe neu zu planen.
+
+        Args:
+            capacity (int): Höchstens pro Monat eingeplante ECTS.
+            prerequisites (dict, optional): Modulname -> Namen der Module, die vorher abgeschlossen sein müssen.
+            now (datetime, optional): Bezugszeitpunkt, der laufende Monat wird mit eingeplant.
+
+        Returns:
+            StudyPlan: Belegungsplan mit nicht einplanbaren Modulen.
+        """
+        modules, months, missing_ects = self._planning_input(now)
+        return plan_modules(modules, months, capacity, missing_ects, prerequisites)
+
+    def get_minimum_capacity(self, prerequisites=None, now=None):
+        """
+        Gibt die kleinste Kapazität in ECTS pro Monat zurück, mit der das Studium rechtzeitig abgeschlossen wird.
+
+        Returns:
+            int: ECTS pro Monat oder None, wenn das Studienende nicht mehr erreichbar ist.
+        """
+        modules, months, missing_ects = self._planning_input(now)
+        return find_minimum_capacity(modules, months, missing_ects, prerequisites)
+
+    def _planning_input(self, now):
+        """Sammelt offene Module (Name, ECTS), verbleibende Monate und fehlende ECTS unter der Lesesperre."""
+        with self._lock.read_locked():
+            course = self.get_course()
+            modules = [
+                (module.get_name(), module.get_ects())
+                for semester in course.get_semester()
+                for module in semester.get_modules()
+                if module.get_status() == "Offen"
+            ]
+            months = list(iter_months(now or datetime.now(), course.get_end()))
+            return modules, months, course.get_total_ects() - course.calculate_reached_ects()
+
+    def time_left_display(self, now=None):
         """
         Gibt die verbleibende Zeit bis zum Studienende als formatierten Text zurück.
 
         Beispiel: "1 Jahr 3 Monate 12 Tage"
 
+        Args:
+            now (datetime, optional): Bezugszeitpunkt, standardmäßig jetzt.
+
         Returns:
             str: Formatierte Zeitangabe.
         """
-        time_left = self.get_course().get_time_left()
+        with self._lock.read_locked():
+            time_left = self.get_course().get_time_left(now)
 
         def pluralize(value, singular, plural):
             if value == 1:
@@ -98,6 +622,61 @@ class Controller:
         parts = [part for part in [year_str, month_str, day_str] if part]
         return " ".join(parts)
     
+    def get_time_metrics(self, now=None):
+        """
+        Berechnet alle vom aktuellen Datum abhängigen Kennzahlen mit einem gemeinsamen Bezugszeitpunkt.
+
+        Args:
+            now (datetime, optional): Bezugszeitpunkt, standardmäßig jetzt.
+
+        Returns:
+            dict: Verbleibende Zeit (Text), notwendige ECTS pro Monat, ECTS diesen Monat und Abschlussprognose (Text).
+        """
+        now = now or datetime.now()
+        with self._lock.read_locked():
+            return {
+                "time_left": self.time_left_display(now),
+                "necessary_ects_pm": self.get_course().get_necessary_ects_pm(now),
+                "ects_this_month": self.get_course().get_ects_this_month(now),
+                "graduation_forecast": self.graduation_forecast_display(now)
+            }
+
+    def get_graduation_forecast(self, now=None):
+        """
+        Prognostiziert den Abschlusstermin anhand der bisherigen ECTS pro Monat.
+
+        Args:
+            now (datetime, optional): Bezugszeitpunkt, standardmäßig jetzt.
+
+        Returns:
+            GraduationForecast: Erwarteter, frühester und spätester Abschluss.
+        """
+        with self._lock.read_locked():
+            course = self.get_course()
+            cohort = CohortArrays.from_courses([course])
+            return forecast_completion(cohort, [course.get_start()], course.get_total_ects(), now).get(0)
+
+    def graduation_forecast_display(self, now=None):
+        """
+        Gibt den prognostizierten Abschluss als formatierten Text zurück.
+
+        Beispiel: "03.2027 (11.2026 – 09.2027)"
+
+        Args:
+            now (datetime, optional): Bezugszeitpunkt, standardmäßig jetzt.
+
+        Returns:
+            str: Formatierte Prognose oder "Keine Prognose" ohne bisherige ECTS.
+        """
+        forecast = self.get_graduation_forecast(now)
+        if forecast.get_expected() is None:
+            return "Keine Prognose"
+
+        expected = forecast.get_expected().strftime("%m.%Y")
+        earliest = forecast.get_earliest().strftime("%m.%Y")
+        latest = forecast.get_latest().strftime("%m.%Y") if forecast.get_latest() else "offen"
+        return f"{expected} ({earliest} – {latest})"
+
     def next_mark_setting(self):
         """
         Gibt an, welche Note als nächstes erforderlich ist, um einen Durchschnitt von 2.0 zu erreichen.
@@ -110,7 +689,8 @@ class Controller:
         Returns:
             float or str: Nächste notwendige Note.
         """
-        next_mark = self.get_course().calculate_required_next_mark() 
+        with self._lock.read_locked():
+            next_mark = self.get_course().calculate_required_next_mark()
         if next_mark > 6:
             next_mark = "Egal"
         elif next_mark < 1:
@@ -119,13 +699,37 @@ class Controller:
             next_mark
         return next_mark
 
-    def get_metrics(self):
+    def get_metrics(self, now=None):
         """
         Gibt eine Zusammenfassung wichtiger Leistungskennzahlen des Studienverlaufs zurück.
 
+        Args:
+            now (datetime, optional): Bezugszeitpunkt, standardmäßig jetzt.
+
         Returns:
             dict: Übersicht mit Metriken (ECTS, Noten, Fortschritt, Zeit usw.).
         """
+        return self.get_versioned_metrics(now)[1]
+
+    def get_versioned_metrics(self, now=None):
+        """
+        Gibt die Metriken zusammen mit dem Versionsstand zurück, zu dem sie berechnet wurden.
+
+        Alle Werte stammen aus demselben konsistenten Stand. Der Versionsstand kann
+        an update_performance(expected_version=...) übergeben werden.
+
+        Args:
+            now (datetime, optional): Bezugszeitpunkt, standardmäßig jetzt.
+
+        Returns:
+            tuple: (Versionsnummer, dict mit Metriken wie bei get_metrics).
+        """
+        now = now or datetime.now()
+        with self._lock.read_locked():
+            return self._version, self._collect_metrics(now)
+
+    def _collect_metrics(self, now):
+        """Berechnet die Metriken zu einem gemeinsamen Bezugszeitpunkt, der Aufrufer muss eine Sperre halten."""
         return {
             "reached_ects": self.get_course().calculate_reached_ects(),
             "total_ects": self.get_course().get_total_ects(),
@@ -133,8 +737,17 @@ class Controller:
             "gpa": self.get_course().calculate_gpa(),
             "best_mark": self.get_course().get_best_worst_mark()[0],
             "worst_mark": self.get_course().get_best_worst_mark()[1],
-            "time_left": self.get_course().get_time_left(),
+            "time_left": self.get_course().get_time_left(now),
             "semester": self.get_course().get_semester(),
-            "ects_this_month": self.get_course().get_ects_this_month(),
-            "necessary_ects_pm": self.get_course().get_necessary_ects_pm()
-        }
\ No newline at end of file
+            "ects_this_month": self.get_course().get_ects_this_month(now),
+            "necessary_ects_pm": self.get_course().get_necessary_ects_pm(now)
+        }
+
+
+def _file_stamp(path):
+    """Gibt (Inode, Änderungszeit, Größe) einer Datei zurück, an denen ein Austausch erkannt wird, oder None."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
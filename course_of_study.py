@@ -1,7 +1,9 @@
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
-import pandas as pd
 
+from export import iter_module_rows, write_rows
+from file_lock import replace_atomically
+from module_index import ModuleIndex
 from semester import Semester
 
 class CourseOfStudy:
@@ -34,6 +36,43 @@ class CourseOfStudy:
         self._end = end
 
         self._semester = [Semester(d) for d in designation]
+        self._module_index = None
+
+    def get_name(self):
+        """
+        Gibt den Namen des Studiengangs zurück.
+
+        Returns:
+            str: Studiengangsname.
+        """
+        return self._name
+
+    def get_type(self):
+        """
+        Gibt die Studienart zurück.
+
+        Returns:
+            str: Studienart (z.B. Bachelor, Master).
+        """
+        return self._type
+
+    def get_titel(self):
+        """
+        Gibt den verliehenen Titel zurück.
+
+        Returns:
+            str: Titel (z.B. B.Sc.).
+        """
+        return self._titel
+
+    def get_duration(self):
+        """
+        Gibt die Gesamtdauer des Studiums zurück.
+
+        Returns:
+            str: Studiendauer.
+        """
+        return self._duration
 
     def get_total_ects(self):
         """
@@ -44,6 +83,15 @@ class CourseOfStudy:
         """
         return self._total_ects
     
+    def get_start(self):
+        """
+        Gibt das Startdatum des Studiums zurück.
+
+        Returns:
+            datetime: Startdatum.
+        """
+        return self._start
+
     def get_end(self):
         """
         Gibt das geplante Enddatum des Studiums zurück.
@@ -62,14 +110,17 @@ class CourseOfStudy:
         """
         return self._semester
 
-    def get_time_left(self):
+    def get_time_left(self, now:datetime = None):
         """
         Berechnet die verbleibende Zeit bis zum Studienende.
 
+        Args:
+            now (datetime, optional): Bezugszeitpunkt, standardmäßig jetzt.
+
         Returns:
             relativedelta: Zeitdifferenz zwischen jetzt und dem Enddatum.
         """
-        time_left = relativedelta(self.get_end(), datetime.now())
+        time_left = relativedelta(self.get_end(), now or datetime.now())
         return time_left
     
     def calculate_reached_ects(self):
@@ -99,16 +150,19 @@ class CourseOfStudy:
         progress = (self.calculate_reached_ects()/self.get_total_ects())*100
         return round(progress, 2) 
 
-    def get_necessary_ects_pm(self):
+    def get_necessary_ects_pm(self, now:datetime = None):
         """
         Berechnet, wie viele ECTS-Punkte pro Monat erforderlich sind,
         um das Studium bis zum geplanten Enddatum abzuschließen.
 
+        Args:
+            now (datetime, optional): Bezugszeitpunkt, standardmäßig jetzt.
+
         Returns:
             float: Benötigte ECTS pro Monat, gerundet auf 2 Stellen.
         """
         missing_ects = self.get_total_ects() - self.calculate_reached_ects()
-        time_left = self.get_time_left()
+        time_left = self.get_time_left(now)
         total_months = time_left.years * 12 + time_left.months
 
         # --- Wenn noch Tage übrig sind, als "fast ein Monat" zählen ---
@@ -121,15 +175,18 @@ class CourseOfStudy:
         ects_pm = missing_ects / total_months
         return round(ects_pm, 2)
     
-    def get_ects_this_month(self):
+    def get_ects_this_month(self, now:datetime = None):
         """
         Berechnet, wie viele ECTS-Punkte im aktuellen Monat erreicht wurden.
 
+        Args:
+            now (datetime, optional): Bezugszeitpunkt, standardmäßig jetzt.
+
         Returns:
             int: ECTS-Punkte im aktuellen Monat.
         """
         reached_ects_this_month = 0
-        time_now = datetime.now()
+        time_now = now or datetime.now()
 
         for semester in self.get_semester():
             for module in semester.get_modules():
@@ -214,34 +271,105 @@ class CourseOfStudy:
     
     def update_module_performance(self, module_name, mark, date):
         """
-        Aktualisiert die Prüfungsleistung eines Moduls anhand des Namens.
+        Trägt einen weiteren Prüfungsversuch eines Moduls anhand des Namens ein.
+
+        Frühere Versuche bleiben erhalten, für Noten und ECTS zählt der beste bestandene
+        Versuch (siehe Module.add_attempt). Der Status folgt dem zählenden Versuch, eine
+        Korrektur am selben Tag von bestanden auf nicht bestanden öffnet das Modul wieder.
 
         Args:
             module_name (str): Name des Moduls.
             mark (float): Neue Note.
             date (datetime): Datum der bestandenen Prüfung.
         """
-        for semester in self.get_semester():
-            for module in semester.get_modules():
-                if module.get_name() == module_name:
-                    passed = mark <= 4.0
-                    module.create_or_update_performance(mark, date, passed)
-                    if passed:
-                        module.set_new_status("Abgeschlossen")
+        module = self.find_module(module_name)
+        if module is None:
+            return
+
+        old_state = module.get_state()
+        module.add_attempt(mark, date, mark <= 4.0)
+        performance = module.get_performance()
+        if performance is not None:
+            module.set_new_status("Abgeschlossen" if performance.get_passed() else "Offen")
+        self.get_module_index().update(module_name, old_state)
+
+    def get_module_index(self):
+        """
+        Gibt den Index über alle Module zurück und baut ihn bei Bedarf (neu) auf.
+
+        Der Index wird neu aufgebaut, wenn seit dem letzten Aufbau Module hinzugekommen sind.
+
+        Returns:
+            ModuleIndex: Indizes nach Name, Status, Semester, ECTS und Prüfungsdatum.
+        """
+        module_count = sum(len(semester.get_modules()) for semester in self.get_semester())
+        if self._module_index is None or self._module_index.get_module_count() != module_count:
+            self._module_index = ModuleIndex(self.get_semester())
+        return self._module_index
+
+    def find_module(self, module_name):
+        """
+        Sucht ein Modul anhand seines Namens.
+
+        Args:
+            module_name (str): Name des Moduls.
+
+        Returns:
+            Module or None: Das gefundene Modul oder None.
+        """
+        return self.get_module_index().get(module_name)
+
+    def get_semester_index(self, module_name):
+        """
+        Gibt den Index des Semesters zurück, zu dem ein Modul gehört.
+
+        Args:
+            module_name (str): Name des Moduls.
+
+        Returns:
+            int or None: Semesterindex (beginnend bei 0) oder None, wenn das Modul nicht existiert.
+        """
+        return self.get_module_index().get_semester_index(module_name)
+
+    def get_module_states(self):
+        """
+        Gibt den Zustand aller Module als Momentaufnahme zurück.
+
+        Returns:
+            dict: Modulname -> Zustandstupel (siehe Module.get_state).
+        """
+        return {
+            module.get_name(): module.get_state()
+            for semester in self.get_semester()
+            for module in semester.get_modules()
+        }
+
+    def restore_module_state(self, module_name, state):
+        """
+        Setzt ein Modul auf einen früheren Zustand zurück.
+
+        Args:
+            module_name (str): Name des Moduls.
+            state (tuple): Zustandstupel (siehe Module.get_state).
+        """
+        module = self.find_module(module_name)
+        if module is not None:
+            old_state = module.get_state()
+            module.restore_state(state)
+            self.get_module_index().update(module_name, old_state)
 
     def save_modules_csv(self, module_csv_path: str):
         """
         Speichert alle Modul-Informationen als CSV-Datei.
 
+        Die Zeilen werden einzeln in eine temporäre Datei geschrieben, ohne sie vorher
+        zu sammeln, die dann die alte Datei atomar ersetzt.
+
         Args:
             module_csv_path (str): Pfad zur Ausgabedatei.
         """
         try:
-            modules_data = []
-            for semester in self.get_semester():
-                for module in semester.get_modules():
-                    modules_data.append(module.to_dict())
-            df = pd.DataFrame(modules_data)
-            df.to_csv(module_csv_path, index=False)
+            with replace_atomically(module_csv_path) as temp_path:
+                write_rows(iter_module_rows(self), temp_path)
         except(IOError, OSError) as e:
             print(f"Fehler beim Schreiben der Datei '{module_csv_path}': {e}")
\ No newline at end of file
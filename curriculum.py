@@ -0,0 +1,332 @@
+import csv
+
+from course_of_study import CourseOfStudy
+from file_lock import replace_atomically
+from loader import CsvLoadError, LoadIssue, iter_typed_rows, load_course_of_study, parse_attempts, parse_date, parse_mark, parse_text, parse_yes_no
+from module import Module, format_attempts
+
+# --- Zuordnung der Modulzeilen zu den Semestern (beginnend bei 0) ---
+MODULE_INDICES_PER_SEMESTER = (
+    range(0, 6),   # Semester 1
+    range(6, 12),  # Semester 2
+    range(12, 18), # Semester 3
+    range(18, 24), # Semester 4
+    range(24, 30), # Semester 5
+    range(30, 33)  # Semester 6
+)
+
+OVERLAY_SCHEMA = {
+    "Name": parse_text,
+    "Status": parse_text,
+    "Note": parse_mark,
+    "Datum": parse_date,
+    "Bestanden": parse_yes_no,
+    "Versuche": parse_attempts,
+}
+
+
+class CurriculumModule:
+    """
+    Unveränderlicher Eintrag eines Moduls im Studienplan: Name, ECTS, Semester und Ausgangsstatus.
+    """
+    __slots__ = ("_name", "_ects", "_semester_index", "_status")
+
+    def __init__(self, name:str, ects:int, semester_index:int, status:str):
+        """
+        Args:
+            name (str): Name des Moduls.
+            ects (int): ECTS-Punkte.
+            semester_index (int): Index des Semesters (beginnend bei 0).
+            status (str): Status ohne Prüfungsleistung, z.B. "Offen".
+        """
+        self._name = name
+        self._ects = ects
+        self._semester_index = semester_index
+        self._status = status
+
+    def get_name(self):
+        """Gibt den Namen des Moduls zurück."""
+        return self._name
+
+    def get_ects(self):
+        """Gibt die ECTS-Punkte des Moduls zurück."""
+        return self._ects
+
+    def get_semester_index(self):
+        """Gibt den Semesterindex des Moduls zurück."""
+        return self._semester_index
+
+    def get_default_state(self):
+        """Gibt den Zustand ohne Prüfungsleistung zurück (siehe Module.get_state)."""
+        return (self._status, None, None, None, ())
+
+
+class CurriculumTemplate:
+    """
+    Gemeinsamer, unveränderlicher Studienplan aller Studierenden eines Studiengangs.
+
+    Enthält die Studiengangsdaten, die Semesterbezeichnungen und die Module mit
+    ECTS und Semesterzuordnung genau einmal. Pro Person wird nur ein StudentOverlay
+    mit den abweichenden Modulzuständen gespeichert.
+    """
+    def __init__(self, course_data:tuple, designations:tuple, modules:tuple):
+        """
+        Args:
+            course_data (tuple): (Name, Art, Titel, Gesamt-ECTS, Dauer, Start, Ende) wie bei CourseOfStudy.
+            designations (tuple): Semesterbezeichnungen.
+            modules (tuple): CurriculumModule-Objekte in Studienreihenfolge.
+        """
+        self._course_data = tuple(course_data)
+        self._designations = tuple(designations)
+        self._modules = tuple(modules)
+        self._modules_by_name = {module.get_name(): module for module in self._modules}
+
+    @classmethod
+    def from_course(cls, course):
+        """
+        Erstellt den Studienplan aus einem geladenen Studienverlauf, Prüfungsleistungen werden ignoriert.
+
+        Args:
+            course (CourseOfStudy): Studienverlauf, dessen Module den Plan bilden.
+
+        Returns:
+            CurriculumTemplate: Studienplan.
+        """
+        course_data = (
+            course.get_name(), course.get_type(), course.get_titel(), course.get_total_ects(),
+            course.get_duration(), course.get_start(), course.get_end()
+        )
+        designations = tuple(semester.get_designation() for semester in course.get_semester())
+        modules = tuple(
+            # --- Module mit Prüfungsleistung beginnen im Studienplan als offen ---
+            CurriculumModule(module.get_name(), module.get_ects(), semester_index,
+                             "Offen" if module.get_performance() is not None else module.get_status())
+            for semester_index, semester in enumerate(course.get_semester())
+            for module in semester.get_modules()
+        )
+        return cls(course_data, designations, modules)
+
+    def get_modules(self):
+        """Gibt alle Module des Studienplans in Studienreihenfolge zurück."""
+        return self._modules
+
+    def get_module(self, module_name):
+        """
+        Gibt einen Moduleintrag anhand des Namens zurück.
+
+        Returns:
+            CurriculumModule or None: Eintrag oder None, wenn das Modul nicht im Plan steht.
+        """
+        return self._modules_by_name.get(module_name)
+
+    def get_designations(self):
+        """Gibt die Semesterbezeichnungen zurück."""
+        return self._designations
+
+    def get_total_ects(self):
+        """Gibt die Gesamt-ECTS des Studiengangs zurück."""
+        return self._course_data[3]
+
+    def create_course(self, overlay=None):
+        """
+        Baut einen vollständigen Studienverlauf aus dem Plan und den Zuständen einer Person.
+
+        Namen und Bezeichnungen werden aus dem Plan übernommen und nicht kopiert.
+
+        Args:
+            overlay (StudentOverlay, optional): Abweichende Modulzustände der Person.
+
+        Returns:
+            CourseOfStudy: Studienverlauf der Person.
+        """
+        course = CourseOfStudy(*self._course_data, self._designations)
+        semesters = course.get_semester()
+        for entry in self._modules:
+            status, mark, date, passed, attempts = overlay.get_state(entry.get_name()) if overlay is not None else entry.get_default_state()
+            semesters[entry.get_semester_index()].add_module(Module(entry.get_name(), entry.get_ects(), status, mark, date, passed, attempts))
+        return course
+
+
+class StudentOverlay:
+    """
+    Modulzustände einer Person, soweit sie vom Studienplan abweichen.
+
+    Gespeichert werden nur Status und Prüfungsleistung geänderter Module, Speicher-
+    und Platzbedarf wachsen daher mit der Anzahl der Noten und nicht mit der Größe
+    des Studienplans.
+    """
+    def __init__(self, template:CurriculumTemplate, states:dict = None):
+        """
+        Args:
+            template (CurriculumTemplate): Zugehöriger Studienplan.
+            states (dict, optional): Modulname -> Zustandstupel (siehe Module.get_state).
+        """
+        self._template = template
+        self._states = {}
+        for module_name, state in (states or {}).items():
+            self.set_state(module_name, state)
+
+    @classmethod
+    def from_course(cls, template, course):
+        """
+        Ermittelt die Abweichungen eines Studienverlaufs vom Studienplan.
+
+        Args:
+            template (CurriculumTemplate): Studienplan.
+            course (CourseOfStudy): Studienverlauf der Person.
+
+        Returns:
+            StudentOverlay: Abweichende Modulzustände.
+        """
+        return cls(template, course.get_module_states())
+
+    def get_template(self):
+        """Gibt den zugehörigen Studienplan zurück."""
+        return self._template
+
+    def get_changed_states(self):
+        """
+        Gibt die abweichenden Modulzustände zurück.
+
+        Returns:
+            dict: Modulname -> Zustandstupel.
+        """
+        return dict(self._states)
+
+    def get_state(self, module_name):
+        """
+        Gibt den Zustand eines Moduls zurück, ohne Abweichung den des Studienplans.
+
+        Raises:
+            KeyError: Wenn das Modul nicht im Studienplan steht.
+        """
+        state = self._states.get(module_name)
+        if state is not None:
+            return state
+        return self._template_module(module_name).get_default_state()
+
+    def set_state(self, module_name, state):
+        """
+        Setzt den Zustand eines Moduls, entspricht er dem Studienplan, wird die Abweichung entfernt.
+
+        Raises:
+            KeyError: Wenn das Modul nicht im Studienplan steht.
+        """
+        if tuple(state) == self._template_module(module_name).get_default_state():
+            self._states.pop(module_name, None)
+        else:
+            self._states[module_name] = tuple(state)
+
+    def save_csv(self, path):
+        """
+        Speichert die abweichenden Modulzustände als CSV (Name, Status, Note, Datum, Bestanden, Versuche).
+
+        Die Kopfzeile wird auch ohne Abweichungen geschrieben. Die Datei wird atomar
+        ersetzt, Leser sehen also nie einen halb geschriebenen Stand.
+
+        Args:
+            path (str): Pfad zur Ausgabedatei.
+        """
+        try:
+            with replace_atomically(path) as temp_path, open(temp_path, "w", encoding="utf-8", newline="") as file:
+                writer = csv.DictWriter(file, fieldnames=list(OVERLAY_SCHEMA))
+                writer.writeheader()
+                writer.writerows(self._iter_rows())
+        except(IOError, OSError) as e:
+            print(f"Fehler beim Schreiben der Datei '{path}': {e}")
+
+    def _iter_rows(self):
+        """Liefert die abweichenden Zustände als CSV-Zeilen in Studienreihenfolge."""
+        for entry in self._template.get_modules():
+            state = self._states.get(entry.get_name())
+            if state is None:
+                continue
+            status, mark, date, passed, attempts = state
+            yield {
+                "Name": entry.get_name(),
+                "Status": status,
+                "Note": mark if mark is not None else "",
+                "Datum": date.strftime("%d.%m.%Y") if date is not None else "",
+                "Bestanden": "" if passed is None else ("Ja" if passed else "Nein"),
+                "Versuche": format_attempts(attempts) if len(attempts) > 1 else ""
+            }
+
+    def _template_module(self, module_name):
+        """Gibt den Moduleintrag des Studienplans zurück oder löst KeyError aus."""
+        entry = self._template.get_module(module_name)
+        if entry is None:
+            raise KeyError(f"Das Modul '{module_name}' steht nicht im Studienplan.")
+        return entry
+
+
+def load_curriculum_template(module_indices_per_semester=MODULE_INDICES_PER_SEMESTER, course_path="course_of_study.csv", semester_path="semester.csv", modules_path="modules.csv"):
+    """
+    Lädt den gemeinsamen Studienplan aus den CSV-Dateien.
+
+    Args:
+        module_indices_per_semester (sequence, optional): Pro Semester ein range der zugehörigen Modulzeilen.
+        course_path (str, optional): Pfad zur Studiengangsdatei.
+        semester_path (str, optional): Pfad zur Semesterdatei.
+        modules_path (str, optional): Pfad zur Moduldatei mit allen Modulen des Studiengangs.
+
+    Returns:
+        CurriculumTemplate: Studienplan.
+
+    Raises:
+        CsvLoadError: Wenn mindestens ein Fehler gefunden wurde.
+    """
+    course = load_course_of_study(module_indices_per_semester, course_path, semester_path, modules_path)
+    return CurriculumTemplate.from_course(course)
+
+
+def load_overlay(template, path):
+    """
+    Lädt die abweichenden Modulzustände einer Person.
+
+    Args:
+        template (CurriculumTemplate): Studienplan.
+        path (str): Pfad zur Overlay-Datei.
+
+    Returns:
+        StudentOverlay: Abweichende Modulzustände.
+
+    Raises:
+        CsvLoadError: Wenn die Datei fehlerhaft ist oder unbekannte Module enthält.
+    """
+    issues = []
+    states = {}
+    for row_number, _, values in iter_typed_rows(path, OVERLAY_SCHEMA, issues):
+        if template.get_module(values["Name"]) is None:
+            issues.append(LoadIssue(path, row_number, "Name", f"Das Modul '{values['Name']}' steht nicht im Studienplan."))
+            continue
+        states[values["Name"]] = _overlay_state(values)
+
+    if issues:
+        raise CsvLoadError(issues)
+    return StudentOverlay(template, states)
+
+
+def is_overlay_file(path):
+    """
+    Prüft anhand der Kopfzeile, ob eine Datei ein Overlay (ohne Spalte ECTS) statt einer vollständigen Moduldatei ist.
+
+    Args:
+        path (str): Pfad zur Datei.
+
+    Returns:
+        bool: True bei einer Overlay-Datei.
+    """
+    try:
+        with open(path, newline="", encoding="utf-8") as file:
+            header = next(csv.reader(file), [])
+    except (OSError, UnicodeDecodeError):
+        return False
+    return "ECTS" not in [name.strip() for name in header]
+
+
+def _overlay_state(values):
+    """Bildet aus einer Overlay-Zeile das Zustandstupel (siehe Module.get_state)."""
+    attempts = values["Versuche"]
+    if not attempts and values["Note"] is not None and values["Datum"] is not None and values["Bestanden"] is not None:
+        attempts = ((values["Note"], values["Datum"], values["Bestanden"]),)
+    return (values["Status"], values["Note"], values["Datum"], values["Bestanden"], attempts)
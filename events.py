@@ -0,0 +1,87 @@
+import threading
+
+
+class ModuleUpdated:
+    """
+    Ereignis: Die Prüfungsleistung oder der Status eines Moduls hat sich geändert.
+    """
+    def __init__(self, module_name:str, semester_index:int):
+        """
+        Args:
+            module_name (str): Name des geänderten Moduls.
+            semester_index (int): Index des Semesters, zu dem das Modul gehört (beginnend bei 0).
+        """
+        self.module_name = module_name
+        self.semester_index = semester_index
+
+
+class SemesterProgressChanged:
+    """
+    Ereignis: Die Anzahl offener/abgeschlossener Module eines Semesters hat sich geändert.
+    """
+    def __init__(self, semester_index:int):
+        """
+        Args:
+            semester_index (int): Index des betroffenen Semesters (beginnend bei 0).
+        """
+        self.semester_index = semester_index
+
+
+class MetricsChanged:
+    """
+    Ereignis: Die zusammenfassenden Kennzahlen (ECTS, Noten, Fortschritt) haben sich geändert.
+
+    Wird pro Änderung immer als letztes Ereignis veröffentlicht.
+    """
+    def __init__(self, version:int):
+        """
+        Args:
+            version (int): Versionsstand des Controllers nach der Änderung.
+        """
+        self.version = version
+
+
+class EventBus:
+    """
+    Einfacher Beobachter-Mechanismus zum Veröffentlichen typisierter Änderungsereignisse.
+
+    Abonnenten werden pro Ereignisklasse registriert und synchron im Thread des
+    Veröffentlichenden in Anmeldereihenfolge aufgerufen.
+    """
+    def __init__(self):
+        """Initialisiert einen Bus ohne Abonnenten."""
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type, callback):
+        """
+        Registriert einen Abonnenten für eine Ereignisklasse.
+
+        Args:
+            event_type (type): Ereignisklasse, z.B. ModuleUpdated.
+            callback (callable): Funktion, die mit dem Ereignis aufgerufen wird.
+        """
+        with self._lock:
+            # --- Liste ersetzen statt ändern, damit laufende publish-Aufrufe nicht gestört werden ---
+            self._subscribers[event_type] = self._subscribers.get(event_type, []) + [callback]
+
+    def unsubscribe(self, event_type, callback):
+        """
+        Entfernt einen zuvor registrierten Abonnenten.
+
+        Args:
+            event_type (type): Ereignisklasse.
+            callback (callable): Zuvor registrierte Funktion.
+        """
+        with self._lock:
+            self._subscribers[event_type] = [c for c in self._subscribers.get(event_type, []) if c != callback]
+
+    def publish(self, event):
+        """
+        Veröffentlicht ein Ereignis an alle Abonnenten seiner Klasse.
+
+        Args:
+            event: Ereignisobjekt.
+        """
+        for callback in self._subscribers.get(type(event), []):
+            callback(event)
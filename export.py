@@ -0,0 +1,250 @@
+import argparse
+import csv
+import gzip
+import json
+import os
+
+EXPORT_KINDS = ("modules", "results", "metrics")
+
+
+def iter_module_rows(course, student=None):
+    """
+    Liefert pro Modul eine Zeile im Format von modules.csv.
+
+    Args:
+        course (CourseOfStudy): Studienverlauf.
+        student (str, optional): Wird als erste Spalte "Student" vorangestellt.
+
+    Yields:
+        dict: Spaltenname -> Wert.
+    """
+    for semester in course.get_semester():
+        for module in semester.get_modules():
+            row = module.to_dict()
+            if student is not None:
+                row = {"Student": student, **row}
+            yield row
+
+
+def iter_exam_result_rows(course, student=None):
+    """
+    Liefert pro vorhandener Prüfungsleistung eine Zeile.
+
+    Args:
+        course (CourseOfStudy): Studienverlauf.
+        student (str, optional): Wird als erste Spalte "Student" vorangestellt.
+
+    Yields:
+        dict: Spaltenname -> Wert.
+    """
+    for semester in course.get_semester():
+        for module in semester.get_modules():
+            performance = module.get_performance()
+            if performance is None:
+                continue
+            row = {
+                "Semester": semester.get_designation(),
+                "Modul": module.get_name(),
+                "ECTS": module.get_ects(),
+                "Note": performance.get_mark(),
+                "Datum": performance.get_date().strftime("%d.%m.%Y"),
+                "Bestanden": "Ja" if performance.get_passed() else "Nein"
+            }
+            if student is not None:
+                row = {"Student": student, **row}
+            yield row
+
+
+def iter_metric_rows(course, student=None):
+    """
+    Liefert die berechneten Kennzahlen eines Studienverlaufs als eine Zeile pro Kennzahl.
+
+    Args:
+        course (CourseOfStudy): Studienverlauf.
+        student (str, optional): Wird als erste Spalte "Student" vorangestellt.
+
+    Yields:
+        dict: {"Kennzahl": ..., "Wert": ...}, ggf. mit "Student".
+    """
+    best_mark, worst_mark = course.get_best_worst_mark()
+    metrics = [
+        ("reached_ects", course.calculate_reached_ects()),
+        ("total_ects", course.get_total_ects()),
+        ("progress_percent", course.get_ects_progress()),
+        ("gpa", course.calculate_gpa()),
+        ("best_mark", best_mark),
+        ("worst_mark", worst_mark),
+        ("ects_this_month", course.get_ects_this_month()),
+        ("necessary_ects_pm", course.get_necessary_ects_pm())
+    ]
+    for name, value in metrics:
+        row = {"Kennzahl": name, "Wert": value}
+        if student is not None:
+            row = {"Student": student, **row}
+        yield row
+
+
+ROW_GENERATORS = {
+    "modules": iter_module_rows,
+    "results": iter_exam_result_rows,
+    "metrics": iter_metric_rows,
+}
+
+
+def iter_directory_rows(directory, kind, course_path="course_of_study.csv", semester_path="semester.csv"):
+    """
+    Liefert die Zeilen aller Studierenden eines Verzeichnisses nacheinander.
+
+    Jede *.csv-Datei im Verzeichnis ist die Moduldatei einer Person, entweder
+    vollständig oder als Overlay zum gemeinsamen Studienplan. Es ist immer nur
+    ein Studienverlauf gleichzeitig geladen, der Speicherbedarf hängt also nicht
+    von der Anzahl der Studierenden ab.
+
+    Args:
+        directory (str): Verzeichnis mit einer Moduldatei pro Person.
+        kind (str): "modules", "results" oder "metrics".
+        course_path (str, optional): Pfad zur gemeinsamen Studiengangsdatei.
+        semester_path (str, optional): Pfad zur gemeinsamen Semesterdatei.
+
+    Yields:
+        dict: Zeilen mit der Person als Spalte "Student".
+
+    Raises:
+        CsvLoadError: Wenn die Datei einer Person fehlerhaft ist.
+    """
+    # --- Lokaler Import: course_of_study nutzt dieses Modul zum Speichern ---
+    from curriculum import MODULE_INDICES_PER_SEMESTER, is_overlay_file, load_curriculum_template, load_overlay
+    from loader import load_course_of_study
+
+    generator = ROW_GENERATORS[kind]
+    with os.scandir(directory) as entries:
+        file_names = sorted(entry.name for entry in entries if entry.name.endswith(".csv"))
+
+    template = None
+    for file_name in file_names:
+        path = os.path.join(directory, file_name)
+        if is_overlay_file(path):
+            template = template or load_curriculum_template(MODULE_INDICES_PER_SEMESTER, course_path, semester_path)
+            course = template.create_course(load_overlay(template, path))
+        else:
+            course = load_course_of_study(MODULE_INDICES_PER_SEMESTER, course_path, semester_path, path)
+        yield from generator(course, os.path.splitext(file_name)[0])
+
+
+class CsvRowWriter:
+    """Schreibt Zeilen als CSV mit Komma als Trennzeichen (Format von modules.csv)."""
+    encoding = "utf-8"
+
+    def __init__(self, stream):
+        """
+        Args:
+            stream: Geöffneter Textstrom (mit newline="").
+        """
+        self._stream = stream
+        self._writer = None
+
+    def write(self, row):
+        """Schreibt eine Zeile, vor der ersten Zeile die Kopfzeile aus deren Spaltennamen."""
+        if self._writer is None:
+            self._writer = self.create_writer(list(row))
+            self._writer.writeheader()
+        self._writer.writerow(self.convert(row))
+
+    def create_writer(self, fieldnames):
+        """Erstellt den csv.DictWriter für die angegebenen Spalten."""
+        return csv.DictWriter(self._stream, fieldnames=fieldnames)
+
+    def convert(self, row):
+        """Bereitet die Werte einer Zeile für die Ausgabe auf."""
+        return row
+
+
+class ExcelCsvRowWriter(CsvRowWriter):
+    """Schreibt Zeilen als CSV, die ein deutsches Excel direkt öffnet: Semikolon, Dezimalkomma, BOM."""
+    encoding = "utf-8-sig"
+
+    def create_writer(self, fieldnames):
+        """Erstellt den csv.DictWriter mit Semikolon als Trennzeichen."""
+        return csv.DictWriter(self._stream, fieldnames=fieldnames, delimiter=";")
+
+    def convert(self, row):
+        """Schreibt Kommazahlen mit Dezimalkomma."""
+        return {key: str(value).replace(".", ",") if isinstance(value, float) else value for key, value in row.items()}
+
+
+class JsonLinesRowWriter:
+    """Schreibt Zeilen als JSON Lines, ein JSON-Objekt pro Zeile."""
+    encoding = "utf-8"
+
+    def __init__(self, stream):
+        """
+        Args:
+            stream: Geöffneter Textstrom.
+        """
+        self._stream = stream
+
+    def write(self, row):
+        """Schreibt eine Zeile als JSON-Objekt."""
+        self._stream.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+
+
+EXPORT_FORMATS = {
+    "csv": CsvRowWriter,
+    "excel-csv": ExcelCsvRowWriter,
+    "jsonl": JsonLinesRowWriter,
+}
+
+
+def write_rows(rows, path, export_format="csv", compress=False):
+    """
+    Schreibt Zeilen einzeln in eine Datei, ohne sie vorher zu sammeln.
+
+    Args:
+        rows (iterable): Zeilen als dict, alle mit denselben Spalten.
+        path (str): Pfad zur Ausgabedatei.
+        export_format (str, optional): "csv", "excel-csv" oder "jsonl".
+        compress (bool, optional): True, um gzip-komprimiert zu schreiben.
+
+    Returns:
+        int: Anzahl der geschriebenen Zeilen.
+    """
+    writer_class = EXPORT_FORMATS[export_format]
+    if compress:
+        # --- Stufe 6 statt 9: kaum größere Dateien bei deutlich höherem Durchsatz ---
+        stream = gzip.open(path, "wt", compresslevel=6, encoding=writer_class.encoding, newline="")
+    else:
+        stream = open(path, "w", encoding=writer_class.encoding, newline="")
+
+    count = 0
+    with stream:
+        writer = writer_class(stream)
+        for row in rows:
+            writer.write(row)
+            count += 1
+    return count
+
+
+def main():
+    """Kommandozeile: exportiert einen Studienverlauf oder ein ganzes Verzeichnis von Studierenden."""
+    parser = argparse.ArgumentParser(description="Exportiert Module, Prüfungsleistungen oder Kennzahlen.")
+    parser.add_argument("output", help="Ausgabedatei")
+    parser.add_argument("--kind", choices=EXPORT_KINDS, default="modules")
+    parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), default="csv")
+    parser.add_argument("--gzip", action="store_true", help="gzip-komprimiert schreiben")
+    parser.add_argument("--directory", help="Verzeichnis mit einer Moduldatei pro Person statt modules.csv")
+    args = parser.parse_args()
+
+    from curriculum import MODULE_INDICES_PER_SEMESTER
+    from loader import load_course_of_study
+
+    if args.directory:
+        rows = iter_directory_rows(args.directory, args.kind)
+    else:
+        rows = ROW_GENERATORS[args.kind](load_course_of_study(MODULE_INDICES_PER_SEMESTER))
+
+    count = write_rows(rows, args.output, args.format, args.gzip)
+    print(f"{count} Zeilen nach '{args.output}' exportiert.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+from contextlib import contextmanager
+import os
+import threading
+import time
+
+from tracing import TRACER
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+LOCK_SUFFIX = ".lock"
+
+# --- Wartezeit zwischen zwei Versuchen, wenn nur msvcrt (ohne blockierendes Warten) verfügbar ist ---
+POLL_INTERVAL = 0.005
+
+
+class FileLock:
+    """
+    Exklusive Sperre über Prozessgrenzen hinweg für eine gemeinsam genutzte Datei.
+
+    Gesperrt wird eine eigene Datei neben der Datei (path + ".lock"), nicht die
+    Datei selbst, denn diese wird beim Speichern per os.replace ausgetauscht. Unter
+    Unix dient fcntl.flock, unter Windows msvcrt.locking. Die Sperre ist beratend:
+    Sie schützt nur vor Prozessen, die ebenfalls FileLock verwenden. Die Wartezeit
+    wird als Phase "file_lock.wait" im Tracer erfasst.
+    """
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Pfad der zu schützenden Datei.
+        """
+        self._lock_path = path + LOCK_SUFFIX
+        self._thread_lock = threading.Lock()
+
+    def get_lock_path(self):
+        """Gibt den Pfad der Sperrdatei zurück."""
+        return self._lock_path
+
+    @contextmanager
+    def locked(self):
+        """
+        Kontextmanager, der die Sperre für die Dauer des Blocks hält.
+
+        Innerhalb eines Prozesses teilen sich alle Threads eines FileLock-Objekts
+        die Sperre nacheinander.
+        """
+        with TRACER.phase("file_lock.wait"):
+            self._thread_lock.acquire()
+            try:
+                file = open(self._lock_path, "a+b")
+                try:
+                    _lock(file)
+                except BaseException:
+                    file.close()
+                    raise
+            except BaseException:
+                self._thread_lock.release()
+                raise
+
+        try:
+            yield
+        finally:
+            try:
+                _unlock(file)
+            finally:
+                file.close()
+                self._thread_lock.release()
+
+
+@contextmanager
+def replace_atomically(path):
+    """
+    Kontextmanager für das Schreiben einer Datei, die Leser nie halb geschrieben sehen.
+
+    Der Block schreibt in eine temporäre Datei im selben Verzeichnis, die erst nach
+    erfolgreichem Ende per os.replace an die Stelle von path tritt. Leser erhalten
+    so ohne Sperre immer den alten oder den neuen Stand. Bei einem Fehler bleibt
+    path unverändert.
+
+    Args:
+        path (str): Pfad der Zieldatei.
+
+    Yields:
+        str: Pfad der temporären Datei.
+    """
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield temp_path
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _lock(file):
+    """Sperrt die geöffnete Sperrdatei exklusiv und wartet, bis das möglich ist."""
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        return
+    file.seek(0)
+    while True:
+        try:
+            msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+            return
+        except OSError:
+            time.sleep(POLL_INTERVAL)
+
+
+def _unlock(file):
+    """Gibt die Sperre der Sperrdatei frei."""
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        return
+    file.seek(0)
+    msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
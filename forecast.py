@@ -0,0 +1,159 @@
+from datetime import datetime
+import numpy as np
+
+# --- Mittlere Monatslänge in Tagen für die Umrechnung Monate -> Datum ---
+DAYS_PER_MONTH = 30.4375
+# --- Prognosen über 100 Jahre gelten als unbegrenzt ---
+MAX_FORECAST_MONTHS = 1200
+
+
+class GraduationForecast:
+    """
+    Prognostizierter Abschlusstermin eines Studienverlaufs mit Konfidenzgrenzen.
+    """
+    def __init__(self, expected:datetime, earliest:datetime, latest:datetime, velocity:float):
+        """
+        Args:
+            expected (datetime): Erwarteter Abschluss oder None, wenn keine Prognose möglich ist.
+            earliest (datetime): Frühester Abschluss (obere Konfidenzgrenze der Geschwindigkeit) oder None.
+            latest (datetime): Spätester Abschluss (untere Konfidenzgrenze der Geschwindigkeit) oder None, wenn unbegrenzt.
+            velocity (float): Bisherige ECTS pro Monat.
+        """
+        self._expected = expected
+        self._earliest = earliest
+        self._latest = latest
+        self._velocity = velocity
+
+    def get_expected(self):
+        """Gibt den erwarteten Abschlusstermin zurück."""
+        return self._expected
+
+    def get_earliest(self):
+        """Gibt den frühesten Abschlusstermin zurück."""
+        return self._earliest
+
+    def get_latest(self):
+        """Gibt den spätesten Abschlusstermin zurück."""
+        return self._latest
+
+    def get_velocity(self):
+        """Gibt die bisherige Geschwindigkeit in ECTS pro Monat zurück."""
+        return self._velocity
+
+
+class ForecastResult:
+    """
+    Ergebnis einer Prognose für eine ganze Kohorte als Arrays (eine Zeile pro Person).
+
+    Termine sind datetime64[D], NaT bedeutet, dass keine (bzw. keine begrenzte) Prognose möglich ist.
+    """
+    def __init__(self, velocity, expected, earliest, latest):
+        """
+        Args:
+            velocity (np.ndarray): ECTS pro Monat.
+            expected (np.ndarray): Erwartete Abschlusstermine.
+            earliest (np.ndarray): Früheste Abschlusstermine.
+            latest (np.ndarray): Späteste Abschlusstermine.
+        """
+        self.velocity = velocity
+        self.expected = expected
+        self.earliest = earliest
+        self.latest = latest
+
+    def get(self, index):
+        """
+        Gibt die Prognose einer einzelnen Person zurück.
+
+        Args:
+            index (int): Zeilenindex in der Kohorte.
+
+        Returns:
+            GraduationForecast: Prognose der Person.
+        """
+        return GraduationForecast(
+            _to_datetime(self.expected[index]),
+            _to_datetime(self.earliest[index]),
+            _to_datetime(self.latest[index]),
+            round(float(self.velocity[index]), 2)
+        )
+
+
+def forecast_completion(cohort, starts, total_ects, now=None, z=1.96):
+    """
+    Prognostiziert die Abschlusstermine einer ganzen Kohorte in einem vektorisierten Durchlauf.
+
+    Die Geschwindigkeit ist der Mittelwert der pro Kalendermonat erreichten ECTS seit
+    Studienstart (laufender Monat eingeschlossen). Aus der Streuung der Monatswerte
+    ergibt sich der Standardfehler, damit die Grenzen mean ± z·SE. Die fehlenden ECTS
+    geteilt durch die jeweilige Geschwindigkeit ergeben die verbleibenden Monate.
+
+    Args:
+        cohort (CohortArrays): Leistungen der Kohorte, Monate relativ zum jeweiligen Studienstart.
+        starts (list): Studienstart pro Person (datetime).
+        total_ects (int or list): Gesamt-ECTS, für alle gleich oder pro Person.
+        now (datetime, optional): Bezugszeitpunkt, standardmäßig jetzt.
+        z (float, optional): z-Wert des Konfidenzintervalls, standardmäßig 1.96 (95 %).
+
+    Returns:
+        ForecastResult: Prognosen für alle Personen.
+    """
+    now = now or datetime.now()
+    student_count = cohort.get_student_count()
+
+    start_months = np.fromiter((start.year * 12 + start.month for start in starts), dtype=np.int64, count=student_count)
+    elapsed = np.maximum(now.year * 12 + now.month - start_months + 1, 1)
+
+    # --- Erreichte ECTS pro Person und Kalendermonat ---
+    is_passed = (cohort.passed != 0) & (cohort.months >= 0)
+    rows, columns = np.nonzero(is_passed)
+    month_count = int(elapsed.max()) if student_count else 1
+    month_index = np.clip(cohort.months[rows, columns].astype(np.int64), 0, month_count - 1)
+    monthly = np.bincount(
+        rows * month_count + month_index,
+        weights=cohort.ects[columns].astype(np.float64),
+        minlength=student_count * month_count
+    ).reshape(student_count, month_count)
+
+    reached = monthly.sum(axis=1)
+    velocity = reached / elapsed
+
+    # --- Stichprobenvarianz der Monatswerte, bei nur einem Monat 100 % Unsicherheit ---
+    squares = (monthly ** 2).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = np.where(
+            elapsed > 1,
+            np.maximum(squares - elapsed * velocity ** 2, 0) / (elapsed - 1),
+            velocity ** 2
+        )
+    standard_error = np.sqrt(variance / elapsed)
+
+    missing = np.maximum(np.asarray(total_ects, dtype=np.float64) - reached, 0)
+    today = np.datetime64(now.date(), "D")
+
+    return ForecastResult(
+        velocity,
+        _completion_dates(today, missing, velocity),
+        _completion_dates(today, missing, velocity + z * standard_error),
+        _completion_dates(today, missing, velocity - z * standard_error)
+    )
+
+
+def _completion_dates(today, missing, velocity):
+    """Rechnet fehlende ECTS und Geschwindigkeit in Termine um, NaT bei Geschwindigkeit <= 0 oder unbegrenzter Dauer."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        months = np.where(missing == 0, 0.0, np.where(velocity > 0, missing / velocity, np.inf))
+
+    finite = months <= MAX_FORECAST_MONTHS
+    days = np.zeros(months.shape, dtype=np.int64)
+    days[finite] = np.rint(months[finite] * DAYS_PER_MONTH)
+
+    dates = today + days.astype("timedelta64[D]")
+    dates[~finite] = np.datetime64("NaT")
+    return dates
+
+
+def _to_datetime(value):
+    """Wandelt ein datetime64[D] in datetime um, NaT wird zu None."""
+    if np.isnat(value):
+        return None
+    return datetime.combine(value.astype(object), datetime.min.time())
@@ -1,28 +1,44 @@
 from datetime import datetime
+import threading
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.pyplot as plt
 from tkinter import ttk
 import tkinter as tk
 import tkinter.messagebox as mb
 
+from concurrency import ConcurrentChangeError
+from events import ModuleUpdated, SemesterProgressChanged, MetricsChanged
+from loader import CsvLoadError, check_mark
+from scheduler import RefreshScheduler
+from tab_cache import TabCache
+from tracing import TRACER
+
 class Gui:
     """
     Stellt die grafische Benutzeroberfläche für das Studien-Dashboard mit Tkinter bereit.
 
-    Visualisiert Fortschritt, Notenstatistiken, Semesterdiagramme und ermöglicht das Eintragen von Prüfungsleistungen.
+    Mehrere Studienverläufe werden als Reiter eines Notebooks angezeigt. Nur der
+    sichtbare Reiter baut sein Dashboard auf, verborgene Reiter sind einfache
+    Platzhalter. Es bleiben höchstens `max_built_tabs` Dashboards gleichzeitig
+    aufgebaut; das am längsten nicht genutzte wird bei Bedarf wieder freigegeben.
+    Warum das Budget eine Anzahl und keine Speichergröße ist, beschreibt TabCache.
     """
-    def __init__(self, root, course_of_study, controller):
+    def __init__(self, root, students, max_built_tabs=5):
         """
-        Initialisiert die GUI mit Root-Fenster, Studienverlauf und Controller.
+        Initialisiert die GUI mit Root-Fenster und den anzuzeigenden Studienverläufen.
 
         Args:
             root (tk.Tk): Das Hauptfenster der Anwendung.
-            course_of_study (CourseOfStudy): Studienverlaufsobjekt.
-            controller (Controller): Controller zur Steuerung der Logik.
+            students (list): Liste von (Reitertitel, Controller) pro Studienverlauf.
+            max_built_tabs (int, optional): Höchstzahl gleichzeitig aufgebauter Dashboards,
+                als Näherung für das Speicherbudget.
         """
         self._root = root
-        self._course_of_study = course_of_study
-        self.controller = controller
+        self._students = students
+
+        # --- Aufgebaute Dashboards pro Reiterindex in Reihenfolge der letzten Nutzung ---
+        self._dashboards = TabCache(max_built_tabs)
+        self._tab_frames = []
 
         # --- Bildschirmgröße holen ---
         self.screen_width = self.get_root().winfo_screenwidth()
@@ -31,24 +47,12 @@ class Gui:
         # --- Anpassung von tkinter ---
         self.tk_settings()
 
-        # --- Progressbar ---
-        self.create_progressbar()
-        
-        # --- Tabelle 1 ---
-        self.create_table1()
-       
-        # --- Tabelle 2 ---
-        self.create_table2()
-        
-        # --- Tabelle für Semester 1 - 3 ---
-        self.create_table3()
-
-        # --- Tabelle für Semester 4 - 6 ---
-        self.create_table4()
+        # --- Reiter für alle Studienverläufe ---
+        self.create_notebook()
 
-        # --- Hinzufügen Knopf ---
-        self.add_performance_button = tk.Button(self._root, text="Hinzufügen", command=self.add_performance)
-        self.add_performance_button.pack()
+        # --- Datumsabhängige Kennzahlen zu jeder Tagesgrenze aktualisieren ---
+        self.refresh_scheduler = RefreshScheduler(self.get_root(), self.on_date_changed)
+        self.refresh_scheduler.start()
 
         # --- Sicheres Schließen ---
         self._root.protocol("WM_DELETE_WINDOW", self.on_closing)
@@ -69,13 +73,179 @@ class Gui:
         """Konfiguriert grundlegende Einstellungen des Hauptfensters."""
         self.get_root().title("Dashboard")
         self.get_root().geometry(f"{self.screen_width}x{self.screen_height}+0+0")
-        self.get_root().state("zoomed")
+        try:
+            self.get_root().state("zoomed")
+        except tk.TclError:
+            # --- "zoomed" gibt es nur unter Windows/macOS, unter X11 das Attribut versuchen ---
+            try:
+                self.get_root().attributes("-zoomed", True)
+            except tk.TclError:
+                pass
         self.get_root().configure(bg="Gray")
-    
+
+    def create_notebook(self):
+        """Erstellt das Notebook mit einem Platzhalter-Reiter pro Studienverlauf."""
+        self.notebook = ttk.Notebook(self.get_root())
+        self.notebook.pack(expand=True, fill=tk.BOTH)
+
+        for title, controller in self._students:
+            tab_frame = tk.Frame(self.notebook, bg="Gray")
+            self.create_placeholder(tab_frame)
+            self.notebook.add(tab_frame, text=title)
+            self._tab_frames.append(tab_frame)
+
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        if self._students:
+            self.show_tab(0)
+
+    def create_placeholder(self, tab_frame):
+        """
+        Füllt einen Reiter mit einem leichtgewichtigen Platzhalter.
+
+        Args:
+            tab_frame (tk.Frame): Frame des Reiters.
+        """
+        tk.Label(tab_frame, text="Wird geladen …", bg="Gray", font=("Arial", 12)).pack(pady=40)
+
+    def on_tab_changed(self, event):
+        """Baut beim Reiterwechsel das Dashboard des sichtbaren Reiters auf."""
+        self.show_tab(self.notebook.index("current"))
+
+    def show_tab(self, index):
+        """
+        Stellt sicher, dass das Dashboard eines Reiters aufgebaut ist, und markiert es als zuletzt genutzt.
+
+        Args:
+            index (int): Reiterindex (beginnend bei 0).
+        """
+        if self._dashboards.touch(index):
+            return
+
+        tab_frame = self._tab_frames[index]
+        for child in tab_frame.winfo_children():
+            child.destroy()
+
+        title, controller = self._students[index]
+        self._dashboards.add(index, CourseDashboard(tab_frame, self, controller))
+        self.release_unused_tabs()
+
+    def release_unused_tabs(self):
+        """Gibt die am längsten nicht genutzten Dashboards frei, bis das Budget eingehalten ist."""
+        for index, dashboard in self._dashboards.pop_unused():
+            dashboard.release()
+            self.create_placeholder(self._tab_frames[index])
+
+    def get_dashboard(self, index=None):
+        """
+        Gibt das aufgebaute Dashboard eines Reiters zurück.
+
+        Args:
+            index (int, optional): Reiterindex, standardmäßig der sichtbare Reiter.
+
+        Returns:
+            CourseDashboard or None: Dashboard oder None, wenn der Reiter nur ein Platzhalter ist.
+        """
+        if index is None:
+            index = self.notebook.index("current")
+        return self._dashboards.get(index)
+
+    def on_date_changed(self, now, month_changed):
+        """
+        Aktualisiert bei einem Datumswechsel die datumsabhängigen Werte aller aufgebauten Dashboards.
+
+        Platzhalter-Reiter rechnen ohnehin beim Aufbau mit dem dann aktuellen Datum.
+
+        Args:
+            now (datetime): Gemeinsamer Bezugszeitpunkt dieser Aktualisierung.
+            month_changed (bool): True, wenn zugleich ein neuer Monat begonnen hat.
+        """
+        for dashboard in self._dashboards.get_dashboards():
+            dashboard.refresh_time_metrics(now)
+
+    def get_built_tab_count(self):
+        """Gibt die Anzahl der aktuell aufgebauten Dashboards zurück."""
+        return len(self._dashboards)
+
+    def on_closing(self):
+        """Verarbeitet das sichere Beenden des Programms, bei aktivem Tracing mit Laufzeitbericht."""
+        self.refresh_scheduler.stop()
+        if TRACER.enabled:
+            print(TRACER.report())
+        self.get_root().quit()
+        self.get_root().destroy()
+
+    def run(self):
+        """Startet die Tkinter-Hauptschleife."""
+        self._root.mainloop()
+
+
+class CourseDashboard:
+    """
+    Dashboard eines einzelnen Studienverlaufs innerhalb eines Reiters.
+
+    Visualisiert Fortschritt, Notenstatistiken, Semesterdiagramme und ermöglicht das Eintragen von Prüfungsleistungen.
+
+    Die Anzeige abonniert die Änderungsereignisse des Controllers und aktualisiert nur
+    die betroffenen Widgets an Ort und Stelle, statt alles neu aufzubauen.
+    """
+    def __init__(self, master, gui, controller):
+        """
+        Baut das Dashboard im übergebenen Frame auf.
+
+        Args:
+            master (tk.Frame): Frame des Reiters.
+            gui (Gui): Übergeordnetes Fenster.
+            controller (Controller): Controller zur Steuerung der Logik.
+        """
+        self._master = master
+        self._gui = gui
+        self.controller = controller
+        self._released = False
+
+        # --- Kuchendiagramme pro Semesterzahl: (Figure, Axes, Canvas) ---
+        self.pie_charts = {}
+
+        # --- Anzahl neu gezeichneter Widgets der laufenden bzw. letzten Aktualisierung ---
+        self._redraw_count = 0
+        self._last_redraw_count = 0
+
+        # --- Progressbar ---
+        self.create_progressbar()
+        
+        # --- Tabelle 1 ---
+        self.create_table1()
+       
+        # --- Tabelle 2 ---
+        self.create_table2()
+        
+        # --- Tabelle für Semester 1 - 3 ---
+        self.create_table3()
+
+        # --- Tabelle für Semester 4 - 6 ---
+        self.create_table4()
+
+        # --- Knöpfe: Hinzufügen, Rückgängig, Wiederholen ---
+        self.create_buttons()
+
+        # --- Änderungsereignisse abonnieren ---
+        self.subscribe_events()
+
+    def get_root(self):
+        """Gibt das Root-Fenster zurück."""
+        return self._gui.get_root()
+
+    def get_screen_width(self):
+        """Gibt die Bildschirmbreite zurück."""
+        return self._gui.get_screen_width()
+
+    def get_screen_height(self):
+        """Gibt die Bildschirmhöhe zurück."""
+        return self._gui.get_screen_height()
+
     def create_progressbar(self):
         """Erstellt und konfiguriert die Fortschrittsanzeige (ECTS)."""
         self.progress_bar = ttk.Progressbar(
-            self.get_root(), 
+            self._master, 
             orient="horizontal", 
             length=self.get_screen_width() * 0.9, 
             mode="determinate", 
@@ -85,7 +255,7 @@ class Gui:
         self.progress_bar.pack(pady=20)
 
         self.progress_label = tk.Label(
-            self.get_root(), 
+            self._master, 
             text=(f"{self.controller.get_metrics()['progress_percent']}%"),
             font=("Arial", 10, "bold")
         )
@@ -110,41 +280,93 @@ class Gui:
         Args:
             values (list): Liste der Werte.
             table_frame (tk.Frame): Ziel-Frame für die Werte.
+
+        Returns:
+            list: Die erstellten Labels in Spaltenreihenfolge.
         """
+        labels = []
         for col, text in enumerate(values):
             label = tk.Label(table_frame, text=text, font=("Arial", 11), padx=10, pady=5)
             label.grid(row=1, column=col, sticky="nsew")
+            labels.append(label)
+        return labels
 
+    def update_table_values(self, labels, values):
+        """
+        Aktualisiert die Werte einer Tabelle an Ort und Stelle.
+
+        Args:
+            labels (list): Labels aus table_values_config.
+            values (list): Neue Werte in Spaltenreihenfolge.
+
+        Returns:
+            int: Anzahl der tatsächlich geänderten Labels.
+        """
+        changed = 0
+        for label, value in zip(labels, values):
+            if label.cget("text") != str(value):
+                label.config(text=value)
+                changed += 1
+        return changed
+
+    @TRACER.traced("gui.create_table1")
     def create_table1(self):
         """Erstellt Tabelle 1 mit allgemeinen Studienfortschrittsdaten."""
         if hasattr(self, 'table1_frame'):
             self.table1_frame.destroy()
-        self.table1_frame = tk.Frame(self._root)
+        self.table1_frame = tk.Frame(self._master)
         self.table1_frame.pack(pady=20)
 
         headers = [
             "Verbleibende Zeit", 
             "Erreichte ECTS", 
             "Notwendige ECTS pro Monat", 
-            "Diesen Monat erreichte ECTS"
+            "Diesen Monat erreichte ECTS",
+            "Prognostizierter Abschluss"
         ]
 
         self.table_header_config(headers, self.table1_frame)
 
+        self.table1_labels = self.table_values_config(self.table1_values(), self.table1_frame)
+
+    def table1_values(self):
+        """Gibt die Werte für Tabelle 1 zurück."""
+        metrics = self.controller.get_metrics()
+        time_metrics = self.controller.get_time_metrics()
+        return [
+            time_metrics["time_left"],
+            f"{metrics['reached_ects']}/{metrics['total_ects']}",
+            time_metrics["necessary_ects_pm"],
+            time_metrics["ects_this_month"],
+            time_metrics["graduation_forecast"]
+        ]
+
+    def refresh_time_metrics(self, now):
+        """
+        Aktualisiert nur die datumsabhängigen Werte von Tabelle 1.
+
+        Args:
+            now (datetime): Gemeinsamer Bezugszeitpunkt aller Kennzahlen.
+
+        Returns:
+            int: Anzahl der tatsächlich geänderten Labels.
+        """
+        time_metrics = self.controller.get_time_metrics(now)
+        labels = [self.table1_labels[column] for column in (0, 2, 3, 4)]
         values = [
-            self.controller.time_left_display(),
-            f"{self.controller.get_metrics()['reached_ects']}/{self.controller.get_metrics()['total_ects']}",
-            self.controller.get_metrics()["necessary_ects_pm"],
-            self.controller.get_metrics()["ects_this_month"]
+            time_metrics["time_left"],
+            time_metrics["necessary_ects_pm"],
+            time_metrics["ects_this_month"],
+            time_metrics["graduation_forecast"]
         ]
-        
-        self.table_values_config(values, self.table1_frame)
+        return self.update_table_values(labels, values)
 
+    @TRACER.traced("gui.create_table2")
     def create_table2(self):
         """Erstellt Tabelle 2 mit Notenstatistiken."""
         if hasattr(self, 'table2_frame'):
             self.table2_frame.destroy()   
-        self.table2_frame = tk.Frame(self._root)
+        self.table2_frame = tk.Frame(self._master)
         self.table2_frame.pack(pady=20)
 
         headers = [
@@ -156,20 +378,24 @@ class Gui:
 
         self.table_header_config(headers, self.table2_frame)
         
-        values = [
-            self.controller.get_metrics()["gpa"],
-            self.controller.get_metrics()["best_mark"],
-            self.controller.get_metrics()["worst_mark"],
+        self.table2_labels = self.table_values_config(self.table2_values(), self.table2_frame)
+
+    def table2_values(self):
+        """Gibt die Werte für Tabelle 2 zurück."""
+        metrics = self.controller.get_metrics()
+        return [
+            metrics["gpa"],
+            metrics["best_mark"],
+            metrics["worst_mark"],
             self.controller.next_mark_setting()
         ]
 
-        self.table_values_config(values, self.table2_frame)
-
+    @TRACER.traced("gui.create_table3")
     def create_table3(self):
         """Erstellt Kuchendiagramme für Semester 1–3."""
         if hasattr(self, 'table3_frame'):
             self.table3_frame.destroy() 
-        self.table3_frame = tk.Frame(self._root)
+        self.table3_frame = tk.Frame(self._master)
         self.table3_frame.pack(pady=20, fill=tk.BOTH)
 
         canvas1 = self.pie_diagram(1, self.table3_frame)
@@ -180,11 +406,12 @@ class Gui:
         canvas2.get_tk_widget().pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
         canvas3.get_tk_widget().pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
 
+    @TRACER.traced("gui.create_table4")
     def create_table4(self):
         """Erstellt Kuchendiagramme für Semester 4–6."""
         if hasattr(self, 'table4_frame'):
             self.table4_frame.destroy()
-        self.table4_frame = tk.Frame(self._root)
+        self.table4_frame = tk.Frame(self._master)
         self.table4_frame.pack(pady=20, fill=tk.BOTH)
 
         canvas1 = self.pie_diagram(4, self.table4_frame)
@@ -195,6 +422,48 @@ class Gui:
         canvas2.get_tk_widget().pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
         canvas3.get_tk_widget().pack(side=tk.LEFT, expand=True, fill=tk.BOTH)
 
+    def create_buttons(self):
+        """Erstellt die Knöpfe zum Hinzufügen, Rückgängigmachen und Wiederholen von Noten."""
+        self.button_frame = tk.Frame(self._master, bg="Gray")
+        self.button_frame.pack()
+
+        self.add_performance_button = tk.Button(self.button_frame, text="Hinzufügen", command=self.add_performance)
+        self.add_performance_button.pack(side=tk.LEFT, padx=5)
+
+        self.undo_button = tk.Button(self.button_frame, text="Rückgängig", command=self.undo)
+        self.undo_button.pack(side=tk.LEFT, padx=5)
+
+        self.redo_button = tk.Button(self.button_frame, text="Wiederholen", command=self.redo)
+        self.redo_button.pack(side=tk.LEFT, padx=5)
+
+        self.update_buttons()
+
+    def update_buttons(self):
+        """Aktiviert bzw. deaktiviert Rückgängig/Wiederholen je nach Änderungshistorie."""
+        self.undo_button.config(state=tk.NORMAL if self.controller.can_undo() else tk.DISABLED)
+        self.redo_button.config(state=tk.NORMAL if self.controller.can_redo() else tk.DISABLED)
+
+    def undo(self):
+        """Macht die letzte Notenänderung rückgängig, die Anzeige folgt über die Änderungsereignisse."""
+        try:
+            self.controller.undo()
+        except ConcurrentChangeError as e:
+            mb.showerror("Fehler", f"{e}\nDie Änderung kann nicht mehr rückgängig gemacht werden.")
+            self.update_buttons()
+        except CsvLoadError as e:
+            mb.showerror("Fehler", f"Die Änderung wurde nicht rückgängig gemacht.\n{e.report()}")
+
+    def redo(self):
+        """Wiederholt die zuletzt rückgängig gemachte Notenänderung, die Anzeige folgt über die Änderungsereignisse."""
+        try:
+            self.controller.redo()
+        except ConcurrentChangeError as e:
+            mb.showerror("Fehler", f"{e}\nDie Änderung kann nicht mehr wiederholt werden.")
+            self.update_buttons()
+        except CsvLoadError as e:
+            mb.showerror("Fehler", f"Die Änderung wurde nicht wiederholt.\n{e.report()}")
+
+    @TRACER.traced("gui.pie_diagram")
     def pie_diagram(self, semester_number, master):
         """
         Erstellt ein Kuchendiagramm für ein bestimmtes Semester.
@@ -206,10 +475,30 @@ class Gui:
         Returns:
             FigureCanvasTkAgg: Das Canvas-Objekt mit dem Diagramm.
         """
-        semester_number = semester_number - 1
         fig, ax = plt.subplots(figsize=(4, 3))  
         fig.patch.set_facecolor('Gray')         
 
+        self.draw_pie(semester_number, ax)
+
+        canvas = FigureCanvasTkAgg(fig, master=master)
+        with TRACER.phase("gui.canvas.draw"):
+            canvas.draw()
+        canvas.get_tk_widget().configure(bg='Gray')  
+        plt.close(fig)
+
+        self.pie_charts[semester_number] = (fig, ax, canvas)
+        return canvas
+
+    def draw_pie(self, semester_number, ax):
+        """
+        Zeichnet den Inhalt eines Kuchendiagramms in die übergebenen Achsen.
+
+        Args:
+            semester_number (int): Semesterzahl (1–6).
+            ax (matplotlib.axes.Axes): Zielachsen.
+        """
+        semester_number = semester_number - 1
+
         werte = [
             self.controller.get_semester_progress(semester_number)[0],
             self.controller.get_semester_progress(semester_number)[1]
@@ -228,11 +517,18 @@ class Gui:
 
         ax.axis('equal')
 
-        canvas = FigureCanvasTkAgg(fig, master=master)
-        canvas.draw()
-        canvas.get_tk_widget().configure(bg='Gray')  
-        plt.close(fig)
-        return canvas
+    def redraw_pie(self, semester_number):
+        """
+        Zeichnet ein bestehendes Kuchendiagramm neu, ohne das Canvas zu ersetzen.
+
+        Args:
+            semester_number (int): Semesterzahl (1–6).
+        """
+        fig, ax, canvas = self.pie_charts[semester_number]
+        ax.clear()
+        self.draw_pie(semester_number, ax)
+        with TRACER.phase("gui.canvas.draw"):
+            canvas.draw()
     
     def add_performance(self):
         """Öffnet ein Eingabefenster zum Hinzufügen einer neuen Prüfungsleistung."""
@@ -274,15 +570,19 @@ class Gui:
         module_name = self.combo.get()
         try:
             mark_input = self.entry_mark.get().replace(",", ".")
-            mark = float(mark_input)
+            mark = check_mark(float(mark_input))
             date = datetime.strptime(self.entry_date.get(), "%d.%m.%Y")
         except Exception as e:
             mb.showerror("Fehler", f"Ungültige Eingabe: {e}")
             return
 
-        self.controller.update_performance(module_name, mark, date)
-        self.top.destroy()
-        self.update_display()
+        # --- Die Anzeige aktualisiert sich synchron über die Ereignisse, gemessen wird also bis zum fertigen Bild ---
+        with TRACER.phase("gui.save"):
+            self.top.destroy()
+            try:
+                self.controller.update_performance(module_name, mark, date)
+            except CsvLoadError as e:
+                mb.showerror("Fehler", f"Die Note wurde nicht gespeichert.\n{e.report()}")
 
     def top_settings(self):
         """Konfiguriert das Eingabefenster zum Hinzufügen neuer Leistungen."""
@@ -296,8 +596,89 @@ class Gui:
         self.top.geometry(f"{width}x{height}+{x}+{y}")
         self.top.configure(bg="Lightgray")
 
+    def subscribe_events(self):
+        """Registriert die Anzeige für die Änderungsereignisse des Controllers."""
+        self._subscriptions = [
+            (ModuleUpdated, lambda event: self.on_ui_thread(self.on_module_updated, event)),
+            (SemesterProgressChanged, lambda event: self.on_ui_thread(self.on_semester_progress_changed, event)),
+            (MetricsChanged, lambda event: self.on_ui_thread(self.on_metrics_changed, event))
+        ]
+        bus = self.controller.get_event_bus()
+        for event_type, callback in self._subscriptions:
+            bus.subscribe(event_type, callback)
+
+    def release(self):
+        """
+        Gibt alle Widgets und Diagramme des Dashboards frei und meldet die Ereignisse ab.
+
+        Der Frame selbst bleibt bestehen und kann danach einen Platzhalter aufnehmen.
+        """
+        bus = self.controller.get_event_bus()
+        for event_type, callback in self._subscriptions:
+            bus.unsubscribe(event_type, callback)
+        self._subscriptions = []
+
+        if hasattr(self, 'top') and self.top.winfo_exists():
+            self.top.destroy()
+
+        for child in self._master.winfo_children():
+            child.destroy()
+        self.pie_charts = {}
+        self._released = True
+
+    def on_ui_thread(self, handler, event):
+        """
+        Führt einen Ereignis-Handler im Tkinter-Hauptthread aus.
+
+        Ereignisse aus Hintergrund-Threads werden per root.after eingereiht,
+        da Tkinter-Widgets nur aus dem Hauptthread verändert werden dürfen.
+        Nach release() eingetroffene Ereignisse werden verworfen.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            self.get_root().after(0, self.on_ui_thread, handler, event)
+        elif not self._released:
+            handler(event)
+
+    def on_module_updated(self, event):
+        """
+        Geänderte Module erfordern keinen eigenen Neuaufbau, Diagramme und Tabellen folgen über die weiteren Ereignisse.
+
+        Der Zähler wird hier nicht zurückgesetzt, da eine Änderung (z.B. apply_results oder
+        aus der Datei übernommene Module) mehrere ModuleUpdated vor einem MetricsChanged sendet.
+        """
+
+    @TRACER.traced("gui.on_semester_progress_changed")
+    def on_semester_progress_changed(self, event):
+        """Zeichnet nur das Kuchendiagramm des betroffenen Semesters neu."""
+        semester_number = event.semester_index + 1
+        if semester_number in self.pie_charts:
+            self.redraw_pie(semester_number)
+            self._redraw_count += 1
+
+    @TRACER.traced("gui.on_metrics_changed")
+    def on_metrics_changed(self, event):
+        """Aktualisiert Fortschrittsanzeige, Tabellen 1 und 2 und Knöpfe an Ort und Stelle."""
+        self._redraw_count += self.update_progressbar()
+        self._redraw_count += self.update_table_values(self.table1_labels, self.table1_values())
+        self._redraw_count += self.update_table_values(self.table2_labels, self.table2_values())
+        self.update_buttons()
+
+        # --- MetricsChanged ist immer das letzte Ereignis einer Änderung und schließt die Zählung ab ---
+        self._last_redraw_count = self._redraw_count
+        self._redraw_count = 0
+
+    def get_last_redraw_count(self):
+        """
+        Gibt zurück, wie viele Widgets bei der letzten Änderung neu gezeichnet wurden.
+
+        Returns:
+            int: Anzahl neu gezeichneter Widgets.
+        """
+        return self._last_redraw_count
+
+    @TRACER.traced("gui.update_display")
     def update_display(self):
-        """Aktualisiert alle GUI-Komponenten nach Änderungen."""
+        """Baut alle GUI-Komponenten vollständig neu auf."""
         self.update_progressbar()
 
         # --- Lösche Tabellen-Frames ---
@@ -305,9 +686,9 @@ class Gui:
             if hasattr(self, table_frame_attr):
                 getattr(self, table_frame_attr).destroy()
 
-        # --- Lösche auch den Hinzufügen-Button ---
-        if hasattr(self, 'add_performance_button'):
-            self.add_performance_button.pack_forget()
+        # --- Lösche auch die Knöpfe ---
+        if hasattr(self, 'button_frame'):
+            self.button_frame.pack_forget()
 
         # --- Neu erstellen ---
         self.create_table1()
@@ -315,25 +696,30 @@ class Gui:
         self.create_table3()
         self.create_table4()
 
-        # --- Button wieder ganz unten hinzufügen ---
-        self.add_performance_button.pack()
+        # --- Knöpfe wieder ganz unten hinzufügen ---
+        self.button_frame.pack()
+        self.update_buttons()
 
     def update_progressbar(self):
-        """Aktualisiert die Fortschrittsanzeige (ECTS + Prozentanzeige)."""
-        reached = self.controller.get_metrics()["reached_ects"]
-        total = self.controller.get_metrics()["total_ects"]
-        progress_percent = self.controller.get_metrics()["progress_percent"]
-
-        self.progress_bar['value'] = reached
-        self.progress_bar['maximum'] = total
-
-        self.progress_label.config(text=f"{progress_percent}%")
-
-    def on_closing(self):
-        """Verarbeitet das sichere Beenden des Programms."""
-        self.get_root().quit()
-        self.get_root().destroy()
+        """
+        Aktualisiert die Fortschrittsanzeige (ECTS + Prozentanzeige).
 
-    def run(self):
-        """Startet die Tkinter-Hauptschleife."""
-        self._root.mainloop()
\ No newline at end of file
+        Returns:
+            int: Anzahl der tatsächlich geänderten Widgets (0 bis 2).
+        """
+        metrics = self.controller.get_metrics()
+        reached = metrics["reached_ects"]
+        total = metrics["total_ects"]
+        progress_percent = metrics["progress_percent"]
+
+        changed = 0
+        if float(self.progress_bar['value']) != reached or float(self.progress_bar['maximum']) != total:
+            self.progress_bar['value'] = reached
+            self.progress_bar['maximum'] = total
+            changed += 1
+
+        if self.progress_label.cget("text") != f"{progress_percent}%":
+            self.progress_label.config(text=f"{progress_percent}%")
+            changed += 1
+
+        return changed
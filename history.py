@@ -0,0 +1,429 @@
+from bisect import bisect_right
+from datetime import datetime
+import json
+import os
+
+from loader import LoadIssue
+
+HISTORY_SUFFIX = ".history"
+
+
+class GradeEvent:
+    """
+    Repräsentiert eine einzelne Änderung an der Prüfungsleistung eines Moduls.
+
+    Ein Ereignis speichert den Zustand des Moduls vor und nach der Änderung
+    (siehe Module.get_state) und ist nach dem Erstellen unveränderlich.
+    """
+    def __init__(self, sequence:int, timestamp:datetime, module_name:str, old_state:tuple, new_state:tuple, kind:str):
+        """
+        Initialisiert ein neues GradeEvent.
+
+        Args:
+            sequence (int): Laufende Nummer des Ereignisses (beginnend bei 0).
+            timestamp (datetime): Zeitpunkt der Änderung.
+            module_name (str): Name des betroffenen Moduls.
+            old_state (tuple): Zustand vor der Änderung.
+            new_state (tuple): Zustand nach der Änderung.
+            kind (str): Art des Ereignisses ("Eintrag", "Rückgängig", "Wiederholen" oder "Übernommen").
+        """
+        self._sequence = sequence
+        self._timestamp = timestamp
+        self._module_name = module_name
+        self._old_state = old_state
+        self._new_state = new_state
+        self._kind = kind
+
+    def get_sequence(self):
+        """Gibt die laufende Nummer des Ereignisses zurück."""
+        return self._sequence
+
+    def get_timestamp(self):
+        """Gibt den Zeitpunkt der Änderung zurück."""
+        return self._timestamp
+
+    def get_module_name(self):
+        """Gibt den Namen des betroffenen Moduls zurück."""
+        return self._module_name
+
+    def get_old_state(self):
+        """Gibt den Zustand des Moduls vor der Änderung zurück."""
+        return self._old_state
+
+    def get_new_state(self):
+        """Gibt den Zustand des Moduls nach der Änderung zurück."""
+        return self._new_state
+
+    def get_kind(self):
+        """Gibt die Art des Ereignisses zurück."""
+        return self._kind
+
+
+class GradeHistory:
+    """
+    Ereignisprotokoll aller Notenänderungen mit Rückgängig/Wiederholen und Zeitreisen.
+
+    Jede Änderung wird als GradeEvent angehängt, das Protokoll wird nie überschrieben.
+    Rückgängig und Wiederholen erzeugen selbst ausgleichende Ereignisse, sodass der
+    Studienverlauf zu jedem vergangenen Zeitpunkt exakt rekonstruiert werden kann.
+    Alle `snapshot_interval` Ereignisse wird eine Momentaufnahme aller Modulzustände
+    abgelegt, eine Zeitreise spielt daher höchstens `snapshot_interval` Ereignisse ab.
+
+    Mit `path` wird das Protokoll als JSON-Lines-Datei fortgeschrieben (Beginn,
+    Ereignisse, Momentaufnahmen) und beim nächsten Start wieder geladen, sodass
+    Zeitreisen auch über Neustarts hinweg möglich sind. Rückgängig und Wiederholen
+    beziehen sich nur auf die Änderungen der laufenden Sitzung. Schreiben mehrere
+    Prozesse in dieselbe Datei, müssen sie vor jeder Änderung sync() aufrufen und
+    beides unter einer gemeinsamen Sperre tun (siehe Controller).
+    """
+    def __init__(self, initial_states:dict, snapshot_interval:int = 50, start:datetime = None, path:str = None):
+        """
+        Initialisiert das Protokoll mit dem Ausgangszustand aller Module.
+
+        Args:
+            initial_states (dict): Modulname -> Zustandstupel zum Startzeitpunkt.
+            snapshot_interval (int, optional): Anzahl Ereignisse zwischen zwei Momentaufnahmen.
+            start (datetime, optional): Zeitpunkt des Ausgangszustands, standardmäßig jetzt.
+            path (str, optional): Protokolldatei. Existiert sie, werden Beginn, Ausgangszustand und
+                Ereignisse daraus geladen und initial_states sowie start ignoriert.
+        """
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval muss mindestens 1 sein.")
+
+        self._snapshot_interval = snapshot_interval
+        self._start = start if start is not None else datetime.now()
+
+        self._events = []
+        self._timestamps = []
+        self._current = dict(initial_states)
+
+        # --- Momentaufnahmen: (Anzahl angewendeter Ereignisse, Zustände) ---
+        self._snapshot_counts = [0]
+        self._snapshots = [dict(initial_states)]
+
+        self._undo_stack = []
+        self._redo_stack = []
+
+        self._path = path
+        self._offset = 0
+        self._line_count = 0
+        self._issues = []
+        if path is not None:
+            if os.path.exists(path):
+                self.sync()
+            else:
+                self._write_lines([{"start": self._start.isoformat(), "states": _encode_states(initial_states)}])
+
+    def get_start(self):
+        """Gibt den Beginn der Aufzeichnung zurück."""
+        return self._start
+
+    def get_events(self):
+        """
+        Gibt alle bisher aufgezeichneten Ereignisse zurück.
+
+        Returns:
+            list: Liste von GradeEvent-Objekten in zeitlicher Reihenfolge.
+        """
+        return list(self._events)
+
+    def get_issues(self):
+        """
+        Gibt die fehlerhaften Zeilen der Protokolldatei zurück, die übersprungen wurden.
+
+        Returns:
+            list: LoadIssue-Objekte mit Zeilennummer.
+        """
+        return list(self._issues)
+
+    def get_current_states(self):
+        """
+        Gibt den aktuellen Zustand aller Module laut Protokoll zurück.
+
+        Returns:
+            dict: Modulname -> Zustandstupel.
+        """
+        return dict(self._current)
+
+    def can_undo(self):
+        """Gibt zurück, ob eine Änderung rückgängig gemacht werden kann."""
+        return bool(self._undo_stack)
+
+    def can_redo(self):
+        """Gibt zurück, ob eine rückgängig gemachte Änderung wiederholt werden kann."""
+        return bool(self._redo_stack)
+
+    def record(self, module_name, old_state, new_state, timestamp = None):
+        """
+        Zeichnet eine neue Notenänderung auf und verwirft den Wiederholen-Stapel.
+
+        Args:
+            module_name (str): Name des geänderten Moduls.
+            old_state (tuple): Zustand vor der Änderung.
+            new_state (tuple): Zustand nach der Änderung.
+            timestamp (datetime, optional): Zeitpunkt der Änderung, standardmäßig jetzt.
+
+        Returns:
+            GradeEvent: Das aufgezeichnete Ereignis.
+        """
+        event = self._append(module_name, old_state, new_state, "Eintrag", timestamp)
+        self._undo_stack.append(event)
+        self._redo_stack.clear()
+        return event
+
+    def record_adopted(self, module_name, old_state, new_state, timestamp = None):
+        """
+        Zeichnet eine Änderung auf, die nicht aus dieser Sitzung stammt, z.B. aus einem anderen Prozess.
+
+        Das Ereignis zählt für Zeitreisen, kann aber nicht rückgängig gemacht werden.
+
+        Returns:
+            GradeEvent: Das aufgezeichnete Ereignis.
+        """
+        return self._append(module_name, old_state, new_state, "Übernommen", timestamp)
+
+    def peek_undo(self):
+        """Gibt die Änderung zurück, die undo() rückgängig machen würde, oder None."""
+        return self._undo_stack[-1] if self._undo_stack else None
+
+    def peek_redo(self):
+        """Gibt die Änderung zurück, die redo() wiederholen würde, oder None."""
+        return self._redo_stack[-1] if self._redo_stack else None
+
+    def discard(self, event):
+        """
+        Entfernt eine Änderung vom Rückgängig- und Wiederholen-Stapel, z.B. weil sie nicht mehr anwendbar ist.
+
+        Das Protokoll selbst bleibt unverändert.
+
+        Args:
+            event (GradeEvent): Ereignis aus peek_undo() bzw. peek_redo().
+        """
+        self._undo_stack = [entry for entry in self._undo_stack if entry is not event]
+        self._redo_stack = [entry for entry in self._redo_stack if entry is not event]
+
+    def sync(self):
+        """
+        Übernimmt Zeilen, die andere Prozesse seit dem letzten Lesen an die Protokolldatei angehängt haben.
+
+        Die übernommenen Ereignisse zählen für Zeitreisen, landen aber auf keinem
+        Rückgängig-Stapel. Ohne Protokolldatei passiert nichts. Eine unvollständige
+        letzte Zeile (z.B. nach einem Absturz beim Anhängen) wird noch nicht gelesen,
+        fehlerhafte Zeilen werden übersprungen und gemeldet (siehe get_issues).
+
+        Returns:
+            list: Neu übernommene GradeEvent-Objekte.
+        """
+        if self._path is None:
+            return []
+        try:
+            with open(self._path, "rb") as file:
+                file.seek(self._offset)
+                data = file.read()
+        except (IOError, OSError) as e:
+            print(f"Fehler beim Lesen der Datei '{self._path}': {e}")
+            return []
+
+        # --- Nur vollständige Zeilen, eine gerade geschriebene letzte Zeile folgt beim nächsten Mal ---
+        complete = data[:data.rfind(b"\n") + 1]
+        self._offset += len(complete)
+
+        events = []
+        issues = []
+        for line in complete.splitlines():
+            self._line_count += 1
+            if not line.strip():
+                continue
+            try:
+                event = self._read_record(json.loads(line.decode("utf-8")))
+            except (ValueError, KeyError, TypeError) as e:
+                issues.append(LoadIssue(self._path, self._line_count, None, f"Zeile übersprungen: {e}"))
+                continue
+            if event is not None:
+                events.append(event)
+
+        if issues:
+            self._issues.extend(issues)
+            print("\n".join([f"{len(issues)} fehlerhafte Zeilen in der Historie"] + [f"- {issue}" for issue in issues]))
+        return events
+
+    def _read_record(self, record):
+        """
+        Übernimmt einen Datensatz der Protokolldatei.
+
+        Returns:
+            GradeEvent or None: Das übernommene Ereignis, None bei Beginn und Momentaufnahme.
+
+        Raises:
+            ValueError, KeyError, TypeError: Wenn der Datensatz nicht dem Format entspricht.
+        """
+        if "start" in record:
+            start = datetime.fromisoformat(record["start"])
+            current = _decode_states(record["states"])
+            self._start = start
+            self._events, self._timestamps = [], []
+            self._current = current
+            self._snapshot_counts = [0]
+            self._snapshots = [dict(current)]
+        elif "event" in record:
+            timestamp, module_name, old_state, new_state, kind = record["event"]
+            return self._add(datetime.fromisoformat(timestamp), module_name, _decode_state(old_state), _decode_state(new_state), kind)
+        elif "snapshot" in record and record["snapshot"] == len(self._events) and record["snapshot"] != self._snapshot_counts[-1]:
+            states = _decode_states(record["states"])
+            self._snapshot_counts.append(record["snapshot"])
+            self._snapshots.append(states)
+        return None
+
+    def undo(self, timestamp = None):
+        """
+        Macht die letzte Änderung rückgängig, indem ein ausgleichendes Ereignis angehängt wird.
+
+        Args:
+            timestamp (datetime, optional): Zeitpunkt des Rückgängigmachens.
+
+        Returns:
+            GradeEvent or None: Das ausgleichende Ereignis oder None, wenn nichts rückgängig zu machen ist.
+        """
+        if not self._undo_stack:
+            return None
+
+        original = self._undo_stack.pop()
+        self._redo_stack.append(original)
+        return self._append(original.get_module_name(), original.get_new_state(), original.get_old_state(), "Rückgängig", timestamp)
+
+    def redo(self, timestamp = None):
+        """
+        Wiederholt die zuletzt rückgängig gemachte Änderung.
+
+        Args:
+            timestamp (datetime, optional): Zeitpunkt des Wiederholens.
+
+        Returns:
+            GradeEvent or None: Das neue Ereignis oder None, wenn nichts zu wiederholen ist.
+        """
+        if not self._redo_stack:
+            return None
+
+        original = self._redo_stack.pop()
+        self._undo_stack.append(original)
+        return self._append(original.get_module_name(), original.get_old_state(), original.get_new_state(), "Wiederholen", timestamp)
+
+    def get_states_at(self, point_in_time:datetime):
+        """
+        Rekonstruiert den Zustand aller Module zu einem vergangenen Zeitpunkt.
+
+        Sucht per Binärsuche die letzte Momentaufnahme vor dem Zeitpunkt und spielt
+        nur die danach folgenden Ereignisse ab (höchstens `snapshot_interval`).
+
+        Args:
+            point_in_time (datetime): Gewünschter Zeitpunkt.
+
+        Returns:
+            dict: Modulname -> Zustandstupel zum angegebenen Zeitpunkt.
+        """
+        if point_in_time < self._start:
+            raise ValueError("Der Zeitpunkt liegt vor dem Beginn der Aufzeichnung.")
+
+        event_count = bisect_right(self._timestamps, point_in_time)
+        return self.get_states_after(event_count)
+
+    def get_states_after(self, event_count:int):
+        """
+        Rekonstruiert den Zustand aller Module nach einer bestimmten Anzahl von Ereignissen.
+
+        Args:
+            event_count (int): Anzahl der anzuwendenden Ereignisse.
+
+        Returns:
+            dict: Modulname -> Zustandstupel.
+        """
+        event_count = max(0, min(event_count, len(self._events)))
+        snapshot_index = bisect_right(self._snapshot_counts, event_count) - 1
+
+        states = dict(self._snapshots[snapshot_index])
+        for event in self._events[self._snapshot_counts[snapshot_index]:event_count]:
+            states[event.get_module_name()] = event.get_new_state()
+        return states
+
+    def _append(self, module_name, old_state, new_state, kind, timestamp):
+        """Hängt ein Ereignis an, legt bei Bedarf eine Momentaufnahme ab und schreibt beides in die Protokolldatei."""
+        snapshot_count = self._snapshot_counts[-1]
+        event = self._add(timestamp if timestamp is not None else datetime.now(), module_name, old_state, new_state, kind)
+
+        records = [{"event": [event.get_timestamp().isoformat(), module_name, _encode_state(old_state), _encode_state(new_state), kind]}]
+        if self._snapshot_counts[-1] != snapshot_count:
+            records.append({"snapshot": self._snapshot_counts[-1], "states": _encode_states(self._snapshots[-1])})
+        self._write_lines(records)
+        return event
+
+    def _add(self, timestamp, module_name, old_state, new_state, kind):
+        """Hängt ein Ereignis im Speicher an und legt bei Bedarf eine Momentaufnahme ab."""
+        # --- Zeitstempel monoton halten, damit die Binärsuche gültig bleibt ---
+        if self._timestamps and timestamp < self._timestamps[-1]:
+            timestamp = self._timestamps[-1]
+
+        event = GradeEvent(len(self._events), timestamp, module_name, old_state, new_state, kind)
+        self._events.append(event)
+        self._timestamps.append(timestamp)
+        self._current[module_name] = new_state
+
+        if len(self._events) % self._snapshot_interval == 0:
+            self._snapshot_counts.append(len(self._events))
+            self._snapshots.append(dict(self._current))
+
+        return event
+
+    def _write_lines(self, records):
+        """Hängt Datensätze als JSON-Zeilen an die Protokolldatei an, falls eine angegeben ist."""
+        if self._path is None:
+            return
+        data = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records).encode("utf-8")
+        try:
+            with open(self._path, "ab") as file:
+                # --- Eine abgebrochene letzte Zeile abschließen, damit sie nicht mit dem neuen Datensatz verschmilzt ---
+                end = file.seek(0, os.SEEK_END)
+                if end > self._offset:
+                    data = b"\n" + data
+                    self._issues.append(LoadIssue(self._path, self._line_count + 1, None, "Unvollständige Zeile übersprungen"))
+                    self._line_count += 1
+                file.write(data)
+            self._offset = end + len(data)
+            self._line_count += len(records)
+        except (IOError, OSError) as e:
+            print(f"Fehler beim Schreiben der Datei '{self._path}': {e}")
+
+
+# --- Zustandstupel (siehe Module.get_state) als JSON: Datumswerte im ISO-Format ---
+
+def _encode_state(state):
+    """Wandelt ein Zustandstupel in eine JSON-taugliche Liste um."""
+    if state is None:
+        return None
+    status, mark, date, passed, attempts = state
+    return [status, mark, _encode_date(date), passed, [[a_mark, _encode_date(a_date), a_passed] for a_mark, a_date, a_passed in attempts]]
+
+
+def _decode_state(value):
+    """Stellt ein Zustandstupel aus _encode_state wieder her."""
+    if value is None:
+        return None
+    status, mark, date, passed, attempts = value
+    return (status, mark, _decode_date(date), passed, tuple((a_mark, _decode_date(a_date), a_passed) for a_mark, a_date, a_passed in attempts))
+
+
+def _encode_states(states):
+    """Wandelt Modulname -> Zustandstupel in ein JSON-taugliches dict um."""
+    return {module_name: _encode_state(state) for module_name, state in states.items()}
+
+
+def _decode_states(value):
+    """Stellt Modulname -> Zustandstupel aus _encode_states wieder her."""
+    return {module_name: _decode_state(state) for module_name, state in value.items()}
+
+
+def _encode_date(date):
+    return date.isoformat() if date is not None else None
+
+
+def _decode_date(value):
+    return datetime.fromisoformat(value) if value is not None else None
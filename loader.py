@@ -0,0 +1,362 @@
+import csv
+from datetime import datetime
+from functools import lru_cache
+from dateutil import parser as date_parser
+
+from course_of_study import CourseOfStudy
+from module import Module
+from tracing import TRACER
+
+
+class LoadIssue:
+    """
+    Beschreibt einen einzelnen Validierungsfehler beim Laden einer CSV-Datei.
+
+    Zeilennummern beziehen sich auf die Datei, Zeile 1 ist die Kopfzeile.
+    """
+    def __init__(self, file:str, row:int, column:str, message:str):
+        """
+        Initialisiert einen neuen Validierungsfehler.
+
+        Args:
+            file (str): Pfad der betroffenen Datei.
+            row (int): Zeilennummer oder None, wenn die ganze Datei betroffen ist.
+            column (str): Spaltenname oder None, wenn die ganze Zeile betroffen ist.
+            message (str): Fehlerbeschreibung.
+        """
+        self._file = file
+        self._row = row
+        self._column = column
+        self._message = message
+
+    def get_file(self):
+        """Gibt den Pfad der betroffenen Datei zurück."""
+        return self._file
+
+    def get_row(self):
+        """Gibt die Zeilennummer zurück."""
+        return self._row
+
+    def get_column(self):
+        """Gibt den Spaltennamen zurück."""
+        return self._column
+
+    def get_message(self):
+        """Gibt die Fehlerbeschreibung zurück."""
+        return self._message
+
+    def __str__(self):
+        location = self._file
+        if self._row is not None:
+            location += f", Zeile {self._row}"
+        if self._column is not None:
+            location += f", Spalte '{self._column}'"
+        return f"{location}: {self._message}"
+
+
+class CsvLoadError(Exception):
+    """
+    Wird ausgelöst, wenn beim Laden der CSV-Dateien Fehler gefunden wurden.
+
+    Enthält alle gefundenen Fehler, nicht nur den ersten.
+    """
+    def __init__(self, issues:list):
+        """
+        Initialisiert den Fehler mit allen gesammelten Validierungsfehlern.
+
+        Args:
+            issues (list): Liste von LoadIssue-Objekten.
+        """
+        super().__init__(f"{len(issues)} Fehler beim Laden der CSV-Dateien")
+        self._issues = issues
+
+    def get_issues(self):
+        """Gibt alle gesammelten Validierungsfehler zurück."""
+        return self._issues
+
+    def report(self):
+        """
+        Erstellt einen lesbaren Fehlerbericht mit einer Zeile pro Fehler.
+
+        Returns:
+            str: Fehlerbericht.
+        """
+        return "\n".join([str(self)] + [f"- {issue}" for issue in self._issues])
+
+
+# --- Gültiger Notenbereich ---
+BEST_MARK = 1.0
+WORST_MARK = 5.0
+
+
+# --- Spaltentypen ---
+
+def parse_text(value):
+    """Pflichtfeld: nicht-leerer Text."""
+    if value == "":
+        raise ValueError("Wert fehlt")
+    return value
+
+
+def parse_int(value):
+    """Pflichtfeld: ganze Zahl."""
+    if value == "":
+        raise ValueError("Wert fehlt")
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"'{value}' ist keine ganze Zahl") from None
+
+
+@lru_cache(maxsize=4096)
+def parse_date(value):
+    """Optionales Datum im Format TT.MM.JJJJ, andere Formate werden mit dayfirst gelesen."""
+    if value == "":
+        return None
+
+    # --- Schneller Pfad für TT.MM.JJJJ, Prüfungsdaten wiederholen sich zudem häufig (Cache) ---
+    if len(value) == 10 and value[2] == "." and value[5] == "." and value.replace(".", "").isdigit():
+        try:
+            return datetime(int(value[6:10]), int(value[3:5]), int(value[0:2]))
+        except ValueError:
+            raise ValueError(f"'{value}' ist kein gültiges Datum") from None
+    try:
+        return date_parser.parse(value, dayfirst=True)
+    except (ValueError, OverflowError):
+        raise ValueError(f"'{value}' ist kein gültiges Datum") from None
+
+
+def parse_required_date(value):
+    """Pflichtfeld: Datum (siehe parse_date)."""
+    if value == "":
+        raise ValueError("Wert fehlt")
+    return parse_date(value)
+
+
+def parse_mark(value):
+    """Optionale Note, Komma und Punkt als Dezimaltrenner."""
+    if value == "":
+        return None
+    try:
+        mark = float(value.replace(",", "."))
+    except ValueError:
+        raise ValueError(f"'{value}' ist keine gültige Note") from None
+    return check_mark(mark)
+
+
+def check_mark(mark):
+    """
+    Prüft, ob eine Note zwischen BEST_MARK und WORST_MARK liegt.
+
+    Wird auch bei der Eingabe geprüft, damit keine Note gespeichert wird, die sich nicht wieder laden lässt.
+
+    Args:
+        mark (float): Note.
+
+    Returns:
+        float: Die unveränderte Note.
+
+    Raises:
+        ValueError: Wenn die Note außerhalb des Bereichs liegt.
+    """
+    if not BEST_MARK <= mark <= WORST_MARK:
+        raise ValueError(f"Note {mark} liegt nicht zwischen {BEST_MARK} und {WORST_MARK}")
+    return mark
+
+
+def parse_yes_no(value):
+    """Optionaler Wahrheitswert "Ja"/"Nein"."""
+    if value == "":
+        return None
+    if value == "Ja":
+        return True
+    if value == "Nein":
+        return False
+    raise ValueError(f"'{value}' ist weder 'Ja' noch 'Nein'")
+
+
+def parse_attempts(value):
+    """Optionale Versuche im Format "Note/Datum/Bestanden;..." (siehe module.format_attempts)."""
+    if value == "":
+        return ()
+    attempts = []
+    for part in value.split(";"):
+        fields = part.split("/")
+        if len(fields) != 3:
+            raise ValueError(f"'{part}' ist kein Versuch im Format Note/Datum/Bestanden")
+        attempts.append((parse_mark(fields[0].strip()), parse_required_date(fields[1].strip()), parse_yes_no(fields[2].strip())))
+    return tuple(attempts)
+
+
+COURSE_OF_STUDY_SCHEMA = {
+    "Name": parse_text,
+    "Art": parse_text,
+    "Titel": parse_text,
+    "Gesamt_ECTS": parse_int,
+    "Dauer": parse_text,
+    "Start": parse_required_date,
+    "Ende": parse_required_date,
+}
+
+SEMESTER_SCHEMA = {
+    "Bezeichnung": parse_text,
+}
+
+MODULE_SCHEMA = {
+    "Name": parse_text,
+    "ECTS": parse_int,
+    "Status": parse_text,
+    "Note": parse_mark,
+    "Datum": parse_date,
+    "Bestanden": parse_yes_no,
+    "Versuche": parse_attempts,
+}
+
+# --- Spalten, die in älteren Dateien fehlen dürfen und dann als leer gelten ---
+OPTIONAL_COLUMNS = {"Versuche"}
+
+
+def iter_typed_rows(path, schema, issues):
+    """
+    Liest eine CSV-Datei zeilenweise und wandelt jede Zeile anhand des Schemas um.
+
+    Die Datei wird genau einmal gelesen. Fehlerhafte Zeilen werden übersprungen,
+    alle Fehler werden mit Zeile und Spalte an `issues` angehängt. Fehlen Spalten
+    aus OPTIONAL_COLUMNS, erhalten sie den Wert eines leeren Feldes.
+
+    Args:
+        path (str): Pfad zur CSV-Datei.
+        schema (dict): Spaltenname -> Umwandlungsfunktion.
+        issues (list): Liste, an die LoadIssue-Objekte angehängt werden.
+
+    Yields:
+        tuple: (Zeilennummer, Datensatzindex ab 0, dict mit typisierten Werten).
+    """
+    try:
+        with open(path, newline="", encoding="utf-8-sig") as csv_file:
+            reader = csv.reader(csv_file)
+            header = next(reader, None)
+            if header is None:
+                issues.append(LoadIssue(path, None, None, "Die Datei ist leer."))
+                return
+
+            header = [name.strip() for name in header]
+            missing = [name for name in schema if name not in header and name not in OPTIONAL_COLUMNS]
+            for name in missing:
+                issues.append(LoadIssue(path, 1, name, "Spalte fehlt."))
+            if missing:
+                return
+
+            columns = [(name, header.index(name), convert) for name, convert in schema.items() if name in header]
+            defaults = {name: convert("") for name, convert in schema.items() if name not in header}
+            width = len(header)
+
+            record_index = -1
+            for row in reader:
+                if not row:
+                    continue
+                record_index += 1
+
+                # --- Fehlende Felder am Zeilenende wie leere Werte behandeln ---
+                if len(row) < width:
+                    row = row + [""] * (width - len(row))
+
+                values = dict(defaults) if defaults else {}
+                valid = True
+                for name, index, convert in columns:
+                    try:
+                        values[name] = convert(row[index].strip())
+                    except ValueError as e:
+                        issues.append(LoadIssue(path, reader.line_num, name, str(e)))
+                        valid = False
+
+                if valid:
+                    yield reader.line_num, record_index, values
+    except FileNotFoundError:
+        issues.append(LoadIssue(path, None, None, "Die Datei wurde nicht gefunden."))
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        issues.append(LoadIssue(path, None, None, f"Die Datei konnte nicht gelesen werden: {e}"))
+
+
+@TRACER.traced("loader.load_course_of_study")
+def load_course_of_study(module_indices_per_semester, course_path="course_of_study.csv", semester_path="semester.csv", modules_path="modules.csv"):
+    """
+    Lädt Studiengang, Semester und Module in einem Durchlauf pro Datei.
+
+    Module werden direkt beim Lesen erzeugt und ihrem Semester zugeordnet, ohne
+    Zwischenspeicherung als Tabelle. Wie bisher wird bei mehreren Studiengängen
+    der letzte Eintrag verwendet.
+
+    Args:
+        module_indices_per_semester (list): Pro Semester ein range der zugehörigen Modulzeilen (beginnend bei 0).
+        course_path (str, optional): Pfad zur Studiengangsdatei.
+        semester_path (str, optional): Pfad zur Semesterdatei.
+        modules_path (str, optional): Pfad zur Moduldatei.
+
+    Returns:
+        CourseOfStudy: Vollständig aufgebauter Studienverlauf.
+
+    Raises:
+        CsvLoadError: Wenn mindestens ein Fehler gefunden wurde; enthält alle Fehler.
+    """
+    issues = []
+
+    course_row = None
+    for _, _, values in iter_typed_rows(course_path, COURSE_OF_STUDY_SCHEMA, issues):
+        course_row = values
+
+    semester_list = [values["Bezeichnung"] for _, _, values in iter_typed_rows(semester_path, SEMESTER_SCHEMA, issues)]
+
+    if course_row is None and not issues:
+        issues.append(LoadIssue(course_path, None, None, "Kein Studiengang vorhanden."))
+    if len(semester_list) < len(module_indices_per_semester) and not issues:
+        issues.append(LoadIssue(semester_path, None, None, f"Es werden {len(module_indices_per_semester)} Semester erwartet, gefunden: {len(semester_list)}."))
+
+    course = None
+    if not issues:
+        course = CourseOfStudy(
+            course_row["Name"],
+            course_row["Art"],
+            course_row["Titel"],
+            course_row["Gesamt_ECTS"],
+            course_row["Dauer"],
+            course_row["Start"],
+            course_row["Ende"],
+            semester_list
+        )
+
+    # --- Modulzeile -> Semesterindex ---
+    semester_of_module = {
+        module_index: semester_index
+        for semester_index, module_range in enumerate(module_indices_per_semester)
+        for module_index in module_range
+    }
+
+    module_count = 0
+    for row_number, module_index, values in iter_typed_rows(modules_path, MODULE_SCHEMA, issues):
+        module_count = module_index + 1
+        semester_index = semester_of_module.get(module_index)
+
+        if semester_index is None:
+            issues.append(LoadIssue(modules_path, row_number, None, "Das Modul ist keinem Semester zugeordnet."))
+            continue
+
+        if course is not None:
+            module = Module(
+                values["Name"],
+                values["ECTS"],
+                values["Status"],
+                values["Note"],
+                values["Datum"],
+                values["Bestanden"],
+                values["Versuche"]
+            )
+            course.get_semester()[semester_index].add_module(module)
+
+    if module_count < len(semester_of_module) and not any(issue.get_file() == modules_path for issue in issues):
+        issues.append(LoadIssue(modules_path, None, None, f"Es werden {len(semester_of_module)} Module erwartet, gefunden: {module_count}."))
+
+    if issues:
+        raise CsvLoadError(issues)
+
+    return course
@@ -1,88 +1,73 @@
+import os
+import sys
 import tkinter as tk
-import pandas as pd
 import tkinter.messagebox as mb
 
 from gui import Gui
-from course_of_study import CourseOfStudy
-from module import Module
 from controller import Controller
+from curriculum import MODULE_INDICES_PER_SEMESTER, is_overlay_file, load_curriculum_template, load_overlay
+from loader import load_course_of_study, CsvLoadError
+from metrics_exporter import MetricsExporter
+from tracing import TRACER
 
 def main():
     """
     Hauptfunktion zum Laden der CSV-Daten, Erstellen der Objekte und Starten der GUI.
 
-    Lädt Studiengang-, Semester- und Moduldaten aus CSV-Dateien,
-    wandelt Datenformate um, erstellt Objekte für Studiengang, Semester und Module,
-    initialisiert den Controller und startet die grafische Benutzeroberfläche.
-    """
-    try:
-        course_of_study_df = pd.read_csv("course_of_study.csv")
-        semester_df = pd.read_csv("semester.csv")
-        modules_df = pd.read_csv("modules.csv")
-    except FileNotFoundError:
-        mb.showerror("Eine Datei wurde nicht gefunden.")
-    except pd.errors.EmptyDataError:
-        mb.showerror("Eine Datei ist leer oder ungültig.")
-    except Exception as e:
-        mb.showerror(f"Fehler beim Laden der CSV: {e}")
-
+    Als Kommandozeilenargumente können mehrere Moduldateien (eine pro Person)
+    übergeben werden, die jeweils in einem eigenen Reiter geöffnet werden.
+    Ohne Argumente wird modules.csv geöffnet. Dateien ohne Spalte ECTS sind
+    Overlays, die nur die Abweichungen vom gemeinsamen Studienplan (modules.csv)
+    enthalten; der Studienplan wird dann einmal geladen und geteilt.
 
-    # --- Objekte erstellen ---
-    # --- Datentypen korrigieren ---
-    course_of_study_df["Start"] = pd.to_datetime(course_of_study_df["Start"], errors="coerce", dayfirst=True)
-    course_of_study_df["Ende"] = pd.to_datetime(course_of_study_df["Ende"], errors="coerce", dayfirst=True)
-
-    modules_df["Note"] = pd.to_numeric(modules_df["Note"], errors="coerce")
-    modules_df["Datum"] = pd.to_datetime(modules_df["Datum"], errors="coerce", dayfirst=True)
-    modules_df["Bestanden"] = modules_df["Bestanden"].map({"Ja": True, "Nein": False})
+    Lädt Studiengang-, Semester- und Moduldaten typisiert aus CSV-Dateien,
+    erstellt dabei direkt die Objekte für Studiengang, Semester und Module,
+    initialisiert den Controller und startet die grafische Benutzeroberfläche.
+    Bei fehlerhaften Dateien werden alle gefundenen Fehler gemeinsam angezeigt.
 
-    # --- Studiengang und Semester erstellen ---
-    semester_list = semester_df["Bezeichnung"].tolist()
+    Mit DASHBOARD_METRICS_PORT bzw. DASHBOARD_METRICS_FILE werden Kennzahlen und
+    Laufzeiten im Prometheus-Format per HTTP bzw. als Textdatei veröffentlicht.
+    """
+    metrics_port = os.environ.get("DASHBOARD_METRICS_PORT")
+    metrics_file = os.environ.get("DASHBOARD_METRICS_FILE")
+    if metrics_port or metrics_file:
+        # --- Schon vor dem Laden messen, damit die Ladezeit mitgezählt wird ---
+        TRACER.enabled = True
 
-    for row in course_of_study_df.itertuples():
-        my_course_of_study = CourseOfStudy(
-            row.Name,
-            row.Art,
-            row.Titel,
-            row.Gesamt_ECTS,
-            row.Dauer,
-            row.Start,
-            row.Ende,
-            semester_list
-        )
+    modules_paths = sys.argv[1:] or ["modules.csv"]
 
-    # --- Module erstellen ---
-    all_modules = []
+    # --- Studiengang, Semester und Module in einem Durchlauf pro Person laden ---
+    students = []
+    reports = []
+    template = None
+    for modules_path in modules_paths:
+        try:
+            if is_overlay_file(modules_path):
+                template = template or load_curriculum_template()
+                my_course_of_study = template.create_course(load_overlay(template, modules_path))
+                controller = Controller(my_course_of_study, modules_path, template)
+            else:
+                my_course_of_study = load_course_of_study(MODULE_INDICES_PER_SEMESTER, modules_path=modules_path)
+                controller = Controller(my_course_of_study, modules_path)
+        except CsvLoadError as e:
+            reports.append(e.report())
+            continue
 
-    for row in modules_df.itertuples():
-        module = Module(
-            row.Name, 
-            row.ECTS, 
-            row.Status, 
-            row.Note, 
-            row.Datum, 
-            row.Bestanden
-        )
-        all_modules.append(module)
+        title = os.path.splitext(os.path.basename(modules_path))[0]
+        students.append((title, controller))
 
-    # --- Semester erstellen ---
-    module_indices_per_semester = [
-        range(0, 6),   # Semester 1
-        range(6, 12),  # Semester 2
-        range(12, 18), # Semester 3
-        range(18, 24), # Semester 4
-        range(24, 30), # Semester 5
-        range(30, 33)  # Semester 6
-    ]
+    if reports:
+        mb.showerror("Fehler beim Laden der CSV", "\n\n".join(reports))
+        return
 
-    for semester_index, module_range in enumerate(module_indices_per_semester):
-        for module_index in module_range:
-            my_course_of_study.get_semester()[semester_index].add_module(all_modules[module_index])
+    if metrics_port or metrics_file:
+        exporter = MetricsExporter(students, textfile_path=metrics_file)
+        if metrics_port:
+            exporter.start_http_server(int(metrics_port))
 
-    controller = Controller(my_course_of_study)
     # --- Tkinter Setup & Dashboard starten ---
     root = tk.Tk()
-    app = Gui(root, my_course_of_study, controller)
+    app = Gui(root, students)
     app.run()
 
 if __name__ == "__main__":
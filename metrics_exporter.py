@@ -0,0 +1,258 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import threading
+import time
+
+from events import MetricsChanged
+from tracing import TRACER
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# --- (Metrikname, Schlüssel in Controller.get_metrics, Hilfetext) ---
+STUDENT_GAUGES = (
+    ("dashboard_reached_ects", "reached_ects", "Erreichte ECTS."),
+    ("dashboard_total_ects", "total_ects", "Gesamt-ECTS des Studiengangs."),
+    ("dashboard_progress_percent", "progress_percent", "Studienfortschritt in Prozent."),
+    ("dashboard_gpa", "gpa", "Aktueller Notendurchschnitt (0 ohne Noten)."),
+    ("dashboard_ects_this_month", "ects_this_month", "Im laufenden Monat erreichte ECTS."),
+)
+
+# --- Phasen aus tracing, die als Zusammenfassung veröffentlicht werden ---
+PHASE_QUANTILES = (0.5, 0.95, 0.99)
+
+# --- Höchste Wartezeit des Schreib-Threads, danach prüft er auf einen Monatswechsel ---
+MONTH_CHECK_SECONDS = 60
+
+
+class MetricsExporter:
+    """
+    Veröffentlicht Kennzahlen und interne Laufzeiten im Textformat von Prometheus.
+
+    Die Kennzahlen pro Person stammen aus einer Momentaufnahme, die bei
+    MetricsChanged (bzw. refresh()) neu berechnet wird. Eine Abfrage formatiert
+    nur die Momentaufnahme und die Zähler des Tracers; lediglich Momentaufnahmen
+    aus einem früheren Kalendermonat werden vorher erneuert, da sonst z.B.
+    dashboard_ects_this_month nach dem Monatswechsel stehen bliebe. Beim Erstellen
+    wird der gemeinsame Tracer aktiviert, damit Lade-, Speicher- und
+    Zeichenzeiten gezählt werden; stop() stellt den vorherigen Zustand wieder her.
+
+    Personen werden über den Pfad ihrer Moduldatei unterschieden (Label "file"),
+    gleichnamige Personen überschreiben sich daher nicht. Die Textdatei schreibt
+    ein eigener Thread, der veröffentlichende Thread (bei der GUI der
+    Tkinter-Hauptthread) markiert sie nur als veraltet.
+    """
+    def __init__(self, students, tracer=TRACER, textfile_path=None):
+        """
+        Args:
+            students (list): Liste von (Name, Controller) wie bei Gui.
+            tracer (PhaseTracer, optional): Quelle der Laufzeitmessungen.
+            textfile_path (str, optional): Datei für den Textfile-Collector, wird bei jeder Änderung neu geschrieben.
+        """
+        self._students = list(students)
+        self._tracer = tracer
+        self._tracer_was_enabled = tracer.enabled
+        self._tracer.enabled = True
+        self._textfile_path = textfile_path
+        self._lock = threading.Lock()
+        self._snapshots = {}
+        self._server = None
+
+        self._subscriptions = []
+        for title, controller in self._students:
+            callback = lambda event, title=title, controller=controller: self.refresh_student(title, controller)
+            controller.get_event_bus().subscribe(MetricsChanged, callback)
+            self._subscriptions.append((controller, callback))
+
+        self._stopped = threading.Event()
+        self._dirty = threading.Event()
+        self._writer = None
+        self.refresh(write=False)
+        if textfile_path is not None:
+            self.write_textfile()
+            self._writer = threading.Thread(target=self._write_loop, daemon=True)
+            self._writer.start()
+
+    def refresh(self, write=True):
+        """
+        Berechnet die Momentaufnahmen aller Personen neu, z.B. nach einem Monatswechsel.
+
+        Args:
+            write (bool, optional): True, um danach die Textdatei (im Schreib-Thread) zu aktualisieren.
+        """
+        for title, controller in self._students:
+            self.refresh_student(title, controller, write=False)
+        if write:
+            self._dirty.set()
+
+    def refresh_student(self, title, controller, write=True):
+        """
+        Berechnet die Momentaufnahme einer Person neu.
+
+        Args:
+            title (str): Name der Person.
+            controller (Controller): Controller der Person.
+            write (bool, optional): True, um danach die Textdatei (im Schreib-Thread) zu aktualisieren.
+        """
+        version, metrics = controller.get_versioned_metrics()
+        snapshot = {key: metrics[key] for _, key, _ in STUDENT_GAUGES}
+        snapshot["title"] = title
+        snapshot["version"] = version
+        snapshot["timestamp"] = time.time()
+        with self._lock:
+            self._snapshots[controller.get_modules_csv_path()] = snapshot
+        if write:
+            self._dirty.set()
+
+    def refresh_stale(self):
+        """
+        Erneuert Momentaufnahmen, die aus einem früheren Kalendermonat stammen.
+
+        Returns:
+            bool: True, wenn mindestens eine Momentaufnahme erneuert wurde.
+        """
+        now = time.localtime()
+        with self._lock:
+            stale_files = {
+                file for file, snapshot in self._snapshots.items()
+                if time.localtime(snapshot["timestamp"])[:2] != now[:2]
+            }
+        for title, controller in self._students:
+            if controller.get_modules_csv_path() in stale_files:
+                self.refresh_student(title, controller, write=False)
+        return bool(stale_files)
+
+    def render(self):
+        """
+        Erstellt die Ausgabe im Prometheus-Textformat aus Momentaufnahme und Tracer.
+
+        Returns:
+            str: Alle Metriken, mit HELP- und TYPE-Zeilen.
+        """
+        self.refresh_stale()
+        with self._lock:
+            snapshots = dict(self._snapshots)
+
+        lines = []
+        for name, key, help_text in STUDENT_GAUGES:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for file, snapshot in snapshots.items():
+                lines.append(f"{name}{{{_labels(file, snapshot)}}} {_format(snapshot[key])}")
+
+        lines.append("# HELP dashboard_metrics_version Versionsstand des Controllers zur Momentaufnahme.")
+        lines.append("# TYPE dashboard_metrics_version gauge")
+        for file, snapshot in snapshots.items():
+            lines.append(f"dashboard_metrics_version{{{_labels(file, snapshot)}}} {snapshot['version']}")
+
+        lines.append("# HELP dashboard_snapshot_timestamp_seconds Zeitpunkt der letzten Momentaufnahme (Unix-Zeit).")
+        lines.append("# TYPE dashboard_snapshot_timestamp_seconds gauge")
+        for file, snapshot in snapshots.items():
+            lines.append(f"dashboard_snapshot_timestamp_seconds{{{_labels(file, snapshot)}}} {snapshot['timestamp']:.3f}")
+
+        lines.append("# HELP dashboard_students Anzahl geladener Studienverläufe.")
+        lines.append("# TYPE dashboard_students gauge")
+        lines.append(f"dashboard_students {len(snapshots)}")
+
+        # --- Laufzeiten: Laden (loader.*), Speichern (controller.save_csv), Zeichnen (gui.*) ---
+        lines.append("# HELP dashboard_phase_seconds Dauer der gemessenen Phasen (Laden, Speichern, Zeichnen).")
+        lines.append("# TYPE dashboard_phase_seconds summary")
+        for phase in self._tracer.get_phase_names():
+            label = f"phase=\"{_escape(phase)}\""
+            for quantile in PHASE_QUANTILES:
+                lines.append(f"dashboard_phase_seconds{{{label},quantile=\"{quantile}\"}} {self._tracer.get_percentile(phase, quantile * 100):.6f}")
+            lines.append(f"dashboard_phase_seconds_sum{{{label}}} {self._tracer.get_total(phase):.6f}")
+            lines.append(f"dashboard_phase_seconds_count{{{label}}} {self._tracer.get_count(phase)}")
+
+        return "\n".join(lines) + "\n"
+
+    def _write_loop(self):
+        """
+        Schreib-Thread: schreibt die Textdatei nach jeder Änderung und nach einem Monatswechsel.
+
+        Mehrere Änderungen kurz hintereinander führen nur zu einem Schreibvorgang.
+        """
+        while not self._stopped.is_set():
+            changed = self._dirty.wait(MONTH_CHECK_SECONDS)
+            self._dirty.clear()
+            if self._stopped.is_set():
+                break
+            if self.refresh_stale() or changed:
+                self.write_textfile()
+
+    def write_textfile(self):
+        """Schreibt die Ausgabe atomar in die Textdatei des Collectors, falls ein Pfad gesetzt ist."""
+        if self._textfile_path is None:
+            return
+        temp_path = self._textfile_path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8", newline="\n") as file:
+                file.write(self.render())
+            os.replace(temp_path, self._textfile_path)
+        except (IOError, OSError) as e:
+            print(f"Fehler beim Schreiben der Datei '{self._textfile_path}': {e}")
+
+    def start_http_server(self, port=9464, host="127.0.0.1"):
+        """
+        Startet einen kleinen HTTP-Server, der die Metriken unter /metrics ausliefert.
+
+        Args:
+            port (int, optional): Port, 0 wählt einen freien Port.
+            host (str, optional): Adresse, standardmäßig nur lokal erreichbar.
+
+        Returns:
+            int: Tatsächlich verwendeter Port.
+        """
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server.server_address[1]
+
+    def stop(self):
+        """Beendet HTTP-Server und Schreib-Thread, meldet die Ereignisse ab und stellt den Tracer zurück."""
+        if self._writer is not None:
+            self._stopped.set()
+            self._dirty.set()
+            self._writer.join()
+            self._writer = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for controller, callback in self._subscriptions:
+            controller.get_event_bus().unsubscribe(MetricsChanged, callback)
+        self._subscriptions = []
+        self._tracer.enabled = self._tracer_was_enabled
+
+
+def _labels(file, snapshot):
+    """Formatiert die Labels einer Person: Name und Pfad der Moduldatei als eindeutige Kennung."""
+    return f"student=\"{_escape(snapshot['title'])}\",file=\"{_escape(file)}\""
+
+
+def _escape(value):
+    """Maskiert einen Labelwert nach den Regeln des Textformats."""
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format(value):
+    """Formatiert einen Kennzahlwert, unendliche Werte als +Inf."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
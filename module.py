@@ -1,6 +1,7 @@
 import datetime
 import math
 
+from attempt_log import AttemptLog
 from exam_result import ExamResult
 
 class Module:
@@ -8,9 +9,10 @@ class Module:
     Repräsentiert ein Studienmodul mit zugehöriger Prüfungsleistung.
 
     Ein Modul besteht aus einem Namen, ECTS-Punkten, einem Status und optional einer Prüfungsleistung,
-    die als ExamResult-Objekt gespeichert wird.
+    die als ExamResult-Objekt gespeichert wird. Alle Prüfungsversuche werden in einem
+    AttemptLog protokolliert; die Prüfungsleistung ist der zählende Versuch daraus.
     """
-    def __init__(self, name:str, ects:int, status:str, mark:float = None, date:datetime = None, passed:bool = None):
+    def __init__(self, name:str, ects:int, status:str, mark:float = None, date:datetime = None, passed:bool = None, attempts:tuple = ()):
         """
         Initialisiert ein neues Modul-Objekt mit den angegebenen Informationen.
 
@@ -21,13 +23,19 @@ class Module:
             mark (float, optional): Note der Prüfungsleistung.
             date (datetime.datetime, optional): Datum der Prüfung.
             passed (bool, optional): True, wenn die Prüfung bestanden wurde, sonst False.
+            attempts (tuple, optional): Alle Versuche als (Note, Datum, Bestanden); ersetzt mark, date und passed.
         """
         self._name = name
         self._ects = ects
         self._status = status
         self._performance = None
+        # --- Das Protokoll entsteht erst mit dem ersten Versuch ---
+        self._attempts = None
 
-        self.create_or_update_performance(mark, date, passed)
+        if attempts:
+            self.set_attempts(attempts)
+        else:
+            self.create_or_update_performance(mark, date, passed)
 
     def get_name(self):
         """
@@ -60,6 +68,8 @@ class Module:
         """
         Gibt das ExamResult-Objekt (Prüfungsleistung) zurück, falls vorhanden.
 
+        Bei mehreren Versuchen ist das der zählende Versuch (siehe AttemptLog.get_counted_index).
+
         Returns:
             ExamResult or None: Prüfungsleistung oder None, wenn keine vorhanden ist.
         """
@@ -74,29 +84,135 @@ class Module:
         """
         self._status = new_status
     
+    def get_attempts(self):
+        """
+        Gibt alle Prüfungsversuche zurück.
+
+        Returns:
+            tuple: Tupel von (Note, Datum, Bestanden) in zeitlicher Reihenfolge, leer ohne Versuch.
+        """
+        if self._attempts is None:
+            return ()
+        return self._attempts.get_all()
+
+    def has_attempt(self, mark, date):
+        """
+        Prüft, ob bereits ein Versuch mit dieser Note am selben Tag protokolliert ist.
+
+        Args:
+            mark (float): Note.
+            date (datetime.datetime): Prüfungsdatum, nur der Tag zählt.
+
+        Returns:
+            bool: True, wenn der Versuch schon vorhanden ist.
+        """
+        return any(attempt_mark == mark and attempt_date.date() == date.date() for attempt_mark, attempt_date, _ in self.get_attempts())
+
+    def get_attempt_count(self):
+        """
+        Gibt die Anzahl der Prüfungsversuche zurück.
+
+        Returns:
+            int: Anzahl Versuche.
+        """
+        return len(self._attempts) if self._attempts is not None else 0
+
+    def add_attempt(self, mark, date, passed):
+        """
+        Protokolliert einen weiteren Prüfungsversuch und aktualisiert die zählende Prüfungsleistung.
+
+        Frühere Versuche bleiben erhalten. Ein Versuch mit demselben Datum wie der letzte
+        gilt als Korrektur und ersetzt diesen.
+
+        Args:
+            mark (float): Note.
+            date (datetime.datetime): Prüfungsdatum.
+            passed (bool): True bei bestanden, sonst False.
+        """
+        if not (self.is_value_valid(mark) and self.is_value_valid(date) and self.is_value_valid(passed)):
+            return
+        if self._attempts is None:
+            self._attempts = AttemptLog()
+        self._attempts.append(mark, date, passed)
+        self._update_performance()
+
+    def set_attempts(self, attempts):
+        """
+        Ersetzt alle Prüfungsversuche.
+
+        Args:
+            attempts (iterable): Versuche als (Note, Datum, Bestanden) in zeitlicher Reihenfolge.
+        """
+        attempt_log = AttemptLog(attempts)
+        self._attempts = attempt_log if len(attempt_log) else None
+        self._update_performance()
+
     def create_or_update_performance(self, mark, date, passed):
         """
         Erstellt oder aktualisiert die Prüfungsleistung (ExamResult) des Moduls,
         sofern gültige Werte übergeben wurden. Bei ungültigen Werten wird die Leistung entfernt.
 
+        Die Leistung wird zum einzigen Versuch, frühere Versuche werden verworfen. Für
+        einen weiteren Versuch ist add_attempt gedacht.
+
         Args:
             mark (float): Note.
             date (datetime.datetime): Prüfungsdatum.
             passed (bool): True bei bestanden, sonst False.
         """
         if self.is_value_valid(mark) and self.is_value_valid(date) and self.is_value_valid(passed):
-            if self.get_performance():
-                # --- Update bestehendes Objekt ---
-                self._performance.set_mark(mark)
-                self._performance.set_date(date)
-                self._performance.set_passed(passed)
-            else:
-                # --- Neues Objekt erstellen ---
-                self._performance = ExamResult(mark, date, passed)
+            self.set_attempts([(mark, date, passed)])
         else:
             # --- Ungültige Daten: Leistung löschen ---
+            self.set_attempts([])
+
+    def _update_performance(self):
+        """Überträgt den zählenden Versuch in die Prüfungsleistung, ohne das ExamResult-Objekt zu ersetzen."""
+        index = self._attempts.get_counted_index() if self._attempts is not None else None
+        if index is None:
             self._performance = None
+            return
+
+        mark, date, passed = self._attempts.get(index)
+        if self.get_performance():
+            # --- Update bestehendes Objekt ---
+            self._performance.set_mark(mark)
+            self._performance.set_date(date)
+            self._performance.set_passed(passed)
+        else:
+            # --- Neues Objekt erstellen ---
+            self._performance = ExamResult(mark, date, passed)
     
+    def get_state(self):
+        """
+        Gibt den aktuellen Zustand des Moduls als unveränderliches Tupel zurück.
+
+        Der Zustand umfasst den Status, die Daten der Prüfungsleistung und alle Versuche
+        und dient der Änderungshistorie als Momentaufnahme.
+
+        Returns:
+            tuple: (Status, Note, Datum, Bestanden, Versuche), ohne Leistung sind Note, Datum und Bestanden None
+                und Versuche ist leer.
+        """
+        performance = self.get_performance()
+        if performance is None:
+            return (self.get_status(), None, None, None, ())
+        return (self.get_status(), performance.get_mark(), performance.get_date(), performance.get_passed(), self.get_attempts())
+
+    def restore_state(self, state):
+        """
+        Stellt einen zuvor mit get_state() ermittelten Zustand wieder her.
+
+        Args:
+            state (tuple): (Status, Note, Datum, Bestanden, Versuche).
+        """
+        status, mark, date, passed, attempts = state
+        self.set_new_status(status)
+        if attempts:
+            self.set_attempts(attempts)
+        else:
+            self.create_or_update_performance(mark, date, passed)
+
     def is_value_valid(self, value):  
         """
         Prüft, ob ein übergebener Wert gültig ist.
@@ -135,5 +251,19 @@ class Module:
             "Status": self.get_status(),
             "Note": performance.get_mark() if performance else "",
             "Datum": performance.get_date().strftime("%d.%m.%Y") if performance else "",
-            "Bestanden": "Ja" if performance and performance.get_passed() else ("Nein" if performance else "")
-        }
\ No newline at end of file
+            "Bestanden": "Ja" if performance and performance.get_passed() else ("Nein" if performance else ""),
+            "Versuche": format_attempts(self.get_attempts()) if self.get_attempt_count() > 1 else ""
+        }
+
+
+def format_attempts(attempts):
+    """
+    Formatiert Versuche für die CSV-Spalte "Versuche", z.B. "5.0/01.02.2025/Nein;2.3/01.06.2025/Ja".
+
+    Args:
+        attempts (iterable): Versuche als (Note, Datum, Bestanden).
+
+    Returns:
+        str: Versuche, durch Semikolon getrennt.
+    """
+    return ";".join(f"{mark}/{date.strftime('%d.%m.%Y')}/{'Ja' if passed else 'Nein'}" for mark, date, passed in attempts)
\ No newline at end of file
@@ -0,0 +1,187 @@
+from bisect import bisect_left, bisect_right, insort
+
+# --- Sortierschlüssel für ModuleIndex.query, fehlende Werte stehen immer am Ende ---
+SORT_FIELDS = ("position", "name", "semester", "ects", "status", "mark", "date")
+
+
+class ModuleIndex:
+    """
+    Hash- und Sekundärindizes über alle Module eines Studienverlaufs.
+
+    Module werden über den Namen in O(1) gefunden. Zusätzlich gibt es Indizes nach
+    Status, Semester und ECTS (jeweils Menge von Modulnamen) sowie eine nach
+    Prüfungsdatum sortierte Liste für Bereichsabfragen per Binärsuche. Semester und
+    ECTS ändern sich nie, Status und Datum werden über update() nachgeführt.
+    """
+    def __init__(self, semesters):
+        """
+        Baut alle Indizes aus den Semestern eines Studienverlaufs auf.
+
+        Args:
+            semesters (list): Liste von Semester-Objekten.
+        """
+        self._modules = {}
+        self._positions = {}
+        self._semester_indices = {}
+        self._by_semester = []
+        self._by_ects = {}
+        self._by_status = {}
+        self._dates = []
+
+        for semester_index, semester in enumerate(semesters):
+            names = []
+            for module in semester.get_modules():
+                name = module.get_name()
+                # --- Bei doppelten Namen gilt wie bisher das erste Modul ---
+                if name in self._modules:
+                    continue
+                self._modules[name] = module
+                self._positions[name] = len(self._positions)
+                self._semester_indices[name] = semester_index
+                self._by_ects.setdefault(module.get_ects(), set()).add(name)
+                names.append(name)
+                self._add(name, module.get_state())
+            self._by_semester.append(names)
+
+        self._module_count = sum(len(semester.get_modules()) for semester in semesters)
+
+    def get_module_count(self):
+        """Gibt die Anzahl der Module zurück, aus denen der Index aufgebaut wurde (inkl. doppelter Namen)."""
+        return self._module_count
+
+    def get(self, module_name):
+        """
+        Gibt das Modul mit dem angegebenen Namen zurück.
+
+        Returns:
+            Module or None: Modul oder None, wenn es nicht existiert.
+        """
+        return self._modules.get(module_name)
+
+    def get_semester_index(self, module_name):
+        """
+        Gibt den Semesterindex eines Moduls zurück.
+
+        Returns:
+            int or None: Semesterindex oder None, wenn das Modul nicht existiert.
+        """
+        return self._semester_indices.get(module_name)
+
+    def get_names_by_status(self, status):
+        """
+        Gibt die Namen aller Module mit dem angegebenen Status in Studienreihenfolge zurück.
+
+        Returns:
+            list: Modulnamen.
+        """
+        return sorted(self._by_status.get(status, ()), key=self._positions.__getitem__)
+
+    def update(self, module_name, old_state):
+        """
+        Führt die Indizes nach einer Änderung eines Moduls nach.
+
+        Args:
+            module_name (str): Name des geänderten Moduls.
+            old_state (tuple): Zustand vor der Änderung (siehe Module.get_state).
+        """
+        module = self._modules.get(module_name)
+        if module is None:
+            return
+        new_state = module.get_state()
+        if new_state == old_state:
+            return
+        self._remove(module_name, old_state)
+        self._add(module_name, new_state)
+
+    def query(self, status=None, semester=None, ects=None, date_from=None, date_to=None, sort_by="position", descending=False):
+        """
+        Filtert die Module über die Indizes und sortiert das Ergebnis.
+
+        Alle angegebenen Filter müssen zutreffen. Ein Datumsbereich liefert nur Module
+        mit Prüfungsleistung, die Grenzen sind eingeschlossen.
+
+        Args:
+            status (str, optional): Modulstatus, z.B. "Offen".
+            semester (int, optional): Semesterindex (beginnend bei 0).
+            ects (int, optional): ECTS-Punkte.
+            date_from (datetime, optional): Frühestes Prüfungsdatum.
+            date_to (datetime, optional): Spätestes Prüfungsdatum.
+            sort_by (str, optional): Einer der Werte aus SORT_FIELDS.
+            descending (bool, optional): True für absteigende Sortierung.
+
+        Returns:
+            list: Module, die allen Filtern entsprechen.
+
+        Raises:
+            ValueError: Bei unbekanntem Sortierschlüssel.
+        """
+        if sort_by not in SORT_FIELDS:
+            raise ValueError(f"Unbekannter Sortierschlüssel '{sort_by}', erlaubt: {', '.join(SORT_FIELDS)}.")
+
+        candidates = []
+        if status is not None:
+            candidates.append(self._by_status.get(status, set()))
+        if semester is not None:
+            candidates.append(set(self._by_semester[semester]) if 0 <= semester < len(self._by_semester) else set())
+        if ects is not None:
+            candidates.append(self._by_ects.get(ects, set()))
+        if date_from is not None or date_to is not None:
+            candidates.append(self._names_in_date_range(date_from, date_to))
+
+        if candidates:
+            # --- Mit der kleinsten Menge beginnen, damit die Schnittmenge billig bleibt ---
+            candidates.sort(key=len)
+            names = set(candidates[0]).intersection(*candidates[1:])
+        else:
+            names = self._modules.keys()
+
+        return [self._modules[name] for name in self._sort(names, sort_by, descending)]
+
+    def _names_in_date_range(self, date_from, date_to):
+        """Gibt die Namen aller Module mit Prüfungsdatum im Bereich zurück (Binärsuche)."""
+        low = bisect_left(self._dates, (date_from,)) if date_from is not None else 0
+        high = bisect_right(self._dates, (date_to, float("inf"))) if date_to is not None else len(self._dates)
+        return {name for _, _, name in self._dates[low:high]}
+
+    def _sort(self, names, sort_by, descending):
+        """Sortiert Modulnamen, Module ohne Wert für den Schlüssel stehen am Ende."""
+        positions = self._positions
+        if sort_by == "position":
+            return sorted(names, key=positions.__getitem__, reverse=descending)
+
+        def value(name):
+            module = self._modules[name]
+            performance = module.get_performance()
+            if sort_by == "name":
+                return name
+            if sort_by == "semester":
+                return self._semester_indices[name]
+            if sort_by == "ects":
+                return module.get_ects()
+            if sort_by == "status":
+                return module.get_status()
+            if performance is None:
+                return None
+            return performance.get_mark() if sort_by == "mark" else performance.get_date()
+
+        keyed = [(value(name), positions[name], name) for name in names]
+        present = sorted((item for item in keyed if item[0] is not None), reverse=descending)
+        missing = sorted(item for item in keyed if item[0] is None)
+        return [name for _, _, name in present + missing]
+
+    def _add(self, name, state):
+        """Trägt Status und Prüfungsdatum eines Moduls in die veränderlichen Indizes ein."""
+        status, date = state[0], state[2]
+        self._by_status.setdefault(status, set()).add(name)
+        if date is not None:
+            insort(self._dates, (date, self._positions[name], name))
+
+    def _remove(self, name, state):
+        """Entfernt Status und Prüfungsdatum eines Moduls aus den veränderlichen Indizes."""
+        status, date = state[0], state[2]
+        self._by_status.get(status, set()).discard(name)
+        if date is not None:
+            entry = (date, self._positions[name], name)
+            index = bisect_left(self._dates, entry)
+            if index < len(self._dates) and self._dates[index] == entry:
+                del self._dates[index]
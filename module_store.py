@@ -0,0 +1,349 @@
+import csv
+import io
+import json
+import mmap
+import os
+
+from loader import MODULE_SCHEMA, CsvLoadError, LoadIssue
+from module import Module
+
+INDEX_SUFFIX = ".idx"
+
+# --- Freiraum in Bytes, der beim Neuschreiben an jede Zeile angehängt wird ---
+ROW_RESERVE = 32
+
+# --- Die erste Zeile der Indexdatei hat feste Breite und kann so allein überschrieben werden ---
+STAMP_WIDTH = 128
+
+
+class ModuleStore:
+    """
+    Wahlfreier Zugriff auf eine Moduldatei mehrerer Studierender (Spalte "Student").
+
+    Die Datei wird per mmap eingeblendet, ein Index (Student, Modul) -> (Offset,
+    Länge) wird einmal aufgebaut und neben der Datei als ".idx" gespeichert. Ein
+    Abruf liest und parst nur die angeforderten Zeilen. Eine geänderte Zeile wird
+    an Ort und Stelle überschrieben, wenn sie in die alte Zeile passt; der Rest
+    wird mit Leerzeichen aufgefüllt, die beim Lesen ohnehin entfernt werden. Nur
+    wenn sie länger ist, wird die Datei neu geschrieben, dabei erhält jede Zeile
+    ROW_RESERVE Bytes Freiraum für spätere Änderungen. Braucht ein Modul eine
+    Spalte aus MODULE_SCHEMA, die der Datei fehlt (z.B. "Versuche"), wird sie
+    beim Neuschreiben an die Kopfzeile angehängt.
+
+    Jeder Datensatz muss in einer Zeile stehen, was für Moduldateien immer gilt.
+    """
+    def __init__(self, path, index_path=None):
+        """
+        Args:
+            path (str): Pfad der Moduldatei, z.B. aus `export.py --directory --kind modules`.
+            index_path (str, optional): Pfad der Indexdatei, standardmäßig path + ".idx".
+
+        Raises:
+            CsvLoadError: Wenn die Datei leer ist oder die Spalten "Student" bzw. "Name" fehlen.
+        """
+        self._path = path
+        self._index_path = index_path or path + INDEX_SUFFIX
+        self._file = None
+        self._map = None
+        self._header = []
+        self._line_end = b"\n"
+        self._data_start = 0
+        self._rows = {}
+        self._students = {}
+        self._open()
+        if not self._load_index():
+            self._build_index()
+            self._save_index()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Gibt die Einblendung und die Datei frei."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def get_header(self):
+        """Gibt die Spaltennamen der Datei zurück."""
+        return list(self._header)
+
+    def get_row_count(self):
+        """Gibt die Anzahl der indizierten Zeilen zurück."""
+        return len(self._rows)
+
+    def get_students(self):
+        """Gibt alle Studierenden in Reihenfolge ihres ersten Auftretens zurück."""
+        return list(self._students)
+
+    def get_module_names(self, student):
+        """
+        Gibt die Modulnamen einer Person in Dateireihenfolge zurück.
+
+        Returns:
+            list: Modulnamen, leer bei unbekannter Person.
+        """
+        return list(self._students.get(student, ()))
+
+    def get_row(self, student, module_name):
+        """
+        Liest und parst genau eine Zeile.
+
+        Args:
+            student (str): Person.
+            module_name (str): Name des Moduls.
+
+        Returns:
+            dict: Spaltenname -> Text ohne Füllzeichen, oder None, wenn die Zeile nicht existiert.
+        """
+        entry = self._rows.get((student, module_name))
+        if entry is None:
+            return None
+        return self._parse(*entry)
+
+    def get_module(self, student, module_name):
+        """
+        Liest genau eine Zeile und erzeugt daraus ein Modul.
+
+        Returns:
+            Module: Modul oder None, wenn die Zeile nicht existiert.
+
+        Raises:
+            CsvLoadError: Wenn die Zeile ungültige Werte enthält.
+        """
+        row = self.get_row(student, module_name)
+        return None if row is None else self._to_module(row)
+
+    def get_modules(self, student):
+        """
+        Liest nur die Zeilen einer Person und erzeugt daraus Module.
+
+        Returns:
+            list: Module in Dateireihenfolge.
+        """
+        return [self.get_module(student, name) for name in self._students.get(student, ())]
+
+    def update_module(self, student, module):
+        """
+        Schreibt die Zeile eines Moduls neu, möglichst an Ort und Stelle.
+
+        Args:
+            student (str): Person.
+            module (Module): Modul mit dem neuen Stand, der Name bestimmt die Zeile.
+
+        Returns:
+            bool: True, wenn die Zeile überschrieben wurde, False, wenn die Datei neu geschrieben wurde.
+
+        Raises:
+            KeyError: Wenn die Person das Modul nicht in der Datei hat.
+        """
+        key = (student, module.get_name())
+        if key not in self._rows:
+            raise KeyError(key)
+
+        # --- Fehlende Spalten mit Inhalt, z.B. "Versuche", nicht verwerfen, sondern anhängen ---
+        values = module.to_dict()
+        added_columns = [name for name in MODULE_SCHEMA if name not in self._header and values.get(name, "") != ""]
+        if added_columns:
+            self._header += added_columns
+            self._rewrite({key: self._format(student, module)}, added_columns)
+            return False
+
+        offset, length = self._rows[key]
+        data = self._format(student, module)
+        if len(data) <= length:
+            self._file.seek(offset)
+            self._file.write(data + b" " * (length - len(data)))
+            self._file.flush()
+            self._save_stamp()
+            return True
+
+        self._rewrite({key: data})
+        return False
+
+    # --- Datei und Index ---
+
+    def _open(self):
+        """Öffnet die Datei, blendet sie ein und liest die Kopfzeile."""
+        self._file = open(self._path, "r+b")
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self.close()
+            raise CsvLoadError([LoadIssue(self._path, None, None, "Die Datei ist leer.")])
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        end = self._map.find(b"\n")
+        end = len(self._map) if end < 0 else end
+        self._data_start = min(end + 1, len(self._map))
+        line = self._map[:end]
+        if line.endswith(b"\r"):
+            self._line_end = b"\r\n"
+            line = line[:-1]
+        self._header = [name.strip() for name in next(csv.reader([line.decode("utf-8-sig")]))]
+
+        missing = [name for name in ("Student", "Name") if name not in self._header]
+        if missing:
+            self.close()
+            raise CsvLoadError([LoadIssue(self._path, 1, name, "Spalte fehlt.") for name in missing])
+
+    def _build_index(self):
+        """Durchläuft die Datei einmal und merkt sich Offset und Länge jeder Zeile."""
+        student_column = self._header.index("Student")
+        name_column = self._header.index("Name")
+        simple = student_column < 2 and name_column < 2
+        data = self._map
+        size = len(data)
+
+        self._rows = {}
+        self._students = {}
+        position = self._data_start
+        while position < size:
+            end = data.find(b"\n", position)
+            end = size if end < 0 else end
+            length = end - position
+            if length and data[position + length - 1] == 0x0D:
+                length -= 1
+            line = data[position:position + length]
+
+            if line.strip():
+                # --- Schneller Pfad: Student und Name in den ersten beiden Spalten, ohne Anführungszeichen ---
+                if simple and b'"' not in line:
+                    fields = line.split(b",", 2)
+                    values = [field.decode("utf-8").strip() for field in fields[:2]]
+                else:
+                    values = [value.strip() for value in next(csv.reader([line.decode("utf-8")]))]
+                    values = [values[student_column], values[name_column]] if len(values) > max(student_column, name_column) else []
+                if len(values) == 2:
+                    student, name = (values[0], values[1]) if student_column < name_column else (values[1], values[0])
+                    self._add_row(student, name, position, length)
+            position = end + 1
+
+    def _add_row(self, student, name, offset, length):
+        """Nimmt eine Zeile in den Index auf."""
+        self._rows[(student, name)] = (offset, length)
+        self._students.setdefault(student, []).append(name)
+
+    def _stamp(self):
+        """Gibt Größe und Änderungszeit der Datei zurück, an denen ein veralteter Index erkannt wird."""
+        stat = os.stat(self._path)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _load_index(self):
+        """
+        Lädt den gespeicherten Index, falls er zur Datei passt.
+
+        Returns:
+            bool: True, wenn der Index übernommen wurde.
+        """
+        try:
+            with open(self._index_path, encoding="utf-8") as file:
+                stamp = json.loads(file.readline())
+                header = json.loads(file.readline())
+                rows = json.loads(file.readline())
+        except (OSError, ValueError):
+            return False
+
+        if stamp != self._stamp() or header != self._header:
+            return False
+        self._rows = {}
+        self._students = {}
+        for student, name, offset, length in rows:
+            self._add_row(student, name, offset, length)
+        return True
+
+    def _save_index(self):
+        """Schreibt den Index: Zeitstempel (feste Breite), Kopfzeile und alle Zeilen als JSON."""
+        rows = [[student, name, offset, length] for (student, name), (offset, length) in self._rows.items()]
+        try:
+            with open(self._index_path, "w", encoding="utf-8", newline="\n") as file:
+                file.write(json.dumps(self._stamp()).ljust(STAMP_WIDTH - 1) + "\n")
+                file.write(json.dumps(self._header, ensure_ascii=False) + "\n")
+                file.write(json.dumps(rows, ensure_ascii=False) + "\n")
+        except (IOError, OSError) as e:
+            print(f"Fehler beim Schreiben der Datei '{self._index_path}': {e}")
+
+    def _save_stamp(self):
+        """Aktualisiert nach dem Überschreiben einer Zeile nur den Zeitstempel im Index."""
+        try:
+            with open(self._index_path, "r+b") as file:
+                file.write(json.dumps(self._stamp()).ljust(STAMP_WIDTH - 1).encode("utf-8"))
+        except (IOError, OSError) as e:
+            print(f"Fehler beim Schreiben der Datei '{self._index_path}': {e}")
+
+    def _rewrite(self, replacements, added_columns=()):
+        """
+        Schreibt die Datei mit ersetzten Zeilen neu und ersetzt sie atomar.
+
+        Alle Zeilen erhalten ROW_RESERVE Bytes Freiraum, der Index wird dabei neu berechnet.
+
+        Args:
+            replacements (dict): (Student, Modul) -> neue Zeile als Bytes ohne Zeilenende.
+            added_columns (list, optional): Spalten, die an die Kopfzeile angehängt werden;
+                die übrigen Zeilen erhalten dafür leere Felder.
+        """
+        order = sorted(self._rows.items(), key=lambda item: item[1][0])
+        padding = b" " * ROW_RESERVE
+        empty_fields = b"," * len(added_columns)
+        temp_path = self._path + ".tmp"
+
+        header = self._map[:self._data_start]
+        if added_columns:
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator="").writerow(added_columns)
+            header = header.rstrip(b"\r\n") + b"," + buffer.getvalue().encode("utf-8") + self._line_end
+
+        rows = {}
+        with open(temp_path, "wb") as file:
+            file.write(header)
+            position = len(header)
+            for key, (offset, length) in order:
+                data = replacements.get(key)
+                if data is None:
+                    data = self._map[offset:offset + length].rstrip(b" ") + empty_fields
+                data += padding
+                file.write(data + self._line_end)
+                rows[key] = (position, len(data))
+                position += len(data) + len(self._line_end)
+
+        self.close()
+        os.replace(temp_path, self._path)
+        self._open()
+        self._rows = {}
+        self._students = {}
+        for (student, name), (offset, length) in rows.items():
+            self._add_row(student, name, offset, length)
+        self._save_index()
+
+    # --- Zeilen ---
+
+    def _parse(self, offset, length):
+        """Parst eine Zeile zu Spaltenname -> Text."""
+        line = self._map[offset:offset + length].decode("utf-8")
+        values = next(csv.reader([line]), [])
+        values += [""] * (len(self._header) - len(values))
+        return {name: value.strip() for name, value in zip(self._header, values)}
+
+    def _format(self, student, module):
+        """Formatiert ein Modul als Zeile in der Spaltenfolge der Datei, ohne Zeilenende."""
+        row = {"Student": student, **module.to_dict()}
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="").writerow([row.get(name, "") for name in self._header])
+        return buffer.getvalue().encode("utf-8")
+
+    def _to_module(self, row):
+        """Wandelt eine geparste Zeile anhand von MODULE_SCHEMA in ein Modul um."""
+        values = {}
+        issues = []
+        for name, convert in MODULE_SCHEMA.items():
+            try:
+                values[name] = convert(row.get(name, ""))
+            except ValueError as e:
+                issues.append(LoadIssue(self._path, None, name, f"{row.get('Student')}/{row.get('Name')}: {e}"))
+        if issues:
+            raise CsvLoadError(issues)
+        return Module(values["Name"], values["ECTS"], values["Status"], values["Note"], values["Datum"], values["Bestanden"], values["Versuche"])
@@ -0,0 +1,237 @@
+from datetime import datetime
+
+
+class StudyPlan:
+    """
+    Monatsweiser Belegungsplan für die offenen Module.
+    """
+    def __init__(self, months, unplanned, missing_ects, capacity):
+        """
+        Args:
+            months (list): Pro Monat ein Tupel (Monatsanfang als datetime, Liste von (Modulname, ECTS)).
+            unplanned (list): Namen der Module, die bis zum Studienende nicht eingeplant werden konnten.
+            missing_ects (int): Bis zum Abschluss fehlende ECTS.
+            capacity (int): ECTS, die höchstens pro Monat eingeplant werden.
+        """
+        self._months = months
+        self._unplanned = unplanned
+        self._missing_ects = missing_ects
+        self._capacity = capacity
+
+    def get_months(self):
+        """Gibt die Monate mit eingeplanten Modulen zurück, leere Monate eingeschlossen."""
+        return self._months
+
+    def get_unplanned(self):
+        """Gibt die Module zurück, die nicht eingeplant werden konnten."""
+        return self._unplanned
+
+    def get_capacity(self):
+        """Gibt die Kapazität in ECTS pro Monat zurück."""
+        return self._capacity
+
+    def get_planned_ects(self):
+        """Gibt die Summe der eingeplanten ECTS zurück."""
+        return sum(ects for _, modules in self._months for _, ects in modules)
+
+    def get_completion_month(self):
+        """
+        Gibt den Monat zurück, in dem das letzte eingeplante Modul abgeschlossen wird.
+
+        Returns:
+            datetime: Monatsanfang oder None, wenn nichts eingeplant ist.
+        """
+        for month, modules in reversed(self._months):
+            if modules:
+                return month
+        return None
+
+    def meets_target(self):
+        """Gibt True zurück, wenn die eingeplanten ECTS die fehlenden ECTS bis zum Studienende decken."""
+        return self.get_planned_ects() >= self._missing_ects
+
+    def report(self):
+        """
+        Erstellt eine Übersicht mit einer Zeile pro Monat mit eingeplanten Modulen.
+
+        Returns:
+            str: Übersicht, z.B. "03.2026  15 ECTS  Mathematik I, Statistik".
+        """
+        lines = []
+        for month, modules in self._months:
+            if modules:
+                names = ", ".join(name for name, _ in modules)
+                lines.append(f"{month.strftime('%m.%Y')} {sum(ects for _, ects in modules):>3} ECTS  {names}")
+        if self._unplanned:
+            lines.append(f"Nicht einplanbar: {', '.join(self._unplanned)}")
+        lines.append(f"Eingeplant {self.get_planned_ects()} von {self._missing_ects} fehlenden ECTS")
+        return "\n".join(lines)
+
+
+def iter_months(start, end):
+    """
+    Liefert die Monatsanfänge vom Monat von start bis einschließlich dem Monat von end.
+
+    Args:
+        start (datetime): Erster Monat, z.B. jetzt; der angebrochene Monat zählt mit.
+        end (datetime): Letzter Monat, z.B. das Studienende.
+
+    Yields:
+        datetime: Erster Tag jedes Monats.
+    """
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        yield datetime(year, month, 1)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def plan_modules(modules, months, capacity, missing_ects, prerequisites=None):
+    """
+    Verteilt offene Module auf Monate, sodass die fehlenden ECTS möglichst früh erreicht werden.
+
+    Monat für Monat wird aus den verfügbaren Modulen (alle Voraussetzungen in
+    einem früheren Monat abgeschlossen) per Rucksack-Optimierung über die ECTS
+    die beste Auswahl bis zur Kapazität bestimmt. Bewertet wird zuerst die
+    Summe der ECTS, dann die Länge der Ketten von Modulen, die auf einem Modul
+    aufbauen, dann die Summe der quadrierten ECTS (ein Modul mit 10 ECTS vor
+    zwei mit 5) und zuletzt die Reihenfolge im Studienplan. So werden
+    Voraussetzungen anderer Module und große Module früh eingeplant. Ein Monat
+    kostet O(Module · Kapazität), ein ganzer Plan liegt im Millisekundenbereich.
+
+    Args:
+        modules (list): Offene Module als (Name, ECTS) in Reihenfolge des Studienplans.
+        months (list): Verfügbare Monate als datetime, z.B. aus iter_months.
+        capacity (int): Höchstens pro Monat eingeplante ECTS.
+        missing_ects (int): Bis zum Abschluss fehlende ECTS.
+        prerequisites (dict, optional): Modulname -> Namen der Module, die vorher abgeschlossen sein müssen.
+            Voraussetzungen, die nicht offen sind, gelten als erfüllt.
+
+    Returns:
+        StudyPlan: Plan mit allen verfügbaren Monaten.
+
+    Raises:
+        ValueError: Wenn die Kapazität nicht positiv ist.
+    """
+    if capacity <= 0:
+        raise ValueError(f"Die Kapazität muss positiv sein, erhalten: {capacity}")
+
+    ects_of = dict(modules)
+    position_of = {name: position for position, (name, _) in enumerate(modules)}
+    requires = {
+        name: {required for required in (prerequisites or {}).get(name, ()) if required in ects_of and required != name}
+        for name in ects_of
+    }
+    chain = _chain_lengths(requires)
+
+    remaining = set(ects_of)
+    done = set()
+    plan = []
+    for month in months:
+        available = [
+            name for name in sorted(remaining, key=position_of.get)
+            if ects_of[name] <= capacity and requires[name] <= done
+        ]
+        chosen = _best_selection(
+            [(ects_of[name], (ects_of[name], chain[name], ects_of[name] ** 2, -position_of[name])) for name in available],
+            capacity
+        )
+        selected = [available[index] for index in chosen]
+        plan.append((month, [(name, ects_of[name]) for name in selected]))
+        remaining.difference_update(selected)
+        done.update(selected)
+        if not remaining:
+            plan.extend((later, []) for later in months[len(plan):])
+            break
+
+    unplanned = sorted(remaining, key=position_of.get)
+    return StudyPlan(plan, unplanned, missing_ects, capacity)
+
+
+def find_minimum_capacity(modules, months, missing_ects, prerequisites=None):
+    """
+    Sucht die kleinste Kapazität pro Monat, mit der die fehlenden ECTS bis zum letzten Monat erreicht werden.
+
+    Die untere Schranke sind die fehlenden ECTS geteilt durch die Monate, die obere
+    die Summe aller offenen ECTS; dazwischen wird binär gesucht.
+
+    Returns:
+        int: Kapazität in ECTS pro Monat oder None, wenn auch die volle Summe nicht reicht
+            (z.B. zu wenige Monate für eine Kette von Voraussetzungen).
+    """
+    total = sum(ects for _, ects in modules)
+    if not months or total < missing_ects:
+        return None
+
+    low = max(-(-missing_ects // len(months)), 1)
+    high = max(total, low)
+    if not plan_modules(modules, months, high, missing_ects, prerequisites).meets_target():
+        return None
+    while low < high:
+        middle = (low + high) // 2
+        if plan_modules(modules, months, middle, missing_ects, prerequisites).meets_target():
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def _best_selection(items, capacity):
+    """
+    Wählt per 0/1-Rucksack die Teilmenge mit der höchsten Bewertung, deren Gewicht die Kapazität nicht überschreitet.
+
+    Args:
+        items (list): (Gewicht, Bewertung) mit Bewertungen als Tupel, die komponentenweise addiert
+            und lexikographisch verglichen werden.
+        capacity (int): Höchstgewicht.
+
+    Returns:
+        list: Indizes der gewählten Elemente in aufsteigender Reihenfolge.
+    """
+    if not items:
+        return []
+    zero = tuple(0 for _ in items[0][1])
+    best = [zero] * (capacity + 1)
+    chosen = [0] * (capacity + 1)
+    for index, (weight, value) in enumerate(items):
+        for budget in range(capacity, weight - 1, -1):
+            candidate = tuple(a + b for a, b in zip(best[budget - weight], value))
+            if candidate > best[budget]:
+                best[budget] = candidate
+                chosen[budget] = chosen[budget - weight] | (1 << index)
+    mask = chosen[capacity]
+    return [index for index in range(len(items)) if mask >> index & 1]
+
+
+def _chain_lengths(requires):
+    """
+    Berechnet pro Modul die Länge der längsten Kette von Modulen, die darauf aufbauen.
+
+    Module in einem Zyklus von Voraussetzungen werden nie verfügbar und erhalten 0.
+
+    Args:
+        requires (dict): Modulname -> Menge der vorausgesetzten Module.
+
+    Returns:
+        dict: Modulname -> Kettenlänge (0, wenn kein Modul darauf aufbaut).
+    """
+    dependents = {name: [] for name in requires}
+    for name, required in requires.items():
+        for prerequisite in required:
+            dependents[prerequisite].append(name)
+
+    lengths = {}
+    visiting = set()
+
+    def visit(name):
+        if name in lengths:
+            return lengths[name]
+        if name in visiting:
+            return 0
+        visiting.add(name)
+        lengths[name] = max((visit(dependent) + 1 for dependent in dependents[name]), default=0)
+        visiting.discard(name)
+        return lengths[name]
+
+    for name in requires:
+        visit(name)
+    return lengths
@@ -0,0 +1,135 @@
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import hashlib
+import json
+import threading
+from urllib.parse import urlparse, parse_qs
+
+
+class PortalStubServer:
+    """
+    Lokaler Nachbau des Prüfungsportals für Tests und Messungen.
+
+    Stellt pro Person die Prüfungsleistungen unter
+    GET /students/<id>/results?since=<ISO-Zeitstempel>&page=<n>&page_size=<k>
+    als JSON bereit. Antworten tragen ein ETag, das den Stand der Leistungen
+    einer Person kennzeichnet, unabhängig von since. Stimmt If-None-Match
+    überein, gab es seitdem keine Änderung und der Server antwortet mit 304 ohne
+    Inhalt, auch wenn since inzwischen weitergerückt ist. Verbindungen bleiben offen (HTTP/1.1).
+    """
+    def __init__(self, host="127.0.0.1", port=0, page_size=50):
+        """
+        Args:
+            host (str, optional): Adresse, an die der Server gebunden wird.
+            port (int, optional): Port, 0 wählt einen freien Port.
+            page_size (int, optional): Standardanzahl Ergebnisse pro Seite.
+        """
+        self._results = {}
+        self._lock = threading.Lock()
+        self._page_size = page_size
+        self._request_count = 0
+        self._server = ThreadingHTTPServer((host, port), self._create_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def get_base_url(self):
+        """Gibt die Basis-URL des Servers zurück, z.B. "http://127.0.0.1:8123"."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def get_request_count(self):
+        """Gibt die Anzahl der bisher beantworteten Anfragen zurück."""
+        return self._request_count
+
+    def add_result(self, student_id, module_name, mark, date):
+        """
+        Trägt eine Prüfungsleistung ein, sie erhält den aktuellen Zeitpunkt als Änderungszeit.
+
+        Args:
+            student_id (str): ID der Person.
+            module_name (str): Name des Moduls.
+            mark (float): Note.
+            date (datetime): Prüfungsdatum.
+        """
+        with self._lock:
+            results = self._results.setdefault(student_id, [])
+            updated = datetime.now().isoformat(timespec="microseconds")
+            # --- Änderungszeiten pro Person streng monoton halten ---
+            if results and updated <= results[-1]["updated"]:
+                updated = _next_timestamp(results[-1]["updated"])
+            results.append({"module": module_name, "mark": mark, "date": date.strftime("%Y-%m-%d"), "updated": updated})
+
+    def start(self):
+        """Startet den Server in einem Hintergrund-Thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.get_base_url()
+
+    def stop(self):
+        """Beendet den Server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _query(self, student_id, since, page, page_size):
+        """Gibt (Seiteninhalt, Seitenanzahl, ETag) für eine Anfrage zurück."""
+        with self._lock:
+            results = self._results.get(student_id, [])
+            last_update = results[-1]["updated"] if results else ""
+            matching = [result for result in results if since is None or result["updated"] > since]
+
+        pages = max(1, -(-len(matching) // page_size))
+        content = matching[(page - 1) * page_size:page * page_size]
+        etag = '"' + hashlib.sha1(f"{student_id}|{page}|{page_size}|{last_update}".encode()).hexdigest() + '"'
+        return content, pages, etag
+
+    def _create_handler(self):
+        """Erstellt die Handler-Klasse mit Zugriff auf diesen Server."""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # --- Kopf und Inhalt gehen getrennt raus, ohne TCP_NODELAY bremst das verzögerte ACK ---
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                with stub._lock:
+                    stub._request_count += 1
+                url = urlparse(self.path)
+                parts = url.path.strip("/").split("/")
+                if len(parts) != 3 or parts[0] != "students" or parts[2] != "results":
+                    self._send(404, b"")
+                    return
+
+                query = parse_qs(url.query)
+                since = query.get("since", [None])[0]
+                page = int(query.get("page", ["1"])[0])
+                page_size = int(query.get("page_size", [str(stub._page_size)])[0])
+
+                content, pages, etag = stub._query(parts[1], since, page, page_size)
+                if self.headers.get("If-None-Match") == etag:
+                    self._send(304, b"", etag)
+                    return
+
+                body = json.dumps({"results": content, "page": page, "pages": pages}).encode("utf-8")
+                self._send(200, body, etag)
+
+            def _send(self, status, body, etag=None):
+                self.send_response(status)
+                if etag:
+                    self.send_header("ETag", etag)
+                if status != 304:
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def _next_timestamp(timestamp):
+    """Gibt den Zeitstempel eine Mikrosekunde nach dem übergebenen zurück."""
+    return (datetime.fromisoformat(timestamp) + timedelta(microseconds=1)).isoformat(timespec="microseconds")
@@ -0,0 +1,344 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+import http.client
+import json
+import os
+import queue
+import threading
+import time
+from urllib.parse import urlencode, urlparse, quote
+
+from file_lock import replace_atomically
+
+
+class PortalSyncError(Exception):
+    """
+    Wird ausgelöst, wenn das Prüfungsportal eine unerwartete Antwort liefert.
+    """
+    def __init__(self, status, path):
+        """
+        Args:
+            status (int): HTTP-Statuscode der Antwort.
+            path (str): Angefragter Pfad.
+        """
+        super().__init__(f"Portal antwortete mit Status {status} auf '{path}'.")
+        self.status = status
+        self.path = path
+
+
+class ConnectionPool:
+    """
+    Hält eine begrenzte Anzahl offener HTTP-Verbindungen zu einem Host zur Wiederverwendung bereit.
+
+    Verbindungen werden erst bei Bedarf aufgebaut und nach Gebrauch zurückgelegt,
+    sodass aufeinanderfolgende Anfragen keinen neuen TCP-Verbindungsaufbau benötigen.
+    """
+    def __init__(self, host, port, size=8, timeout=10.0):
+        """
+        Args:
+            host (str): Hostname des Portals.
+            port (int): Port des Portals.
+            size (int, optional): Höchstzahl gleichzeitig offener Verbindungen.
+            timeout (float, optional): Zeitlimit einer Anfrage in Sekunden.
+        """
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._idle = queue.LifoQueue()
+        for _ in range(size):
+            self._idle.put(None)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def get_created_count(self):
+        """Gibt zurück, wie viele Verbindungen bisher aufgebaut wurden."""
+        return self._created
+
+    @contextmanager
+    def connection(self):
+        """
+        Kontextmanager, der eine freie Verbindung ausleiht und danach zurücklegt.
+
+        Tritt während der Nutzung ein Fehler auf, wird die Verbindung verworfen.
+        """
+        conn = self._idle.get()
+        if conn is None:
+            conn = http.client.HTTPConnection(self._host, self._port, timeout=self._timeout)
+            with self._lock:
+                self._created += 1
+        try:
+            yield conn
+        except Exception:
+            conn.close()
+            conn = None
+            raise
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        """Schließt alle momentan freien Verbindungen."""
+        connections = []
+        while True:
+            try:
+                connections.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        for conn in connections:
+            if conn is not None:
+                conn.close()
+            self._idle.put(None)
+
+
+class PortalClient:
+    """
+    Ruft Prüfungsleistungen inkrementell vom Prüfungsportal ab.
+
+    Es werden nur Leistungen übertragen, die sich seit dem letzten Abruf geändert
+    haben (Parameter since). Die erste Seite wird mit If-None-Match angefragt, bei
+    304 entfällt der Rest. Weitere Seiten werden parallel über den Verbindungspool
+    geladen.
+    """
+    def __init__(self, base_url, pool_size=8, page_size=50, max_workers=None):
+        """
+        Args:
+            base_url (str): Basis-URL des Portals, z.B. "http://127.0.0.1:8080".
+            pool_size (int, optional): Anzahl wiederverwendbarer Verbindungen.
+            page_size (int, optional): Ergebnisse pro Seite.
+            max_workers (int, optional): Parallele Anfragen, standardmäßig pool_size.
+        """
+        url = urlparse(base_url)
+        self._pool = ConnectionPool(url.hostname, url.port or 80, pool_size)
+        self._page_size = page_size
+        self._max_workers = max_workers or pool_size
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+
+    def get_pool(self):
+        """Gibt den Verbindungspool zurück."""
+        return self._pool
+
+    def get_max_workers(self):
+        """Gibt die Anzahl paralleler Anfragen zurück."""
+        return self._max_workers
+
+    def fetch_results(self, student_id, since=None, etag=None):
+        """
+        Lädt alle seit `since` geänderten Prüfungsleistungen einer Person.
+
+        Args:
+            student_id (str): ID der Person.
+            since (str, optional): ISO-Zeitstempel der letzten bekannten Änderung.
+            etag (str, optional): ETag der letzten Antwort auf dieselbe Anfrage.
+
+        Returns:
+            tuple: (Liste der Ergebnisse als dict, ETag der ersten Seite). Bei 304 ist die Liste leer.
+
+        Raises:
+            PortalSyncError: Bei einem unerwarteten Statuscode.
+        """
+        status, new_etag, first_page = self._get_page(student_id, since, 1, etag)
+        if status == 304:
+            return [], etag
+
+        results = list(first_page["results"])
+        if first_page["pages"] > 1:
+            pages = self._executor.map(
+                lambda page: self._get_page(student_id, since, page)[2],
+                range(2, first_page["pages"] + 1)
+            )
+            for page in pages:
+                results.extend(page["results"])
+        return results, new_etag
+
+    def close(self):
+        """Beendet den Thread-Pool und schließt alle Verbindungen."""
+        self._executor.shutdown()
+        self._pool.close()
+
+    def _get_page(self, student_id, since, page, etag=None):
+        """Fragt eine Seite an und gibt (Status, ETag, JSON-Inhalt oder None) zurück."""
+        parameters = {"page": page, "page_size": self._page_size}
+        if since is not None:
+            parameters["since"] = since
+        path = f"/students/{quote(student_id)}/results?{urlencode(parameters)}"
+        headers = {"If-None-Match": etag} if etag else {}
+
+        with self._pool.connection() as conn:
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # --- Vom Server geschlossene Keep-Alive-Verbindung einmal neu aufbauen ---
+                conn.close()
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+            body = response.read()
+
+        if response.status == 304:
+            return 304, etag, None
+        if response.status != 200:
+            raise PortalSyncError(response.status, path)
+        return 200, response.getheader("ETag"), json.loads(body)
+
+
+class SyncState:
+    """
+    Merkt sich pro Person den Zeitstempel der letzten übernommenen Änderung und das letzte ETag.
+
+    Der Zustand wird als JSON-Datei gespeichert, damit ein Neustart nur neue Leistungen abruft.
+    """
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str, optional): Pfad der JSON-Datei, ohne Pfad wird nichts gespeichert.
+        """
+        self._path = path
+        self._entries = {}
+        if path is not None and os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                self._entries = json.load(file)
+
+    def get(self, student_id):
+        """
+        Gibt den gespeicherten Stand einer Person zurück.
+
+        Returns:
+            tuple: (since oder None, ETag oder None).
+        """
+        entry = self._entries.get(student_id, {})
+        return entry.get("since"), entry.get("etag")
+
+    def set(self, student_id, since, etag):
+        """Speichert den Stand einer Person (nur im Speicher, siehe save)."""
+        self._entries[student_id] = {"since": since, "etag": etag}
+
+    def save(self):
+        """Schreibt den Zustand in die JSON-Datei, atomar ersetzt, damit ein Absturz keine halbe Datei hinterlässt."""
+        if self._path is None:
+            return
+        try:
+            with replace_atomically(self._path) as temp_path:
+                with open(temp_path, "w", encoding="utf-8") as file:
+                    json.dump(self._entries, file)
+        except (IOError, OSError) as e:
+            print(f"Fehler beim Speichern des Synchronisationsstands: {e}")
+
+
+class SyncReport:
+    """
+    Ergebnis eines Synchronisationslaufs mit Latenzen pro Person.
+    """
+    def __init__(self):
+        self._latencies = []
+        self._fetched = 0
+        self._applied = 0
+        self._not_modified = 0
+
+    def add(self, latency, fetched, applied):
+        """Erfasst den Abgleich einer Person (Dauer in Sekunden, geladene und übernommene Leistungen)."""
+        self._latencies.append(latency)
+        self._fetched += fetched
+        self._applied += applied
+        if fetched == 0:
+            self._not_modified += 1
+
+    def get_student_count(self):
+        """Gibt die Anzahl abgeglichener Personen zurück."""
+        return len(self._latencies)
+
+    def get_fetched_count(self):
+        """Gibt die Anzahl übertragener Leistungen zurück."""
+        return self._fetched
+
+    def get_applied_count(self):
+        """Gibt die Anzahl wirksam übernommener Leistungen zurück."""
+        return self._applied
+
+    def get_not_modified_count(self):
+        """Gibt die Anzahl der Personen ohne neue Leistungen zurück."""
+        return self._not_modified
+
+    def get_latency_percentile(self, percent):
+        """
+        Gibt ein Perzentil der Latenz pro Person zurück.
+
+        Args:
+            percent (float): Perzentil zwischen 0 und 100.
+
+        Returns:
+            float: Latenz in Sekunden, 0.0 ohne Messwerte.
+        """
+        if not self._latencies:
+            return 0.0
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def parse_result(result):
+    """
+    Wandelt ein Ergebnis des Portals in ein Tupel für Controller.apply_results um.
+
+    Args:
+        result (dict): Ergebnis mit "module", "mark" und "date" (JJJJ-MM-TT).
+
+    Returns:
+        tuple: (Modulname, Note, Datum).
+    """
+    return result["module"], float(result["mark"]), datetime.strptime(result["date"], "%Y-%m-%d")
+
+
+def sync_student(client, controller, student_id, state):
+    """
+    Gleicht die Leistungen einer Person ab und übernimmt sie gesammelt in den Controller.
+
+    Args:
+        client (PortalClient): Client des Portals.
+        controller (Controller): Controller des Studienverlaufs der Person.
+        student_id (str): ID der Person.
+        state (SyncState): Synchronisationsstand, wird aktualisiert.
+
+    Returns:
+        tuple: (Anzahl übertragener Leistungen, Anzahl wirksamer Änderungen).
+    """
+    since, etag = state.get(student_id)
+    results, etag = client.fetch_results(student_id, since, etag)
+    if not results:
+        state.set(student_id, since, etag)
+        return 0, 0
+
+    # --- Nach Änderungszeit ordnen, damit die letzte Änderung eines Moduls gewinnt ---
+    results.sort(key=lambda result: result["updated"])
+    _, applied = controller.apply_results([parse_result(result) for result in results])
+
+    # --- Neuer since-Stand mit dem ETag der letzten Antwort: ohne neue Leistungen folgt 304 ---
+    state.set(student_id, results[-1]["updated"], etag)
+    return len(results), applied
+
+
+def sync_all(client, controllers, state, max_workers=None):
+    """
+    Gleicht mehrere Personen parallel ab und speichert danach den Synchronisationsstand.
+
+    Args:
+        client (PortalClient): Client des Portals.
+        controllers (dict): ID der Person -> Controller.
+        state (SyncState): Synchronisationsstand.
+        max_workers (int, optional): Anzahl parallel abgeglichener Personen.
+
+    Returns:
+        SyncReport: Anzahl übertragener/übernommener Leistungen und Latenzen.
+    """
+    def sync_one(item):
+        student_id, controller = item
+        started = time.perf_counter()
+        fetched, applied = sync_student(client, controller, student_id, state)
+        return time.perf_counter() - started, fetched, applied
+
+    report = SyncReport()
+    # --- Eigener Pool: Seitenabrufe laufen im Pool des Clients und dürfen hier nicht blockieren ---
+    with ThreadPoolExecutor(max_workers=max_workers or client.get_max_workers()) as executor:
+        for latency, fetched, applied in executor.map(sync_one, controllers.items()):
+            report.add(latency, fetched, applied)
+
+    state.save()
+    return report
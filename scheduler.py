@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta
+
+
+class RefreshScheduler:
+    """
+    Löst über root.after eine Aktualisierung aus, sobald ein neuer Tag beginnt.
+
+    Zu jeder Tagesgrenze (und damit auch jeder Monatsgrenze) wird der Callback
+    genau einmal mit einem gemeinsamen Bezugszeitpunkt aufgerufen, den alle
+    datumsabhängigen Kennzahlen dieser Aktualisierung verwenden. Die Wartezeit ist
+    auf `max_delay_ms` begrenzt, damit Ruhezustand oder Zeitumstellungen nur zu
+    einer kurzen Verspätung führen.
+    """
+    def __init__(self, root, callback, clock=datetime.now, max_delay_ms:int = 3600000):
+        """
+        Args:
+            root (tk.Tk): Hauptfenster, dessen after()-Mechanismus genutzt wird.
+            callback (callable): Wird mit (now, month_changed) aufgerufen.
+            clock (callable, optional): Liefert den aktuellen Zeitpunkt, standardmäßig datetime.now.
+            max_delay_ms (int, optional): Höchste Wartezeit zwischen zwei Prüfungen in Millisekunden.
+        """
+        self._root = root
+        self._callback = callback
+        self._clock = clock
+        self._max_delay_ms = max_delay_ms
+        self._last_date = None
+        self._after_id = None
+
+    def start(self):
+        """Merkt sich das aktuelle Datum und plant die erste Prüfung."""
+        now = self._clock()
+        self._last_date = now.date()
+        self._schedule(now)
+
+    def stop(self):
+        """Bricht die geplante Prüfung ab."""
+        if self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        """Prüft, ob ein neuer Tag begonnen hat, und ruft dann den Callback auf."""
+        self._after_id = None
+        now = self._clock()
+        if now.date() != self._last_date:
+            month_changed = (now.year, now.month) != (self._last_date.year, self._last_date.month)
+            self._last_date = now.date()
+            self._callback(now, month_changed)
+        self._schedule(now)
+
+    def _schedule(self, now):
+        """Plant die nächste Prüfung kurz nach Mitternacht, höchstens max_delay_ms entfernt."""
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        delay_ms = int((next_midnight - now).total_seconds() * 1000) + 1000
+        self._after_id = self._root.after(min(delay_ms, self._max_delay_ms), self._tick)
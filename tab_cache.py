@@ -0,0 +1,79 @@
+from collections import OrderedDict
+
+
+class TabCache:
+    """
+    Merkt sich die aufgebauten Dashboards der Reiter in Reihenfolge ihrer letzten Nutzung.
+
+    Das Budget ist eine Anzahl aufgebauter Dashboards, keine Speichergröße: Jedes
+    Dashboard besteht aus denselben Tabellen und sechs Kuchendiagrammen, belegt also
+    ungefähr gleich viel Speicher, während sich der tatsächliche Verbrauch von Tk- und
+    Matplotlib-Widgets aus Python heraus nicht zuverlässig messen lässt.
+    """
+    def __init__(self, max_built_tabs:int):
+        """
+        Args:
+            max_built_tabs (int): Höchstzahl gleichzeitig aufgebauter Dashboards (mindestens 1).
+        """
+        self._max_built_tabs = max(1, max_built_tabs)
+        # --- Reiterindex -> Dashboard, zuletzt genutztes am Ende ---
+        self._entries = OrderedDict()
+
+    def get_max_built_tabs(self):
+        """Gibt die Höchstzahl gleichzeitig aufgebauter Dashboards zurück."""
+        return self._max_built_tabs
+
+    def get(self, index):
+        """
+        Gibt das Dashboard eines Reiters zurück, ohne es als genutzt zu markieren.
+
+        Returns:
+            object or None: Dashboard oder None, wenn der Reiter nicht aufgebaut ist.
+        """
+        return self._entries.get(index)
+
+    def touch(self, index):
+        """
+        Markiert ein aufgebautes Dashboard als zuletzt genutzt.
+
+        Returns:
+            bool: True, wenn der Reiter aufgebaut ist, sonst False.
+        """
+        if index not in self._entries:
+            return False
+        self._entries.move_to_end(index)
+        return True
+
+    def add(self, index, dashboard):
+        """
+        Nimmt ein neu aufgebautes Dashboard als zuletzt genutztes auf.
+
+        Args:
+            index (int): Reiterindex.
+            dashboard (object): Aufgebautes Dashboard.
+        """
+        self._entries[index] = dashboard
+        self._entries.move_to_end(index)
+
+    def pop_unused(self):
+        """
+        Entfernt die am längsten nicht genutzten Dashboards, bis das Budget eingehalten ist.
+
+        Returns:
+            list: (Reiterindex, Dashboard) der entfernten Einträge, ältester zuerst.
+        """
+        evicted = []
+        while len(self._entries) > self._max_built_tabs:
+            evicted.append(self._entries.popitem(last=False))
+        return evicted
+
+    def get_indices(self):
+        """Gibt die Indizes der aufgebauten Reiter zurück, am längsten nicht genutzter zuerst."""
+        return list(self._entries)
+
+    def get_dashboards(self):
+        """Gibt die aufgebauten Dashboards zurück, am längsten nicht genutztes zuerst."""
+        return list(self._entries.values())
+
+    def __len__(self):
+        return len(self._entries)
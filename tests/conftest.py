@@ -0,0 +1,33 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# --- Die Module liegen flach im Projektverzeichnis ---
+sys.path.insert(0, PROJECT_DIR)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Kopiert Studiengangs-, Semester- und Moduldatei in ein temporäres Verzeichnis."""
+    for name in ("course_of_study.csv", "semester.csv", "modules.csv"):
+        shutil.copy(os.path.join(PROJECT_DIR, name), tmp_path / name)
+    return tmp_path
+
+
+@pytest.fixture
+def load_course(data_dir):
+    """Lädt den Studienverlauf aus den Kopien, optional mit einer anderen Moduldatei."""
+    from curriculum import MODULE_INDICES_PER_SEMESTER
+    from loader import load_course_of_study
+
+    def load(modules_path=None):
+        return load_course_of_study(
+            MODULE_INDICES_PER_SEMESTER,
+            course_path=str(data_dir / "course_of_study.csv"),
+            semester_path=str(data_dir / "semester.csv"),
+            modules_path=str(modules_path or data_dir / "modules.csv"),
+        )
+    return load
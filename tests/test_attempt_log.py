@@ -0,0 +1,74 @@
+from datetime import datetime
+
+from attempt_log import AttemptLog
+from module import Module
+
+
+def test_best_latest_and_counted_attempt():
+    log = AttemptLog([
+        (5.0, datetime(2025, 1, 10), False),
+        (3.0, datetime(2025, 3, 10), True),
+        (1.7, datetime(2025, 2, 10), True),
+    ])
+
+    assert len(log) == 3
+    assert log.get_best_index() == 2
+    assert log.get_latest_index() == 1
+    assert log.get_passed_index() == 2
+    assert log.get_counted_index() == 2
+    assert log.get(0) == (5.0, datetime(2025, 1, 10), False)
+
+
+def test_counted_attempt_is_latest_without_pass():
+    log = AttemptLog([(5.0, datetime(2025, 1, 10), False), (4.3, datetime(2025, 2, 10), False)])
+
+    assert log.get_passed_index() is None
+    assert log.get_counted_index() == 1
+
+
+def test_same_day_attempt_corrects_latest_and_reindexes():
+    log = AttemptLog([(5.0, datetime(2025, 1, 10), False), (1.3, datetime(2025, 2, 10), True)])
+
+    index = log.append(5.0, datetime(2025, 2, 10, 15, 30), False)
+
+    assert index == 1
+    assert len(log) == 2
+    assert log.get(1) == (5.0, datetime(2025, 2, 10), False)
+    assert log.get_best_index() == 0
+    assert log.get_passed_index() is None
+    assert log.get_counted_index() == 1
+
+
+def test_module_status_follows_corrected_attempt():
+    module = Module("Statistik", 5, "Offen")
+    module.add_attempt(2.0, datetime(2025, 2, 10), True)
+    assert module.get_performance().get_passed()
+
+    module.add_attempt(5.0, datetime(2025, 2, 10), False)
+
+    assert module.get_attempt_count() == 1
+    assert not module.get_performance().get_passed()
+
+
+def test_course_reopens_module_after_same_day_correction(load_course):
+    course = load_course()
+    course.update_module_performance("Artificial Intelligence", 2.0, datetime(2025, 2, 10))
+    assert course.find_module("Artificial Intelligence").get_status() == "Abgeschlossen"
+
+    course.update_module_performance("Artificial Intelligence", 5.0, datetime(2025, 2, 10))
+
+    module = course.find_module("Artificial Intelligence")
+    assert module.get_status() == "Offen"
+    assert module.get_attempts() == ((5.0, datetime(2025, 2, 10), False),)
+    assert "Artificial Intelligence" in course.get_module_index().get_names_by_status("Offen")
+
+
+def test_failed_retake_keeps_earlier_pass(load_course):
+    course = load_course()
+    course.update_module_performance("Artificial Intelligence", 3.7, datetime(2025, 2, 10))
+    course.update_module_performance("Artificial Intelligence", 5.0, datetime(2025, 4, 10))
+
+    module = course.find_module("Artificial Intelligence")
+    assert module.get_status() == "Abgeschlossen"
+    assert module.get_performance().get_mark() == 3.7
+    assert module.get_attempt_count() == 2
@@ -0,0 +1,97 @@
+import random
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from cohort_stats import CohortArrays, compute_module_statistics
+
+STUDENT_COUNT = 250
+
+
+@pytest.fixture
+def cohort(load_course):
+    """Zufällige Kohorte mit dem Curriculum der Beispieldaten, etwa die Hälfte der Leistungen fehlt."""
+    modules = [module for semester in load_course().get_semester() for module in semester.get_modules()]
+    cohort = CohortArrays.allocate([module.get_name() for module in modules], [module.get_ects() for module in modules], STUDENT_COUNT)
+    generator = random.Random(7)
+    for row in range(STUDENT_COUNT):
+        for column in range(len(modules)):
+            if generator.random() < 0.5:
+                continue
+            mark = generator.randint(10, 50) / 10
+            cohort.marks[row, column] = mark
+            cohort.passed[row, column] = 1 if mark <= 4.0 else 0
+            cohort.months[row, column] = generator.randint(0, 60)
+    return cohort
+
+
+def reference_statistics(cohort, column):
+    """Kennzahlen eines Moduls mit einfachen Python-Schleifen über alle Studierenden."""
+    marks, months = [], []
+    passed_marks = []
+    for row in range(cohort.get_student_count()):
+        mark = float(cohort.marks[row, column])
+        if mark != mark:
+            continue
+        marks.append(mark)
+        if cohort.passed[row, column]:
+            passed_marks.append(mark)
+            months.append(int(cohort.months[row, column]))
+
+    distribution = {}
+    for mark in marks:
+        distribution[round(mark, 1)] = distribution.get(round(mark, 1), 0) + 1
+    months.sort()
+    return {
+        "attempts": len(marks),
+        "pass_rate": round(len(passed_marks) / len(marks) * 100, 2) if marks else None,
+        "mean_mark": round(sum(passed_marks) / len(passed_marks), 2) if passed_marks else None,
+        "distribution": distribution,
+        "median_months": months[len(months) // 2] if months else None,
+    }
+
+
+def statistics_as_dicts(statistics):
+    return [
+        {
+            "attempts": module.get_attempts(),
+            "pass_rate": module.get_pass_rate(),
+            "mean_mark": module.get_mean_mark(),
+            "distribution": module.get_mark_distribution(),
+            "median_months": module.get_median_months(),
+        }
+        for module in statistics
+    ]
+
+
+def test_serial_statistics_match_reference(cohort):
+    statistics = compute_module_statistics(cohort, workers=1)
+
+    assert [module.get_name() for module in statistics] == cohort.module_names
+    expected = [reference_statistics(cohort, column) for column in range(len(cohort.module_names))]
+    assert statistics_as_dicts(statistics) == expected
+
+
+def test_parallel_statistics_match_serial(cohort):
+    serial = compute_module_statistics(cohort, workers=1)
+    parallel = compute_module_statistics(cohort, workers=2, chunk_size=17)
+
+    assert statistics_as_dicts(parallel) == statistics_as_dicts(serial)
+
+
+def test_cohort_from_courses_matches_course_data(load_course):
+    course = load_course()
+    course.update_module_performance("Artificial Intelligence", 2.3, datetime(2025, 2, 10))
+    course.update_module_performance("Cloud Computing", 4.7, datetime(2025, 3, 1))
+
+    cohort = CohortArrays.from_courses([course, load_course()])
+
+    column = cohort.module_names.index("Artificial Intelligence")
+    assert cohort.marks[0, column] == np.float32(2.3)
+    assert cohort.passed[0, column] == 1
+    # --- Start 01.08.2024, Prüfung im Februar 2025 ---
+    assert cohort.months[0, column] == 6
+    assert cohort.passed[0, cohort.module_names.index("Cloud Computing")] == 0
+    assert np.isnan(cohort.marks[1]).all()
+    assert (cohort.months[1] == -1).all()
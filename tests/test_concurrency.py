@@ -0,0 +1,129 @@
+from datetime import datetime
+import threading
+import time
+
+import pytest
+
+from concurrency import ConcurrentChangeError, ReadWriteLock, StaleVersionError
+from controller import Controller
+
+TIMEOUT = 5.0
+
+
+def start_thread(target):
+    """Startet einen Daemon-Thread, damit ein fehlschlagender Test nicht hängen bleibt."""
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_until(condition):
+    """Wartet, bis condition() wahr ist, höchstens TIMEOUT Sekunden."""
+    deadline = time.monotonic() + TIMEOUT
+    while not condition():
+        assert time.monotonic() < deadline, "Zeitüberschreitung"
+        time.sleep(0.001)
+
+
+def test_read_lock_is_reentrant_and_shared():
+    lock = ReadWriteLock()
+    other_reader_inside = threading.Event()
+
+    def reader():
+        with lock.read_locked():
+            other_reader_inside.set()
+
+    with lock.read_locked():
+        with lock.read_locked():
+            thread = start_thread(reader)
+            assert other_reader_inside.wait(TIMEOUT)
+    thread.join(TIMEOUT)
+
+    with lock.write_locked():
+        pass
+
+
+def test_writer_may_read_but_not_reenter_write():
+    lock = ReadWriteLock()
+
+    with lock.write_locked():
+        with lock.read_locked():
+            pass
+        with pytest.raises(RuntimeError):
+            lock.acquire_write()
+
+    # --- Die Sperre ist danach wieder frei ---
+    with lock.write_locked():
+        pass
+
+
+def test_read_lock_cannot_be_upgraded():
+    lock = ReadWriteLock()
+
+    with lock.read_locked():
+        with pytest.raises(RuntimeError):
+            lock.acquire_write()
+
+    with lock.write_locked():
+        pass
+
+
+def test_waiting_writer_goes_before_new_readers():
+    lock = ReadWriteLock()
+    order = []
+
+    def writer():
+        with lock.write_locked():
+            order.append("writer")
+
+    def reader():
+        with lock.read_locked():
+            order.append("reader")
+
+    lock.acquire_read()
+    writer_thread = start_thread(writer)
+    wait_until(lambda: lock._waiting_writers == 1)
+    reader_thread = start_thread(reader)
+    time.sleep(0.05)
+    assert order == []
+
+    lock.release_read()
+    writer_thread.join(TIMEOUT)
+    reader_thread.join(TIMEOUT)
+    assert order == ["writer", "reader"]
+
+
+def test_writer_excludes_readers():
+    lock = ReadWriteLock()
+    inside = threading.Event()
+
+    def reader():
+        with lock.read_locked():
+            inside.set()
+
+    with lock.write_locked():
+        thread = start_thread(reader)
+        assert not inside.wait(0.05)
+    assert inside.wait(TIMEOUT)
+    thread.join(TIMEOUT)
+
+
+def test_outdated_version_raises_stale_version_error(load_course, data_dir):
+    controller = Controller(load_course(), str(data_dir / "modules.csv"))
+    version = controller.get_version()
+    controller.update_performance("Artificial Intelligence", 2.0, datetime(2025, 2, 10), expected_version=version)
+
+    with pytest.raises(StaleVersionError) as error:
+        controller.update_performance("Artificial Intelligence", 1.7, datetime(2025, 3, 10), expected_version=version)
+    with pytest.raises(StaleVersionError):
+        controller.apply_results([("Artificial Intelligence", 1.7, datetime(2025, 3, 10))], expected_version=version)
+
+    assert (error.value.expected_version, error.value.current_version) == (version, version + 1)
+    assert controller.get_course().find_module("Artificial Intelligence").get_attempt_count() == 1
+
+
+def test_concurrent_change_error_names_module():
+    error = ConcurrentChangeError("Statistik")
+
+    assert error.module_name == "Statistik"
+    assert "Statistik" in str(error)
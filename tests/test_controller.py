@@ -0,0 +1,66 @@
+from datetime import datetime
+
+import pytest
+
+from controller import Controller
+
+NAME = "Artificial Intelligence"
+
+
+@pytest.fixture
+def controller(load_course, data_dir):
+    return Controller(load_course(), str(data_dir / "modules.csv"))
+
+
+@pytest.mark.parametrize("mark", [0.7, 6.0])
+def test_update_performance_rejects_mark_outside_range(controller, load_course, mark):
+    version = controller.get_version()
+
+    with pytest.raises(ValueError):
+        controller.update_performance(NAME, mark, datetime(2025, 2, 10))
+    with pytest.raises(ValueError):
+        controller.apply_results([(NAME, 2.0, datetime(2025, 2, 10)), (NAME, mark, datetime(2025, 3, 10))])
+
+    assert controller.get_version() == version
+    assert controller.get_course().find_module(NAME).get_performance() is None
+    assert load_course().find_module(NAME).get_performance() is None
+
+
+def test_undo_skips_change_of_module_missing_from_curriculum(controller, capsys):
+    state = controller.get_course().find_module(NAME).get_state()
+    controller.update_performance(NAME, 2.0, datetime(2025, 2, 10))
+    # --- Änderung an einem Modul, das es z.B. nach einer Umbenennung nicht mehr gibt ---
+    controller.get_history().record("Umbenanntes Modul", state, state)
+
+    assert controller.undo() is None
+    assert "Umbenanntes Modul" in capsys.readouterr().out
+    assert controller.undo() == NAME
+    assert controller.get_course().find_module(NAME).get_state() == state
+    assert not controller.can_undo()
+
+
+def test_update_without_change_keeps_version_and_file(controller, data_dir):
+    controller.update_performance(NAME, 2.0, datetime(2025, 2, 10))
+    version = controller.get_version()
+    path = data_dir / "modules.csv"
+    stamp = path.stat().st_mtime_ns
+
+    assert controller.update_performance("Unbekanntes Modul", 2.0, datetime(2025, 2, 10)) == version
+    assert controller.update_performance(NAME, 2.0, datetime(2025, 2, 10)) == version
+    assert path.stat().st_mtime_ns == stamp
+    assert controller.update_performance(NAME, 1.7, datetime(2025, 3, 10), expected_version=version) == version + 1
+    assert path.stat().st_mtime_ns != stamp
+
+
+def test_metrics_share_one_point_in_time(controller):
+    controller.update_performance(NAME, 2.0, datetime(2025, 2, 10))
+    course = controller.get_course()
+    # --- Letzter Augenblick im Februar: jeder Wert muss noch zum Februar gehören ---
+    now = datetime(2025, 2, 28, 23, 59, 59, 999999)
+
+    metrics = controller.get_metrics(now)
+
+    assert metrics["ects_this_month"] == course.get_ects_this_month(now) == 5
+    assert metrics["time_left"] == course.get_time_left(now)
+    assert metrics["necessary_ects_pm"] == course.get_necessary_ects_pm(now)
+    assert controller.get_versioned_metrics(now) == (controller.get_version(), metrics)
@@ -0,0 +1,109 @@
+from datetime import datetime
+
+import pytest
+
+from concurrency import ConcurrentChangeError
+from controller import Controller
+from events import ModuleUpdated
+from loader import CsvLoadError
+
+NAME = "Artificial Intelligence"
+
+
+@pytest.fixture
+def open_controller(load_course, data_dir):
+    """Öffnet einen weiteren Controller auf derselben Moduldatei, wie es ein zweiter Prozess täte."""
+    path = str(data_dir / "modules.csv")
+    return lambda: Controller(load_course(), path)
+
+
+def disk_attempts(load_course):
+    """Gibt die Versuche des Moduls laut Datei zurück."""
+    return load_course().find_module(NAME).get_attempts()
+
+
+def test_attempts_of_both_writers_on_same_module_are_kept(open_controller, load_course):
+    first, second = open_controller(), open_controller()
+
+    first.update_performance(NAME, 5.0, datetime(2025, 1, 10))
+    second.update_performance(NAME, 2.0, datetime(2025, 2, 10))
+
+    expected = ((5.0, datetime(2025, 1, 10), False), (2.0, datetime(2025, 2, 10), True))
+    assert disk_attempts(load_course) == expected
+    assert second.get_course().find_module(NAME).get_attempts() == expected
+
+
+def test_apply_results_skips_attempt_written_by_other_writer(open_controller, load_course):
+    first, second = open_controller(), open_controller()
+    first.update_performance(NAME, 2.0, datetime(2025, 2, 10))
+
+    _, applied = second.apply_results([(NAME, 2.0, datetime(2025, 2, 10))])
+
+    assert applied == 0
+    assert len(disk_attempts(load_course)) == 1
+
+
+def test_undo_refuses_to_overwrite_change_of_other_writer(open_controller, load_course):
+    first, second = open_controller(), open_controller()
+    first.update_performance(NAME, 5.0, datetime(2025, 1, 10))
+    second.update_performance(NAME, 2.0, datetime(2025, 2, 10))
+
+    with pytest.raises(ConcurrentChangeError):
+        first.undo()
+
+    assert len(disk_attempts(load_course)) == 2
+    assert not first.can_undo()
+    assert first.get_course().find_module(NAME).get_status() == "Abgeschlossen"
+
+
+def test_undo_of_own_latest_change_succeeds(open_controller, load_course):
+    first, second = open_controller(), open_controller()
+    first.update_performance(NAME, 5.0, datetime(2025, 1, 10))
+    second.update_performance(NAME, 2.0, datetime(2025, 2, 10))
+
+    assert second.undo() == NAME
+    assert disk_attempts(load_course) == ((5.0, datetime(2025, 1, 10), False),)
+    assert second.redo() == NAME
+    assert len(disk_attempts(load_course)) == 2
+
+
+def test_refresh_adopts_changes_and_time_travel_sees_them(open_controller, load_course, data_dir):
+    first, second = open_controller(), open_controller()
+    events = []
+    first.get_event_bus().subscribe(ModuleUpdated, events.append)
+
+    second.update_performance(NAME, 1.7, datetime(2025, 3, 1))
+    assert first.refresh_from_disk() == 1
+    assert [event.module_name for event in events] == [NAME]
+    assert first.get_course_at(datetime.now()).find_module(NAME).get_attempts() == ((1.7, datetime(2025, 3, 1), True),)
+
+    # --- Eine Änderung von Hand steht ohne Protokoll in der Datei und wird als übernommen aufgezeichnet ---
+    edited = load_course()
+    edited.update_module_performance(NAME, 1.0, datetime(2025, 4, 1))
+    edited.save_modules_csv(str(data_dir / "modules.csv"))
+    assert first.refresh_from_disk() == 1
+    assert first.get_history().get_events()[-1].get_kind() == "Übernommen"
+    assert first.get_course_at(datetime.now()).find_module(NAME).get_performance().get_mark() == 1.0
+    assert first.refresh_from_disk() == 0
+
+
+def test_unreadable_file_is_not_overwritten(open_controller, load_course, data_dir):
+    first, second = open_controller(), open_controller()
+    first.update_performance("Cloud Computing", 2.0, datetime(2025, 1, 10))
+
+    # --- Ein anderer Prozess hinterlässt eine Datei, die nicht geladen werden kann ---
+    path = data_dir / "modules.csv"
+    lines = path.read_text(encoding="utf-8").splitlines()
+    lines = [f"{NAME},5,Abgeschlossen,6.0,10.02.2025,Ja," if line.startswith(f"{NAME},") else line for line in lines]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    content = path.read_bytes()
+
+    with pytest.raises(CsvLoadError):
+        second.update_performance("Projekt: NLP", 1.0, datetime(2025, 3, 10))
+    with pytest.raises(CsvLoadError):
+        second.apply_results([("Projekt: NLP", 1.0, datetime(2025, 3, 10))])
+
+    assert path.read_bytes() == content
+    assert all(event.get_module_name() != "Projekt: NLP" for event in second.get_history().get_events())
+    assert second.get_course().find_module("Projekt: NLP").get_performance() is None
+    assert second.refresh_from_disk() == 0
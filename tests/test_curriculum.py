@@ -0,0 +1,67 @@
+from datetime import datetime
+
+import pytest
+
+from curriculum import CurriculumTemplate, StudentOverlay, is_overlay_file, load_overlay
+
+CHANGED = ["Artificial Intelligence", "Cloud Computing"]
+
+
+@pytest.fixture
+def course(load_course):
+    course = load_course()
+    course.update_module_performance("Artificial Intelligence", 2.3, datetime(2025, 2, 10))
+    course.update_module_performance("Cloud Computing", 4.7, datetime(2025, 3, 1))
+    course.update_module_performance("Cloud Computing", 1.7, datetime(2025, 4, 1))
+    return course
+
+
+@pytest.fixture
+def template(load_course):
+    return CurriculumTemplate.from_course(load_course())
+
+
+def module_states(course):
+    """Zustand jedes Moduls, ermittelt durch Durchlaufen aller Semester."""
+    return {module.get_name(): module.get_state() for semester in course.get_semester() for module in semester.get_modules()}
+
+
+def test_overlay_lookups_match_template_and_course(template, course, load_course):
+    overlay = StudentOverlay.from_course(template, course)
+
+    assert sorted(overlay.get_changed_states()) == sorted(CHANGED)
+    expected = module_states(course)
+    defaults = module_states(load_course())
+    for entry in template.get_modules():
+        name = entry.get_name()
+        assert overlay.get_state(name) == expected[name]
+        if name not in CHANGED:
+            assert overlay.get_state(name) == entry.get_default_state() == defaults[name]
+
+
+def test_created_course_matches_original(template, course):
+    rebuilt = template.create_course(StudentOverlay.from_course(template, course))
+
+    assert module_states(rebuilt) == module_states(course)
+    assert [semester.get_designation() for semester in rebuilt.get_semester()] == [semester.get_designation() for semester in course.get_semester()]
+    assert rebuilt.calculate_reached_ects() == course.calculate_reached_ects()
+    assert rebuilt.calculate_gpa() == course.calculate_gpa()
+
+
+def test_overlay_round_trip_through_csv(template, course, tmp_path):
+    path = str(tmp_path / "overlay.csv")
+    StudentOverlay.from_course(template, course).save_csv(path)
+
+    assert is_overlay_file(path)
+    loaded = load_overlay(template, path)
+    assert loaded.get_changed_states() == StudentOverlay.from_course(template, course).get_changed_states()
+
+
+def test_default_state_removes_change(template, course):
+    overlay = StudentOverlay.from_course(template, course)
+
+    overlay.set_state("Cloud Computing", template.get_module("Cloud Computing").get_default_state())
+
+    assert list(overlay.get_changed_states()) == ["Artificial Intelligence"]
+    with pytest.raises(KeyError):
+        overlay.get_state("Unbekanntes Modul")
@@ -0,0 +1,68 @@
+import csv
+import gzip
+import io
+import json
+import shutil
+from datetime import datetime
+
+import pytest
+
+from curriculum import CurriculumTemplate, StudentOverlay
+from export import EXPORT_FORMATS, ROW_GENERATORS, iter_directory_rows, iter_module_rows, write_rows
+
+
+@pytest.fixture
+def course(load_course):
+    course = load_course()
+    course.update_module_performance("Artificial Intelligence", 2.3, datetime(2025, 2, 10))
+    course.update_module_performance("Cloud Computing", 4.7, datetime(2025, 3, 1))
+    course.update_module_performance("Cloud Computing", 1.7, datetime(2025, 4, 1))
+    return course
+
+
+def render_in_memory(rows, export_format):
+    """Baut die erwartete Ausgabe vollständig im Speicher auf."""
+    rows = list(rows)
+    if export_format == "jsonl":
+        return "".join(json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in rows).encode("utf-8")
+
+    buffer = io.StringIO(newline="")
+    delimiter = ";" if export_format == "excel-csv" else ","
+    writer = csv.writer(buffer, delimiter=delimiter)
+    writer.writerow(list(rows[0]))
+    for row in rows:
+        values = list(row.values())
+        if export_format == "excel-csv":
+            values = [str(value).replace(".", ",") if isinstance(value, float) else value for value in values]
+        writer.writerow(values)
+    return buffer.getvalue().encode("utf-8-sig" if export_format == "excel-csv" else "utf-8")
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("export_format", sorted(EXPORT_FORMATS))
+@pytest.mark.parametrize("kind", sorted(ROW_GENERATORS))
+def test_streamed_export_matches_in_memory_bytes(course, tmp_path, kind, export_format, compress):
+    path = tmp_path / "export.out"
+
+    count = write_rows(ROW_GENERATORS[kind](course, "student1"), str(path), export_format, compress)
+
+    expected = render_in_memory(ROW_GENERATORS[kind](course, "student1"), export_format)
+    data = path.read_bytes()
+    if compress:
+        data = gzip.decompress(data)
+    assert data == expected
+    assert count == len(list(ROW_GENERATORS[kind](course, "student1")))
+
+
+def test_directory_rows_match_courses_loaded_up_front(course, load_course, data_dir, tmp_path):
+    directory = tmp_path / "students"
+    directory.mkdir()
+    course.save_modules_csv(str(directory / "anna.csv"))
+    shutil.copy(data_dir / "modules.csv", directory / "ben.csv")
+    template = CurriculumTemplate.from_course(load_course())
+    StudentOverlay.from_course(template, course).save_csv(str(directory / "carla.csv"))
+
+    rows = list(iter_directory_rows(str(directory), "modules", str(data_dir / "course_of_study.csv"), str(data_dir / "semester.csv")))
+
+    expected = list(iter_module_rows(course, "anna")) + list(iter_module_rows(load_course(), "ben")) + list(iter_module_rows(course, "carla"))
+    assert rows == expected
@@ -0,0 +1,112 @@
+import math
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from cohort_stats import CohortArrays
+from forecast import DAYS_PER_MONTH, MAX_FORECAST_MONTHS, forecast_completion
+
+NOW = datetime(2025, 6, 15, 12, 0)
+TOTAL_ECTS = 180
+
+
+@pytest.fixture
+def cohort_and_starts(load_course):
+    """Zufällige Kohorte mit dem Curriculum der Beispieldaten und unterschiedlichem Studienstart."""
+    modules = [module for semester in load_course().get_semester() for module in semester.get_modules()]
+    generator = random.Random(11)
+    starts = [datetime(2022 + generator.randint(0, 3), generator.randint(1, 12), 1) for _ in range(60)]
+    # --- Sonderfälle: Start im laufenden Monat, nichts bestanden, alles bestanden ---
+    starts = [min(start, datetime(2025, 6, 1)) for start in starts]
+    starts += [datetime(2025, 6, 1), datetime(2024, 1, 1), datetime(2023, 1, 1)]
+    shares = [0.4] * (len(starts) - 2) + [0.0, 1.0]
+
+    cohort = CohortArrays.allocate([module.get_name() for module in modules], [module.get_ects() for module in modules], len(starts))
+    for row, start in enumerate(starts):
+        elapsed = NOW.year * 12 + NOW.month - (start.year * 12 + start.month) + 1
+        for column in range(len(modules)):
+            if generator.random() < shares[row]:
+                cohort.marks[row, column] = 2.0
+                cohort.passed[row, column] = 1
+                cohort.months[row, column] = generator.randint(0, elapsed - 1)
+    return cohort, starts
+
+
+def reference_forecast(cohort, row, start, z=1.96):
+    """Prognose einer Person mit einer einfachen Schleife über ihre Kalendermonate."""
+    elapsed = max(NOW.year * 12 + NOW.month - (start.year * 12 + start.month) + 1, 1)
+    monthly = [0.0] * elapsed
+    for column in range(len(cohort.module_names)):
+        if cohort.passed[row, column] and cohort.months[row, column] >= 0:
+            monthly[int(cohort.months[row, column])] += int(cohort.ects[column])
+
+    reached = sum(monthly)
+    velocity = reached / elapsed
+    if elapsed > 1:
+        variance = sum((value - velocity) ** 2 for value in monthly) / (elapsed - 1)
+    else:
+        variance = velocity ** 2
+    standard_error = math.sqrt(variance / elapsed)
+    missing = max(TOTAL_ECTS - reached, 0)
+
+    def completion(speed):
+        if missing == 0:
+            months = 0.0
+        elif speed > 0:
+            months = missing / speed
+        else:
+            return None
+        if months > MAX_FORECAST_MONTHS:
+            return None
+        return datetime.combine(NOW.date(), datetime.min.time()) + timedelta(days=round(months * DAYS_PER_MONTH))
+
+    return velocity, completion(velocity), completion(velocity + z * standard_error), completion(velocity - z * standard_error)
+
+
+def assert_close_dates(actual, expected):
+    """Grenzen dürfen wegen anders summierter Varianz um einen Tag abweichen."""
+    if expected is None or actual is None:
+        assert actual == expected
+    else:
+        assert abs(actual - expected) <= timedelta(days=1)
+
+
+def test_vectorized_forecast_matches_loop(cohort_and_starts):
+    cohort, starts = cohort_and_starts
+
+    result = forecast_completion(cohort, starts, TOTAL_ECTS, now=NOW)
+
+    for row, start in enumerate(starts):
+        velocity, expected, earliest, latest = reference_forecast(cohort, row, start)
+        forecast = result.get(row)
+        assert forecast.get_velocity() == round(velocity, 2)
+        assert forecast.get_expected() == expected
+        assert_close_dates(forecast.get_earliest(), earliest)
+        assert_close_dates(forecast.get_latest(), latest)
+
+
+def test_special_cases(cohort_and_starts):
+    cohort, starts = cohort_and_starts
+
+    result = forecast_completion(cohort, starts, TOTAL_ECTS, now=NOW)
+
+    nothing_passed = result.get(len(starts) - 2)
+    assert nothing_passed.get_velocity() == 0.0
+    assert nothing_passed.get_expected() is None
+    assert nothing_passed.get_latest() is None
+
+    all_passed = result.get(len(starts) - 1)
+    today = datetime.combine(NOW.date(), datetime.min.time())
+    assert all_passed.get_expected() == all_passed.get_earliest() == all_passed.get_latest() == today
+
+
+def test_forecast_per_person_total_ects(cohort_and_starts):
+    cohort, starts = cohort_and_starts
+    totals = [TOTAL_ECTS] * len(starts)
+    totals[0] = 0
+
+    result = forecast_completion(cohort, starts, totals, now=NOW)
+
+    assert result.get(0).get_expected() == datetime.combine(NOW.date(), datetime.min.time())
+    assert result.get(1).get_expected() == forecast_completion(cohort, starts, TOTAL_ECTS, now=NOW).get(1).get_expected()
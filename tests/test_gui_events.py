@@ -0,0 +1,78 @@
+import threading
+
+import pytest
+
+from events import MetricsChanged
+from gui import CourseDashboard
+
+
+class FakeRoot:
+    """Ersetzt das Tk-Hauptfenster und sammelt die per after() eingereihten Aufrufe."""
+
+    def __init__(self):
+        self.queued = []
+
+    def after(self, delay, function, *args):
+        self.queued.append((delay, function, args))
+
+    def run_queued(self):
+        queued, self.queued = self.queued, []
+        for _, function, args in queued:
+            function(*args)
+
+
+class FakeGui:
+    def __init__(self, root):
+        self._root = root
+
+    def get_root(self):
+        return self._root
+
+
+@pytest.fixture
+def dashboard():
+    # --- Ohne Widgets aufbauen, nur on_ui_thread wird geprüft ---
+    dashboard = CourseDashboard.__new__(CourseDashboard)
+    dashboard._gui = FakeGui(FakeRoot())
+    dashboard._released = False
+    return dashboard
+
+
+def call_in_thread(function, *args):
+    thread = threading.Thread(target=function, args=args)
+    thread.start()
+    thread.join()
+
+
+def test_background_event_is_queued_with_after(dashboard):
+    handled = []
+    event = MetricsChanged(1)
+
+    call_in_thread(dashboard.on_ui_thread, lambda event: handled.append(threading.current_thread()), event)
+
+    assert handled == []
+    root = dashboard.get_root()
+    assert [(delay, function) for delay, function, _ in root.queued] == [(0, dashboard.on_ui_thread)]
+
+    root.run_queued()
+    assert handled == [threading.main_thread()]
+    assert root.queued == []
+
+
+def test_main_thread_event_is_handled_directly(dashboard):
+    handled = []
+
+    dashboard.on_ui_thread(handled.append, "event")
+
+    assert handled == ["event"]
+    assert dashboard.get_root().queued == []
+
+
+def test_event_after_release_is_dropped(dashboard):
+    handled = []
+    call_in_thread(dashboard.on_ui_thread, handled.append, "event")
+
+    dashboard._released = True
+    dashboard.get_root().run_queued()
+
+    assert handled == []
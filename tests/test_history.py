@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from history import GradeHistory
+
+START = datetime(2025, 1, 1)
+OPEN = ("Offen", None, None, None, ())
+
+
+def passed(mark, day):
+    """Zustand eines bestandenen Moduls mit einem Versuch am angegebenen Tag im Januar 2025."""
+    date = datetime(2025, 1, day)
+    return ("Abgeschlossen", mark, date, True, ((mark, date, True),))
+
+
+def test_get_states_at_replays_events_up_to_point_in_time():
+    history = GradeHistory({"A": OPEN, "B": OPEN}, start=START)
+    history.record("A", OPEN, passed(2.0, 2), timestamp=START + timedelta(days=1))
+    history.record("B", OPEN, passed(1.3, 3), timestamp=START + timedelta(days=2))
+
+    assert history.get_states_at(START) == {"A": OPEN, "B": OPEN}
+    assert history.get_states_at(START + timedelta(days=1)) == {"A": passed(2.0, 2), "B": OPEN}
+    assert history.get_states_at(START + timedelta(days=5)) == {"A": passed(2.0, 2), "B": passed(1.3, 3)}
+    with pytest.raises(ValueError):
+        history.get_states_at(START - timedelta(days=1))
+
+
+def test_snapshots_give_same_states_as_full_replay():
+    history = GradeHistory({"A": OPEN}, snapshot_interval=3, start=START)
+    for day in range(1, 11):
+        history.record("A", history.get_current_states()["A"], passed(1.0 + day / 10, day), timestamp=START + timedelta(days=day))
+
+    for event_count in range(11):
+        expected = {"A": OPEN if event_count == 0 else passed(1.0 + event_count / 10, event_count)}
+        assert history.get_states_after(event_count) == expected
+    assert history.get_states_at(START + timedelta(days=7, hours=12)) == {"A": passed(1.7, 7)}
+
+
+def test_undo_and_redo_append_compensating_events():
+    history = GradeHistory({"A": OPEN}, start=START)
+    history.record("A", OPEN, passed(2.0, 2), timestamp=START + timedelta(days=1))
+
+    undo = history.undo(timestamp=START + timedelta(days=2))
+    assert (undo.get_kind(), undo.get_new_state()) == ("Rückgängig", OPEN)
+    assert history.can_redo() and not history.can_undo()
+
+    redo = history.redo(timestamp=START + timedelta(days=3))
+    assert (redo.get_kind(), redo.get_new_state()) == ("Wiederholen", passed(2.0, 2))
+    assert [event.get_kind() for event in history.get_events()] == ["Eintrag", "Rückgängig", "Wiederholen"]
+    assert history.get_states_at(START + timedelta(days=2)) == {"A": OPEN}
+
+
+def test_history_is_reloaded_from_file(tmp_path):
+    path = str(tmp_path / "modules.csv.history")
+    history = GradeHistory({"A": OPEN}, snapshot_interval=2, start=START, path=path)
+    for day in range(1, 6):
+        history.record("A", history.get_current_states()["A"], passed(1.0 + day / 10, day), timestamp=START + timedelta(days=day))
+
+    reloaded = GradeHistory({"A": passed(4.0, 28)}, snapshot_interval=2, path=path)
+
+    assert reloaded.get_start() == START
+    assert len(reloaded.get_events()) == 5
+    assert not reloaded.can_undo()
+    for event_count in range(6):
+        assert reloaded.get_states_after(event_count) == history.get_states_after(event_count)
+
+
+def test_sync_adopts_events_of_other_writer_without_undo(tmp_path):
+    path = str(tmp_path / "modules.csv.history")
+    first = GradeHistory({"A": OPEN}, start=START, path=path)
+    second = GradeHistory({"A": OPEN}, path=path)
+
+    second.record("A", OPEN, passed(2.0, 2), timestamp=START + timedelta(days=1))
+    events = first.sync()
+
+    assert [event.get_new_state() for event in events] == [passed(2.0, 2)]
+    assert first.get_current_states() == {"A": passed(2.0, 2)}
+    assert not first.can_undo()
+
+
+def test_corrupt_and_truncated_lines_are_skipped(tmp_path):
+    path = tmp_path / "modules.csv.history"
+    history = GradeHistory({"A": OPEN}, start=START, path=str(path))
+    history.record("A", OPEN, passed(2.0, 2), timestamp=START + timedelta(days=1))
+    with open(path, "ab") as file:
+        file.write(b'{"event": [kaputt\n{"event": ["2025-01-03T00:00:00", "A"]}\n{"event": ["2025-01-04T00:0')
+
+    reloaded = GradeHistory({"A": OPEN}, path=str(path))
+
+    assert reloaded.get_current_states() == {"A": passed(2.0, 2)}
+    assert [issue.get_row() for issue in reloaded.get_issues()] == [3, 4]
+
+    # --- Der nächste Eintrag schließt die abgebrochene Zeile ab und bleibt selbst lesbar ---
+    reloaded.record("A", passed(2.0, 2), passed(1.7, 5), timestamp=START + timedelta(days=4))
+    assert [issue.get_row() for issue in reloaded.get_issues()] == [3, 4, 5]
+    again = GradeHistory({"A": OPEN}, path=str(path))
+    assert again.get_current_states() == {"A": passed(1.7, 5)}
+    assert len(again.get_events()) == 2
+    assert [issue.get_row() for issue in again.get_issues()] == [3, 4, 5]
@@ -0,0 +1,87 @@
+import gc
+
+import pytest
+
+from loader import MODULE_SCHEMA, CsvLoadError, check_mark, iter_typed_rows, parse_attempts, parse_mark
+
+
+def write_modules(path, lines):
+    """Schreibt eine Moduldatei mit den angegebenen Zeilen (ohne Kopfzeile)."""
+    path.write_text("\n".join(["Name,ECTS,Status,Note,Datum,Bestanden"] + lines) + "\n", encoding="utf-8")
+
+
+def test_load_course_of_study_reads_repository_files(load_course):
+    course = load_course()
+
+    assert len(course.get_module_states()) == sum(len(semester.get_modules()) for semester in course.get_semester())
+    assert course.find_module("Artificial Intelligence").get_ects() == 5
+
+
+def test_iter_typed_rows_collects_every_issue_and_skips_invalid_rows(tmp_path):
+    path = tmp_path / "modules.csv"
+    write_modules(path, [
+        "Gut,5,Offen,,,",
+        "Schlechte ECTS,fünf,Offen,,,",
+        "Schlechte Note,5,Abgeschlossen,6.0,01.02.2025,Ja",
+        ",5,Offen,,,Vielleicht",
+    ])
+
+    issues = []
+    rows = list(iter_typed_rows(str(path), MODULE_SCHEMA, issues))
+
+    assert [values["Name"] for _, _, values in rows] == ["Gut"]
+    assert rows[0][2]["Versuche"] == ()
+    assert [(issue.get_row(), issue.get_column()) for issue in issues] == [
+        (3, "ECTS"), (4, "Note"), (5, "Name"), (5, "Bestanden")
+    ]
+
+
+def test_iter_typed_rows_reports_missing_columns(tmp_path):
+    path = tmp_path / "modules.csv"
+    path.write_text("Name,ECTS\nA,5\n", encoding="utf-8")
+
+    issues = []
+    assert list(iter_typed_rows(str(path), MODULE_SCHEMA, issues)) == []
+    assert {issue.get_column() for issue in issues} == {"Status", "Note", "Datum", "Bestanden"}
+
+
+def test_load_course_of_study_raises_with_all_issues(data_dir, load_course):
+    path = data_dir / "modules.csv"
+    lines = path.read_text(encoding="utf-8").splitlines()
+    lines[1] = lines[1].replace(",5,", ",x,", 1)
+    lines[2] = lines[2].replace(",5,", ",y,", 1)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    with pytest.raises(CsvLoadError) as error:
+        load_course()
+
+    issues = error.value.get_issues()
+    assert [(issue.get_row(), issue.get_column()) for issue in issues] == [(2, "ECTS"), (3, "ECTS")]
+    assert error.value.report().count("\n- ") == 2
+
+
+def test_parsers_accept_comma_and_attempt_lists():
+    assert parse_mark("2,3") == 2.3
+    attempts = parse_attempts("5,0/01.02.2025/Nein;2,0/01.03.2025/Ja")
+    assert [(mark, date.month, passed) for mark, date, passed in attempts] == [(5.0, 2, False), (2.0, 3, True)]
+    with pytest.raises(ValueError):
+        parse_attempts("2.0/01.03.2025")
+
+
+@pytest.mark.parametrize("mark", [0.7, 5.3, 6.0])
+def test_marks_outside_range_are_rejected(mark):
+    with pytest.raises(ValueError):
+        check_mark(mark)
+    with pytest.raises(ValueError):
+        parse_mark(str(mark))
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_load_course_of_study_leaves_garbage_collector_alone(load_course, enabled):
+    was_enabled = gc.isenabled()
+    (gc.enable if enabled else gc.disable)()
+    try:
+        load_course()
+        assert gc.isenabled() == enabled
+    finally:
+        (gc.enable if was_enabled else gc.disable)()
@@ -0,0 +1,121 @@
+from datetime import datetime
+import shutil
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+import metrics_exporter
+from controller import Controller
+from metrics_exporter import CONTENT_TYPE, STUDENT_GAUGES, MetricsExporter, _escape, _format
+from tracing import PhaseTracer
+
+TITLE = 'Max "M" \\ Neu\nZeile'
+
+
+@pytest.fixture
+def controller(load_course, data_dir):
+    # --- Pfad mit Anführungszeichen und Backslash, der im Label maskiert werden muss ---
+    directory = data_dir / 'a"b\\c'
+    directory.mkdir()
+    shutil.copy(data_dir / "modules.csv", directory / "modules.csv")
+    return Controller(load_course(), str(directory / "modules.csv"))
+
+
+@pytest.fixture
+def tracer():
+    phase_tracer = PhaseTracer()
+    for seconds in (0.001, 0.002, 0.003, 0.004):
+        phase_tracer.record("controller.save_csv", seconds)
+    return phase_tracer
+
+
+@pytest.fixture
+def exporter(controller, tracer):
+    metrics = MetricsExporter([(TITLE, controller)], tracer=tracer)
+    yield metrics
+    metrics.stop()
+
+
+def test_escape_and_format():
+    assert _escape('a"b\\c\nd') == 'a\\"b\\\\c\\nd'
+    assert _format(float("inf")) == "+Inf"
+    assert _format(5) == "5.0"
+
+
+def test_render_has_help_type_and_escaped_labels(exporter, controller):
+    text = exporter.render()
+    lines = text.splitlines()
+
+    labels = f'student="{_escape(TITLE)}",file="{_escape(controller.get_modules_csv_path())}"'
+    assert '\\"M\\" \\\\ Neu\\nZeile' in labels
+    for name, _, _ in STUDENT_GAUGES:
+        assert f"# TYPE {name} gauge" in lines
+        assert any(line.startswith(f"# HELP {name} ") for line in lines)
+        assert any(line.startswith(f"{name}{{{labels}}} ") for line in lines)
+    assert "dashboard_students 1" in lines
+    assert "# TYPE dashboard_phase_seconds summary" in lines
+    assert 'dashboard_phase_seconds{phase="controller.save_csv",quantile="0.5"} 0.002000' in lines
+    assert 'dashboard_phase_seconds_count{phase="controller.save_csv"} 4' in lines
+    assert text.endswith("\n")
+
+
+def test_metrics_changed_refreshes_snapshot(exporter):
+    before = exporter.render()
+
+    exporter._students[0][1].update_performance("Artificial Intelligence", 2.0, datetime(2025, 2, 10))
+
+    after = exporter.render()
+    assert before != after
+    assert any(line.startswith("dashboard_reached_ects{") and line.endswith(" 5.0") for line in after.splitlines())
+
+
+def test_refresh_stale_after_month_change(exporter, monkeypatch):
+    assert exporter.refresh_stale() is False
+    timestamp = next(iter(exporter._snapshots.values()))["timestamp"]
+
+    # --- "Jetzt" liegt 40 Tage später, die Momentaufnahme stammt also aus einem früheren Monat ---
+    real_localtime = time.localtime
+    monkeypatch.setattr(metrics_exporter.time, "localtime", lambda seconds=None: real_localtime(time.time() + 40 * 86400 if seconds is None else seconds))
+    time.sleep(0.01)
+
+    assert exporter.refresh_stale() is True
+    assert next(iter(exporter._snapshots.values()))["timestamp"] > timestamp
+
+
+def test_http_server_serves_metrics_and_404(exporter):
+    port = exporter.start_http_server(port=0)
+
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+        assert response.status == 200
+        assert response.headers["Content-Type"] == CONTENT_TYPE
+        assert "dashboard_students 1" in response.read().decode("utf-8")
+
+    with pytest.raises(urllib.error.HTTPError) as error:
+        urllib.request.urlopen(f"http://127.0.0.1:{port}/andere", timeout=5)
+    assert error.value.code == 404
+
+
+def test_textfile_is_written_by_writer_thread(controller, tracer, tmp_path):
+    path = tmp_path / "dashboard.prom"
+    exporter = MetricsExporter([(TITLE, controller)], tracer=tracer, textfile_path=str(path))
+    try:
+        controller.update_performance("Artificial Intelligence", 2.0, datetime(2025, 2, 10))
+        deadline = time.monotonic() + 5
+        while "} 5.0" not in path.read_text(encoding="utf-8"):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        exporter.stop()
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_stop_restores_tracer_state(controller, enabled):
+    tracer = PhaseTracer(enabled=enabled)
+
+    exporter = MetricsExporter([(TITLE, controller)], tracer=tracer)
+    assert tracer.enabled
+    exporter.stop()
+
+    assert tracer.enabled == enabled
@@ -0,0 +1,68 @@
+from datetime import datetime
+
+import pytest
+
+
+def test_find_module_and_semester_index(load_course):
+    course = load_course()
+    index = course.get_module_index()
+
+    first = course.get_semester()[0].get_modules()[0]
+    assert index.get(first.get_name()) is first
+    assert index.get_semester_index(first.get_name()) == 0
+    assert index.get("Unbekannt") is None
+
+
+def test_query_filters_match_linear_scan(load_course):
+    course = load_course()
+    modules = [module for semester in course.get_semester() for module in semester.get_modules()]
+
+    result = course.get_module_index().query(status="Offen", semester=1, ects=5)
+
+    expected = [module for module in course.get_semester()[1].get_modules() if module.get_status() == "Offen" and module.get_ects() == 5]
+    assert result == expected
+    assert course.get_module_index().query() == modules
+    with pytest.raises(ValueError):
+        course.get_module_index().query(sort_by="unbekannt")
+
+
+def test_update_moves_module_between_status_and_date_indexes(load_course):
+    course = load_course()
+    index = course.get_module_index()
+    open_before = index.get_names_by_status("Offen")
+
+    course.update_module_performance("Artificial Intelligence", 1.7, datetime(2025, 3, 14))
+
+    assert "Artificial Intelligence" not in index.get_names_by_status("Offen")
+    assert len(index.get_names_by_status("Offen")) == len(open_before) - 1
+    assert [module.get_name() for module in index.query(date_from=datetime(2025, 3, 14), date_to=datetime(2025, 3, 14))] == ["Artificial Intelligence"]
+
+    # --- Korrektur am selben Tag auf nicht bestanden öffnet das Modul wieder ---
+    course.update_module_performance("Artificial Intelligence", 5.0, datetime(2025, 3, 14))
+    assert index.get_names_by_status("Offen") == open_before
+
+
+def test_restore_module_state_keeps_indexes_in_sync(load_course):
+    course = load_course()
+    state = course.find_module("Artificial Intelligence").get_state()
+    course.update_module_performance("Artificial Intelligence", 2.0, datetime(2025, 4, 1))
+
+    course.restore_module_state("Artificial Intelligence", state)
+
+    index = course.get_module_index()
+    assert "Artificial Intelligence" in index.get_names_by_status(state[0])
+    assert index.query(date_from=datetime(2025, 4, 1)) == [
+        module for module in index.query(sort_by="date") if module.get_performance() is not None and module.get_performance().get_date() >= datetime(2025, 4, 1)
+    ]
+
+
+def test_query_sorts_by_mark_with_missing_values_last(load_course):
+    course = load_course()
+    course.update_module_performance("Artificial Intelligence", 2.3, datetime(2025, 5, 1))
+    course.update_module_performance("Mathematik: Analysis", 1.3, datetime(2025, 5, 2))
+
+    result = course.get_module_index().query(sort_by="mark")
+    marks = [module.get_performance().get_mark() for module in result if module.get_performance() is not None]
+
+    assert marks == sorted(marks)
+    assert all(module.get_performance() is None for module in result[len(marks):])
@@ -0,0 +1,128 @@
+import csv
+import os
+from datetime import datetime
+
+import pytest
+
+from export import iter_module_rows, write_rows
+from loader import CsvLoadError
+from module import format_attempts
+from module_store import INDEX_SUFFIX, ModuleStore
+
+STUDENTS = ["student0000001", "student0000002", "student0000003"]
+
+
+@pytest.fixture
+def store_path(tmp_path, load_course):
+    """Moduldatei mit drei Personen wie aus `export.py --kind modules`."""
+    course = load_course()
+    path = str(tmp_path / "all_modules.csv")
+    write_rows((row for student in STUDENTS for row in iter_module_rows(course, student)), path)
+    return path
+
+
+def read_rows(path):
+    """Liest die ganze Datei mit csv.DictReader, ohne Füllzeichen."""
+    with open(path, newline="", encoding="utf-8") as file:
+        return [{name: value.strip() for name, value in row.items()} for row in csv.DictReader(file)]
+
+
+def test_lookup_matches_full_scan(store_path):
+    with ModuleStore(store_path) as store:
+        assert store.get_students() == STUDENTS
+        for row in read_rows(store_path):
+            assert store.get_row(row["Student"], row["Name"]) == row
+        assert store.get_row("unbekannt", "Artificial Intelligence") is None
+        assert store.get_module(STUDENTS[1], "Artificial Intelligence").get_name() == "Artificial Intelligence"
+
+
+def test_update_in_place_keeps_other_rows(store_path):
+    with ModuleStore(store_path) as store:
+        module = store.get_module(STUDENTS[0], "Artificial Intelligence")
+        module.add_attempt(1.3, datetime(2025, 2, 10), True)
+        # --- Erste Änderung schreibt neu (Freiraum anlegen), die zweite passt an Ort und Stelle ---
+        assert store.update_module(STUDENTS[0], module) is False
+        before = read_rows(store_path)
+
+        module.set_new_status("Abgeschlossen")
+        assert store.update_module(STUDENTS[0], module) is True
+        assert store.get_module(STUDENTS[0], "Artificial Intelligence").get_status() == "Abgeschlossen"
+
+    after = read_rows(store_path)
+    changed = [index for index, (old, new) in enumerate(zip(before, after)) if old != new]
+    assert len(after) == len(before)
+    assert [after[index]["Student"] for index in changed] == [STUDENTS[0]]
+
+
+def test_rewrite_reserves_space_and_updates_index(store_path):
+    size = os.path.getsize(store_path)
+    with ModuleStore(store_path) as store:
+        module = store.get_module(STUDENTS[2], "Mathematik: Analysis")
+        module.add_attempt(5.0, datetime(2025, 1, 10), False)
+        module.add_attempt(2.7, datetime(2025, 3, 10), True)
+
+        assert store.update_module(STUDENTS[2], module) is False
+        assert os.path.getsize(store_path) > size
+        assert store.get_module(STUDENTS[2], "Mathematik: Analysis").get_attempts() == module.get_attempts()
+        for row in read_rows(store_path):
+            assert store.get_row(row["Student"], row["Name"]) == row
+
+    with pytest.raises(KeyError):
+        with ModuleStore(store_path) as store:
+            store.update_module("unbekannt", module)
+
+
+def test_reopen_uses_saved_index_and_detects_stale_index(store_path):
+    with ModuleStore(store_path) as store:
+        module = store.get_module(STUDENTS[1], "Artificial Intelligence")
+        module.add_attempt(2.0, datetime(2025, 2, 10), True)
+        store.update_module(STUDENTS[1], module)
+        row_count = store.get_row_count()
+    assert os.path.exists(store_path + INDEX_SUFFIX)
+
+    with ModuleStore(store_path) as store:
+        assert store.get_row_count() == row_count
+        assert store.get_module(STUDENTS[1], "Artificial Intelligence").get_attempts() == module.get_attempts()
+
+    # --- Eine von außen angehängte Zeile macht den gespeicherten Index ungültig ---
+    with open(store_path, "a", newline="", encoding="utf-8") as file:
+        file.write("student0000004,Artificial Intelligence,5,Offen,,,,\r\n")
+    with ModuleStore(store_path) as store:
+        assert store.get_row_count() == row_count + 1
+        assert store.get_module_names("student0000004") == ["Artificial Intelligence"]
+
+
+def test_optional_column_is_added_instead_of_dropped(store_path):
+    # --- Ältere Exporte haben keine Spalte "Versuche" ---
+    rows = read_rows(store_path)
+    for row in rows:
+        del row["Versuche"]
+    write_rows(rows, store_path)
+
+    with ModuleStore(store_path) as store:
+        module = store.get_module(STUDENTS[0], "Mathematik: Analysis")
+        module.add_attempt(5.0, datetime(2025, 1, 10), False)
+        module.add_attempt(2.7, datetime(2025, 3, 10), True)
+        module.set_new_status("Abgeschlossen")
+
+        assert store.update_module(STUDENTS[0], module) is False
+        assert store.get_header()[-1] == "Versuche"
+
+    with ModuleStore(store_path) as store:
+        assert store.get_module(STUDENTS[0], "Mathematik: Analysis").get_attempts() == module.get_attempts()
+    after = read_rows(store_path)
+    assert [{name: value for name, value in row.items() if name != "Versuche"} for row in after] == [
+        {**row, "Status": "Abgeschlossen", "Note": "2.7", "Datum": "10.03.2025", "Bestanden": "Ja"}
+        if (row["Student"], row["Name"]) == (STUDENTS[0], "Mathematik: Analysis") else row
+        for row in rows
+    ]
+    assert [row["Versuche"] for row in after if row["Versuche"]] == [format_attempts(module.get_attempts())]
+
+
+def test_missing_columns_raise_load_error(tmp_path):
+    path = tmp_path / "modules.csv"
+    path.write_text("Name,ECTS\nA,5\n", encoding="utf-8")
+
+    with pytest.raises(CsvLoadError) as error:
+        ModuleStore(str(path))
+    assert [issue.get_column() for issue in error.value.get_issues()] == ["Student"]
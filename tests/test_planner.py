@@ -0,0 +1,86 @@
+from datetime import datetime
+from itertools import combinations
+
+import pytest
+
+from controller import Controller
+from planner import find_minimum_capacity, iter_months, plan_modules
+
+MONTHS = list(iter_months(datetime(2025, 11, 15), datetime(2026, 2, 1)))
+
+
+def test_iter_months_includes_current_and_last_month():
+    assert MONTHS == [datetime(2025, 11, 1), datetime(2025, 12, 1), datetime(2026, 1, 1), datetime(2026, 2, 1)]
+
+
+def test_plan_fills_each_month_up_to_capacity():
+    modules = [("A", 5), ("B", 10), ("C", 5), ("D", 5)]
+
+    plan = plan_modules(modules, MONTHS, 10, 25)
+
+    assert plan.get_months()[0] == (MONTHS[0], [("B", 10)])
+    assert plan.get_months()[1] == (MONTHS[1], [("A", 5), ("C", 5)])
+    assert plan.get_completion_month() == MONTHS[2]
+    assert plan.meets_target()
+    assert plan.get_unplanned() == []
+
+
+def test_plan_respects_prerequisites_and_prefers_long_chains():
+    modules = [("A", 5), ("B", 5), ("C", 5)]
+    prerequisites = {"C": ["B"]}
+
+    plan = plan_modules(modules, MONTHS, 5, 15, prerequisites)
+
+    assert [names for _, names in plan.get_months()] == [[("B", 5)], [("A", 5)], [("C", 5)], []]
+
+
+def test_plan_reports_unplannable_modules():
+    plan = plan_modules([("A", 5), ("B", 15)], MONTHS[:1], 10, 20)
+
+    assert plan.get_unplanned() == ["B"]
+    assert not plan.meets_target()
+    assert "Nicht einplanbar: B" in plan.report()
+    with pytest.raises(ValueError):
+        plan_modules([("A", 5)], MONTHS, 0, 5)
+
+
+def test_minimum_capacity_is_smallest_capacity_meeting_target():
+    modules = [("A", 5), ("B", 10), ("C", 5), ("D", 5), ("E", 10)]
+    prerequisites = {"E": ["B"]}
+
+    capacity = find_minimum_capacity(modules, MONTHS, 30, prerequisites)
+
+    assert plan_modules(modules, MONTHS, capacity, 30, prerequisites).meets_target()
+    assert not plan_modules(modules, MONTHS, capacity - 1, 30, prerequisites).meets_target()
+
+
+def test_minimum_capacity_matches_exhaustive_search():
+    modules = [("A", 5), ("B", 7), ("C", 3), ("D", 6), ("E", 4)]
+    months = MONTHS[:2]
+
+    # --- Jede Aufteilung auf zwei Monate: die kleinere Kapazität, die die größere Hälfte fasst ---
+    total = sum(ects for _, ects in modules)
+    best = min(
+        max(sum(ects for _, ects in first), total - sum(ects for _, ects in first))
+        for size in range(len(modules) + 1)
+        for first in combinations(modules, size)
+    )
+    assert find_minimum_capacity(modules, months, total) == best
+
+
+def test_minimum_capacity_is_none_when_target_unreachable():
+    assert find_minimum_capacity([("A", 5)], MONTHS, 10) is None
+    assert find_minimum_capacity([("A", 5), ("B", 5)], MONTHS[:1], 10, {"B": ["A"]}) is None
+    assert find_minimum_capacity([("A", 5)], [], 5) is None
+
+
+def test_controller_minimum_capacity_uses_open_modules(load_course, data_dir):
+    course = load_course()
+    controller = Controller(course, str(data_dir / "modules.csv"))
+    now = datetime(course.get_end().year - 1, course.get_end().month, 1)
+
+    capacity = controller.get_minimum_capacity(now=now)
+
+    assert capacity is not None
+    assert controller.plan_study(capacity, now=now).meets_target()
+    assert not controller.plan_study(capacity - 1, now=now).meets_target()
@@ -0,0 +1,97 @@
+from datetime import datetime
+import json
+import os
+
+import pytest
+
+from controller import Controller
+from portal_stub import PortalStubServer
+from portal_sync import PortalClient, SyncState, sync_all, sync_student
+
+STUDENT = "student0000001"
+
+
+@pytest.fixture
+def stub():
+    server = PortalStubServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(stub):
+    portal_client = PortalClient(stub.get_base_url(), pool_size=2, page_size=2)
+    yield portal_client
+    portal_client.close()
+
+
+@pytest.fixture
+def controller(load_course, data_dir):
+    return Controller(load_course(), str(data_dir / "modules.csv"))
+
+
+def add_results(stub, count, start_day=1):
+    for day in range(start_day, start_day + count):
+        stub.add_result(STUDENT, "Artificial Intelligence", 5.0 if day < 4 else 2.0, datetime(2025, 1, day))
+
+
+def test_unchanged_results_are_answered_with_304(stub, client):
+    add_results(stub, 1)
+    results, etag = client.fetch_results(STUDENT)
+    assert len(results) == 1 and etag
+
+    requests = stub.get_request_count()
+    assert client.fetch_results(STUDENT, results[-1]["updated"], etag) == ([], etag)
+    assert stub.get_request_count() == requests + 1
+
+    # --- Eine neue Leistung ändert das ETag ---
+    add_results(stub, 1, start_day=2)
+    results, new_etag = client.fetch_results(STUDENT, results[-1]["updated"], etag)
+    assert [result["date"] for result in results] == ["2025-01-02"]
+    assert new_etag != etag
+
+
+def test_since_returns_only_newer_results(stub, client):
+    add_results(stub, 2)
+    first, _ = client.fetch_results(STUDENT)
+    add_results(stub, 2, start_day=3)
+
+    newer, _ = client.fetch_results(STUDENT, since=first[-1]["updated"])
+
+    assert [result["date"] for result in newer] == ["2025-01-03", "2025-01-04"]
+
+
+def test_all_pages_are_fetched_in_order_over_pooled_connections(stub, client):
+    add_results(stub, 5)
+
+    results, _ = client.fetch_results(STUDENT)
+
+    assert [result["date"] for result in results] == [f"2025-01-0{day}" for day in range(1, 6)]
+    assert stub.get_request_count() == 3
+    assert client.get_pool().get_created_count() <= 2
+
+
+def test_resync_after_lost_state_skips_known_results(stub, client, controller):
+    add_results(stub, 4)
+
+    assert sync_student(client, controller, STUDENT, SyncState()) == (4, 4)
+    assert sync_student(client, controller, STUDENT, SyncState()) == (4, 0)
+    assert len(controller.get_course().find_module("Artificial Intelligence").get_attempts()) == 4
+
+
+def test_sync_state_is_saved_atomically_and_reloaded(stub, client, controller, tmp_path):
+    add_results(stub, 3)
+    path = str(tmp_path / "sync.json")
+
+    report = sync_all(client, {STUDENT: controller}, SyncState(path))
+
+    assert (report.get_fetched_count(), report.get_applied_count()) == (3, 3)
+    assert [name for name in os.listdir(tmp_path) if name.startswith("sync.json")] == ["sync.json"]
+    with open(path, encoding="utf-8") as file:
+        assert json.load(file)[STUDENT]["etag"]
+
+    requests = stub.get_request_count()
+    report = sync_all(client, {STUDENT: controller}, SyncState(path))
+    assert (report.get_fetched_count(), report.get_not_modified_count()) == (0, 1)
+    assert stub.get_request_count() == requests + 1
@@ -0,0 +1,53 @@
+from tab_cache import TabCache
+
+
+def build(cache, index):
+    """Baut einen Reiter auf wie Gui.show_tab und gibt die freigegebenen Indizes zurück."""
+    if cache.touch(index):
+        return []
+    cache.add(index, f"dashboard {index}")
+    return [evicted for evicted, _ in cache.pop_unused()]
+
+
+def test_least_recently_used_tab_is_evicted_first():
+    cache = TabCache(3)
+
+    assert build(cache, 0) == []
+    assert build(cache, 1) == []
+    assert build(cache, 2) == []
+    # --- Reiter 0 erneut genutzt, also ist Reiter 1 jetzt der älteste ---
+    assert build(cache, 0) == []
+    assert build(cache, 3) == [1]
+    assert build(cache, 4) == [2]
+
+    assert cache.get_indices() == [0, 3, 4]
+    assert cache.get_dashboards() == ["dashboard 0", "dashboard 3", "dashboard 4"]
+    assert len(cache) == 3
+
+
+def test_evicted_tab_is_rebuilt_on_next_use():
+    cache = TabCache(2)
+    for index in (0, 1, 2):
+        build(cache, index)
+
+    assert cache.get(0) is None
+    assert build(cache, 0) == [1]
+    assert cache.get(0) == "dashboard 0"
+
+
+def test_get_does_not_change_order():
+    cache = TabCache(2)
+    build(cache, 0)
+    build(cache, 1)
+
+    assert cache.get(0) == "dashboard 0"
+    assert build(cache, 2) == [0]
+
+
+def test_budget_is_at_least_one_tab():
+    cache = TabCache(0)
+
+    assert cache.get_max_built_tabs() == 1
+    assert build(cache, 0) == []
+    assert build(cache, 1) == [0]
+    assert cache.touch(0) is False
@@ -0,0 +1,100 @@
+import math
+
+import pytest
+
+from tracing import PhaseTracer
+
+
+def nearest_rank(samples, percent):
+    ordered = sorted(samples)
+    return ordered[max(1, math.ceil(len(ordered) * percent / 100)) - 1]
+
+
+@pytest.fixture
+def tracer():
+    return PhaseTracer(enabled=True)
+
+
+@pytest.mark.parametrize("percent", [0, 1, 50, 90, 95, 99, 100])
+def test_percentiles_use_nearest_rank(tracer, percent):
+    samples = [(i * 37 % 101) / 1000 for i in range(1, 101)]
+    for seconds in samples:
+        tracer.record("phase", seconds)
+
+    assert tracer.get_percentile("phase", percent) == nearest_rank(samples, percent)
+
+
+def test_percentiles_of_few_samples(tracer):
+    for seconds in (0.3, 0.1, 0.2):
+        tracer.record("phase", seconds)
+
+    assert tracer.get_percentile("phase", 50) == 0.2
+    assert tracer.get_percentile("phase", 99) == 0.3
+    assert tracer.get_percentile("phase", 0) == 0.1
+    assert tracer.get_percentile("unbekannt", 50) == 0.0
+
+
+def test_count_and_total_survive_sample_limit():
+    tracer = PhaseTracer(enabled=True, max_samples=3)
+    for seconds in (1.0, 2.0, 3.0, 4.0, 5.0):
+        tracer.record("phase", seconds)
+
+    assert tracer.get_samples("phase") == [3.0, 4.0, 5.0]
+    assert tracer.get_count("phase") == 5
+    assert tracer.get_total("phase") == 15.0
+    assert tracer.get_percentile("phase", 50) == 4.0
+
+
+def test_phase_and_traced_record_durations(tracer):
+    @tracer.traced("decorated")
+    def work(value):
+        return value * 2
+
+    with tracer.phase("block"):
+        pass
+    assert work(21) == 42
+    assert work(1) == 2
+
+    assert tracer.get_phase_names() == ["block", "decorated"]
+    assert tracer.get_count("block") == 1
+    assert tracer.get_count("decorated") == 2
+    assert all(seconds >= 0 for seconds in tracer.get_samples("decorated"))
+    assert work.__name__ == "work"
+
+
+def test_phase_records_when_block_raises(tracer):
+    with pytest.raises(KeyError):
+        with tracer.phase("failing"):
+            raise KeyError("x")
+
+    assert tracer.get_count("failing") == 1
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = PhaseTracer()
+
+    @tracer.traced("decorated")
+    def work():
+        return "ok"
+
+    with tracer.phase("block"):
+        pass
+    assert work() == "ok"
+
+    assert tracer.get_phase_names() == []
+    assert tracer.get_count("block") == 0
+    assert tracer.get_total("decorated") == 0.0
+
+
+def test_reset_and_report(tracer):
+    tracer.record("controller.save", 0.002)
+    tracer.record("controller.save", 0.004)
+
+    lines = tracer.report().splitlines()
+    assert lines[0].split() == ["Phase", "Anzahl", "p50", "p95", "p99", "max", "Summe"]
+    assert lines[1].split() == ["controller.save", "2", "2.00", "4.00", "4.00", "4.00", "6.0"]
+
+    tracer.reset()
+    assert tracer.get_phase_names() == []
+    assert tracer.get_count("controller.save") == 0
+    assert len(tracer.report().splitlines()) == 1
@@ -0,0 +1,152 @@
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+import os
+import threading
+import time
+
+
+class PhaseTracer:
+    """
+    Misst die Wanduhrzeit einzelner Phasen, z.B. Speichern, CSV-Schreiben oder Diagrammzeichnen.
+
+    Pro Phase werden die letzten `max_samples` Dauern aufbewahrt, daraus lassen sich
+    Perzentile berechnen. Anzahl und Summe aller Messungen werden zusätzlich
+    unbegrenzt mitgezählt. Ist der Tracer deaktiviert, kosten phase() und traced()
+    nur eine Abfrage von `enabled`.
+    """
+    def __init__(self, enabled:bool = False, max_samples:int = 10000):
+        """
+        Args:
+            enabled (bool, optional): True, um Messungen aufzuzeichnen.
+            max_samples (int, optional): Höchstzahl gespeicherter Messwerte pro Phase.
+        """
+        self.enabled = enabled
+        self._max_samples = max_samples
+        self._samples = {}
+        self._counts = {}
+        self._totals = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Kontextmanager, der die Dauer des umschlossenen Blocks unter `name` aufzeichnet.
+
+        Args:
+            name (str): Name der Phase, z.B. "controller.save".
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def traced(self, name):
+        """
+        Dekorator, der jeden Aufruf der Funktion als Phase `name` misst.
+
+        Args:
+            name (str): Name der Phase.
+        """
+        def decorator(function):
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with self.phase(name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name, seconds):
+        """
+        Zeichnet eine bereits gemessene Dauer auf.
+
+        Args:
+            name (str): Name der Phase.
+            seconds (float): Dauer in Sekunden.
+        """
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self._max_samples)
+            samples.append(seconds)
+            self._counts[name] = self._counts.get(name, 0) + 1
+            self._totals[name] = self._totals.get(name, 0.0) + seconds
+
+    def reset(self):
+        """Verwirft alle Messwerte."""
+        with self._lock:
+            self._samples = {}
+            self._counts = {}
+            self._totals = {}
+
+    def get_phase_names(self):
+        """Gibt die Namen aller gemessenen Phasen in Reihenfolge der ersten Messung zurück."""
+        with self._lock:
+            return list(self._samples)
+
+    def get_samples(self, name):
+        """
+        Gibt die gespeicherten Dauern einer Phase zurück.
+
+        Returns:
+            list: Dauern in Sekunden, leer, wenn die Phase nie gemessen wurde.
+        """
+        with self._lock:
+            return list(self._samples.get(name, ()))
+
+    def get_count(self, name):
+        """Gibt die Anzahl aller Messungen einer Phase seit dem letzten reset() zurück."""
+        with self._lock:
+            return self._counts.get(name, 0)
+
+    def get_total(self, name):
+        """Gibt die Summe aller Dauern einer Phase seit dem letzten reset() in Sekunden zurück."""
+        with self._lock:
+            return self._totals.get(name, 0.0)
+
+    def get_percentile(self, name, percent):
+        """
+        Gibt ein Perzentil der Dauer einer Phase zurück (Nearest-Rank).
+
+        Args:
+            name (str): Name der Phase.
+            percent (float): Perzentil zwischen 0 und 100.
+
+        Returns:
+            float: Dauer in Sekunden, 0.0 ohne Messwerte.
+        """
+        ordered = sorted(self.get_samples(name))
+        if not ordered:
+            return 0.0
+        rank = max(1, -(-len(ordered) * percent // 100))
+        return ordered[min(len(ordered), int(rank)) - 1]
+
+    def report(self):
+        """
+        Erstellt eine Tabelle mit Anzahl, p50, p95, p99, Maximum und Summe pro Phase in Millisekunden.
+
+        Returns:
+            str: Bericht mit einer Zeile pro Phase.
+        """
+        names = self.get_phase_names()
+        width = max([len(name) for name in names] + [5])
+        lines = [f"{'Phase':<{width}} {'Anzahl':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'Summe':>9}"]
+        for name in names:
+            samples = self.get_samples(name)
+            lines.append(
+                f"{name:<{width}} {len(samples):>7} "
+                f"{self.get_percentile(name, 50) * 1000:>8.2f} {self.get_percentile(name, 95) * 1000:>8.2f} "
+                f"{self.get_percentile(name, 99) * 1000:>8.2f} {max(samples) * 1000:>8.2f} {sum(samples) * 1000:>9.1f}"
+            )
+        return "\n".join(lines)
+
+
+# --- Gemeinsamer Tracer der Anwendung, mit DASHBOARD_TRACE=1 aktiviert ---
+TRACER = PhaseTracer(enabled=os.environ.get("DASHBOARD_TRACE") == "1")